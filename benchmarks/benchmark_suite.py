@@ -0,0 +1,189 @@
+# Steps/sec, reset, game stats and grab_frame latency and peak RSS for every task.
+# --check compares against thresholds written by --save_thresholds on this machine.
+#
+# Usage: python benchmarks/benchmark_suite.py [--tasks mario/run pokemon/brock] [--check]
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+TASKS = ["mario/run", "pokemon/catch", "pokemon/fight", "pokemon/brock"]
+ACT_FREQS = [6, 12, 24]
+
+HERE = Path(__file__).parent
+DEFAULT_RESULTS = HERE / "results.json"
+DEFAULT_THRESHOLDS = HERE / "thresholds.json"
+
+# metric: True if larger values are better
+METRICS = {
+    "steps_per_second": True,
+    "reset_ms": False,
+    "game_stats_ms": False,
+    "grab_frame_ms": False,
+    "peak_rss_mb": False,
+}
+
+
+def mean_ms(function, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_task(task_name: str, args: dict) -> dict:
+    # Imported in the worker so import cost and memory are attributed to this task
+    from pyboy_environment import suite
+
+    domain, task = task_name.split("/")
+    env = suite.make(
+        domain,
+        task,
+        args["act_freqs"][0],
+        headless=True,
+        discrete=True,
+        render_mode=args["render_mode"],
+    )
+
+    np.random.seed(args["seed"])
+    actions = [env.sample_action() for _ in range(args["steps"])]
+
+    results = {}
+    for act_freq in args["act_freqs"]:
+        env.act_freq = act_freq
+        env.reset()
+        start = time.perf_counter()
+        for action in actions:
+            _, _, done, truncated = env.step(action)
+            if done or truncated:
+                env.reset()
+        elapsed = time.perf_counter() - start
+        results[f"steps_per_second@{act_freq}"] = len(actions) / elapsed
+
+    iterations = args["iterations"]
+    results["reset_ms"] = mean_ms(env.reset, iterations)
+    results["game_stats_ms"] = mean_ms(env._generate_game_stats, iterations)
+    results["grab_frame_ms"] = mean_ms(env.grab_frame, iterations)
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    env.close()
+    return results
+
+
+def check(results: dict, thresholds: dict) -> list[str]:
+    failures = []
+    for task_name, limits in thresholds.items():
+        if task_name not in results:
+            continue
+        for name, limit in limits.items():
+            value = results[task_name].get(name)
+            if value is None:
+                failures.append(f"{task_name} {name}: missing from results")
+                continue
+            higher_is_better = METRICS[name.split("@")[0]]
+            if (higher_is_better and value < limit) or (
+                not higher_is_better and value > limit
+            ):
+                bound = "min" if higher_is_better else "max"
+                failures.append(
+                    f"{task_name} {name}: {value:.3f} ({bound} {limit:.3f})"
+                )
+    return failures
+
+
+def make_thresholds(results: dict, tolerance: float) -> dict:
+    thresholds = {}
+    for task_name, metrics in results.items():
+        thresholds[task_name] = {}
+        for name, value in metrics.items():
+            higher_is_better = METRICS[name.split("@")[0]]
+            scale = 1 - tolerance if higher_is_better else 1 + tolerance
+            thresholds[task_name][name] = value * scale
+    return thresholds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", nargs="+", default=TASKS)
+    parser.add_argument("--act_freqs", nargs="+", type=int, default=ACT_FREQS)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--render_mode", default="never")
+    parser.add_argument("--config_dir", default=None)
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS)
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--save_thresholds", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # Checked before the benchmarks run, there is no committed baseline as the
+    # numbers depend on the machine
+    if args.check and not args.save_thresholds and not args.thresholds.exists():
+        parser.error(
+            f"--check: no thresholds file at {args.thresholds}, create one for "
+            "this machine with --save_thresholds first"
+        )
+
+    if args.config_dir is not None:
+        os.environ["CARES_RL_CONFIGS"] = str(Path(args.config_dir).expanduser())
+
+    task_args = {
+        "act_freqs": args.act_freqs,
+        "steps": args.steps,
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "render_mode": args.render_mode,
+    }
+
+    results = {}
+    for task_name in args.tasks:
+        # Fresh process per task so peak RSS and caches are not shared between tasks
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+            results[task_name] = pool.submit(run_task, task_name, task_args).result()
+        print(task_name, json.dumps(results[task_name], indent=2))
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "settings": task_args,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+
+    if args.save_thresholds:
+        with open(args.thresholds, "w", encoding="utf-8") as f:
+            json.dump(make_thresholds(results, args.tolerance), f, indent=2)
+
+    if args.check:
+        with open(args.thresholds, "r", encoding="utf-8") as f:
+            thresholds = json.load(f)
+        failures = check(results, thresholds)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
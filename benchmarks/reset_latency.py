@@ -0,0 +1,56 @@
+# Reset latency with the init state read from disk vs the in-memory cache
+#
+# Usage: python benchmarks/reset_latency.py <domain> <task> [--iterations N]
+
+import argparse
+import io
+import statistics
+import time
+
+from pyboy_environment import suite
+
+
+def time_calls(function, iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarise(name: str, timings: list[float]) -> None:
+    timings_ms = sorted(t * 1000 for t in timings)
+    p95 = timings_ms[int(0.95 * (len(timings_ms) - 1))]
+    print(
+        f"{name:>14}: mean {statistics.mean(timings_ms):.3f} ms | "
+        f"median {statistics.median(timings_ms):.3f} ms | p95 {p95:.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("domain")
+    parser.add_argument("task")
+    parser.add_argument("--act_freq", type=int, default=24)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    env = suite.make(args.domain, args.task, args.act_freq, headless=True)
+
+    def load_from_file():
+        with open(env.init_path, "rb") as f:
+            env.pyboy.load_state(f)
+
+    def load_from_memory():
+        env.pyboy.load_state(io.BytesIO(env._read_state(env.init_path)))
+
+    summarise("file load", time_calls(load_from_file, args.iterations))
+    summarise("cached load", time_calls(load_from_memory, args.iterations))
+    summarise("env.reset()", time_calls(env.reset, args.iterations))
+
+    env.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Import, suite.make and first reset time, and with --num_envs make_vec per start method
+#
+# Usage: python benchmarks/startup_time.py <domain> <task> [--runs N]
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); "
+    "import pyboy_environment.suite; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_time() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return float(output.stdout.strip())
+
+
+def summarise(name: str, timings: list[float]) -> None:
+    timings_ms = [t * 1000 for t in timings]
+    print(
+        f"{name:>14}: mean {statistics.mean(timings_ms):.1f} ms | "
+        f"min {min(timings_ms):.1f} ms | max {max(timings_ms):.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("domain")
+    parser.add_argument("task")
+    parser.add_argument("--act_freq", type=int, default=24)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--num_envs", type=int, default=0)
+    parser.add_argument(
+        "--start_methods", nargs="+", default=["spawn", "forkserver", "fork_server"]
+    )
+    args = parser.parse_args()
+
+    summarise("import suite", [import_time() for _ in range(args.runs)])
+
+    from pyboy_environment import suite
+
+    make_times, reset_times = [], []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        env = suite.make(args.domain, args.task, args.act_freq, headless=True)
+        make_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        env.reset()
+        reset_times.append(time.perf_counter() - start)
+        env.close()
+
+    summarise("suite.make", make_times)
+    summarise("first reset", reset_times)
+
+    if args.num_envs > 0:
+        for start_method in args.start_methods:
+            start = time.perf_counter()
+            vec_env = suite.make_vec(
+                args.domain,
+                args.task,
+                args.num_envs,
+                args.act_freq,
+                start_method=start_method,
+            )
+            vec_env.reset()
+            elapsed = time.perf_counter() - start
+            vec_env.close()
+            summarise(f"{start_method} x{args.num_envs}", [elapsed])
+
+
+if __name__ == "__main__":
+    main()
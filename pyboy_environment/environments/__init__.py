@@ -1,3 +1,14 @@
-from .pyboy_environment import PyboyEnvironment
-from .mario import MarioEnvironment
-from .pokemon import PokemonEnvironment
+from .pyboy_environment import EnvironmentSnapshot, PyboyEnvironment
+
+
+def __getattr__(name: str):
+    # Domain packages are imported on first use so importing the base environment stays cheap
+    if name == "MarioEnvironment":
+        from .mario import MarioEnvironment
+
+        return MarioEnvironment
+    if name == "PokemonEnvironment":
+        from .pokemon import PokemonEnvironment
+
+        return PokemonEnvironment
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,87 @@
+# Grayscale, downsampled and frame-stacked pixel observations. Each frame is written
+# twice into a ring buffer of 2 * num_frames slots, so the stack is always one slice.
+
+import numpy as np
+
+# ITU-R BT.601 luma weights for R, G and B
+GRAYSCALE_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def screen_sample_indexes(
+    screen_shape: tuple[int, int, int],
+    height: int,
+    width: int,
+    channels: tuple[int, ...],
+) -> np.ndarray:
+    # Flat indexes into the screen buffer of the given channels of every pixel of a
+    # (height, width) nearest neighbour resize - np.take with these resizes and reorders
+    # channels in a single pass
+    screen_height, screen_width, screen_channels = screen_shape
+    rows = (np.arange(height) * screen_height) // height
+    cols = (np.arange(width) * screen_width) // width
+    pixels = rows[:, None] * screen_width + cols[None, :]
+    return pixels[:, :, None] * screen_channels + np.array(channels)
+
+
+class FrameStack:
+    def __init__(
+        self,
+        height: int = 84,
+        width: int = 84,
+        num_frames: int = 3,
+        screen_shape: tuple[int, int, int] = (144, 160, 4),
+    ) -> None:
+        self.height = height
+        self.width = width
+        self.num_frames = num_frames
+
+        self._indexes = screen_sample_indexes(screen_shape, height, width, (0, 1, 2))
+
+        self._rgb = np.empty((height, width, 3), dtype=np.uint8)
+        self._weighted = np.empty((height, width, 3), dtype=np.float32)
+        self._gray = np.empty((height, width), dtype=np.float32)
+
+        self._frames = np.zeros((2 * num_frames, height, width), dtype=np.uint8)
+        self._position = 0
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return (self.num_frames, self.height, self.width)
+
+    def reset(self, screen: np.ndarray) -> np.ndarray:
+        self._convert(screen)
+        for i in range(self.num_frames):
+            self._write(i)
+        self._position = self.num_frames - 1
+        return self.view()
+
+    def push(self, screen: np.ndarray) -> np.ndarray:
+        self._position = (self._position + 1) % self.num_frames
+        self._convert(screen)
+        self._write(self._position)
+        return self.view()
+
+    def view(self) -> np.ndarray:
+        # Oldest to newest frame. This is a read-only view that the next push or reset
+        # overwrites, copy it to keep it longer - the same goes for GameArea.view and the
+        # PokemonStructs views.
+        start = self._position + 1
+        frames = self._frames[start : start + self.num_frames]
+        frames.flags.writeable = False
+        return frames
+
+    def get_state(self) -> tuple[np.ndarray, int]:
+        return (self._frames.copy(), self._position)
+
+    def set_state(self, state: tuple[np.ndarray, int]) -> None:
+        frames, self._position = state
+        np.copyto(self._frames, frames)
+
+    def _convert(self, screen: np.ndarray) -> None:
+        np.take(screen.reshape(-1), self._indexes, out=self._rgb)
+        np.multiply(self._rgb, GRAYSCALE_WEIGHTS, out=self._weighted)
+        np.sum(self._weighted, axis=2, out=self._gray)
+
+    def _write(self, slot: int) -> None:
+        np.copyto(self._frames[slot], self._gray, casting="unsafe")
+        np.copyto(self._frames[slot + self.num_frames], self._gray, casting="unsafe")
@@ -0,0 +1,133 @@
+# Incremental pyboy game_wrapper.game_area() - only the cells whose tile changed since
+# the last update are mapped again. Tile identifiers follow pyboy's
+# TileMap.tile_identifier, tiles in the signed 0x8800 data area are offset by 0x100.
+
+import numpy as np
+
+LCDC_ADDR = 0xFF40
+SCY_ADDR = 0xFF42
+SCX_ADDR = 0xFF43
+OAM_ADDR = 0xFE00
+LOW_TILEMAP_ADDR = 0x9800
+HIGH_TILEMAP_ADDR = 0x9C00
+TILEMAP_SIZE = 32
+NUM_SPRITES = 40
+
+NUM_TILE_IDENTIFIERS = 0x180
+
+# Tile identifier of every tilemap byte value for unsigned/signed tile data addressing
+UNSIGNED_TILE_IDENTIFIERS = np.arange(256, dtype=np.uint16)
+SIGNED_TILE_IDENTIFIERS = ((np.arange(256) ^ 0x80) - 128 + 0x100).astype(np.uint16)
+
+
+def register_scroll(memory) -> tuple[int, int]:
+    # (SCX, SCY) as set when the registers were read, for games without split screen scrolling
+    return memory[SCX_ADDR], memory[SCY_ADDR]
+
+
+class GameArea:
+    def __init__(
+        self,
+        section: tuple[int, int, int, int] = (0, 0, 20, 18),
+        mapping: np.ndarray | None = None,
+        sprites: bool = False,
+        sprite_offset: int = 0,
+    ) -> None:
+        # section is (x, y, width, height) in tiles, like pyboy's game_area_section
+        self.x, self.y, self.width, self.height = section
+        if mapping is None:
+            mapping = np.arange(NUM_TILE_IDENTIFIERS)
+        self.mapping = np.asarray(mapping, dtype=np.uint32)
+        self.sprites = sprites
+        self.sprite_offset = sprite_offset
+
+        self._background = np.zeros((self.height, self.width), dtype=np.uint32)
+        self._grid = np.zeros((self.height, self.width), dtype=np.uint32)
+        self._view = self._grid.view()
+        self._view.flags.writeable = False
+
+        # Tile bytes under each cell and the addressing mode at the last update
+        self._source: np.ndarray | None = None
+        self._signed = False
+        # Flat indexes of the cells sprites were drawn on at the last update
+        self._sprite_cells = np.zeros(0, dtype=np.intp)
+
+        # Tilemap indexes of each cell, rebuilt only when the scroll changes
+        self._scroll: np.ndarray | None = None
+        self._rows = None
+        self._columns = None
+
+    @property
+    def view(self) -> np.ndarray:
+        return self._view
+
+    def update(self, memory, scroll) -> np.ndarray:
+        # scroll is (SCX, SCY) in pixels, or one (SCX, SCY) per grid row
+        lcdc = memory[LCDC_ADDR]
+        start = HIGH_TILEMAP_ADDR if lcdc & 0x08 else LOW_TILEMAP_ADDR
+        tilemap = np.array(
+            memory[start : start + TILEMAP_SIZE * TILEMAP_SIZE], dtype=np.uint8
+        ).reshape(TILEMAP_SIZE, TILEMAP_SIZE)
+        signed = not lcdc & 0x10
+
+        self._update_indexes(scroll)
+        source = tilemap[self._rows, self._columns]
+
+        if self._source is None or signed != self._signed:
+            dirty = np.ones(source.shape, dtype=bool)
+        else:
+            dirty = source != self._source
+        self._source = source
+        self._signed = signed
+
+        if dirty.any():
+            identifiers = (
+                SIGNED_TILE_IDENTIFIERS if signed else UNSIGNED_TILE_IDENTIFIERS
+            )
+            self._background[dirty] = self.mapping[identifiers[source[dirty]]]
+            self._grid[dirty] = self._background[dirty]
+
+        if self.sprites:
+            self._draw_sprites(memory, lcdc)
+
+        return self._view
+
+    def _update_indexes(self, scroll) -> None:
+        scroll = np.broadcast_to(np.asarray(scroll) // 8, (self.height, 2))
+        if self._scroll is not None and np.array_equal(scroll, self._scroll):
+            return
+
+        self._scroll = scroll.copy()
+        self._rows = (np.arange(self.y, self.y + self.height) + scroll[:, 1])[
+            :, None
+        ] % TILEMAP_SIZE
+        self._columns = (
+            np.arange(self.x, self.x + self.width)[None, :] + scroll[:, 0:1]
+        ) % TILEMAP_SIZE
+
+    def _draw_sprites(self, memory, lcdc: int) -> None:
+        previous = self._sprite_cells
+        self._grid.flat[previous] = self._background.flat[previous]
+
+        oam = np.array(
+            memory[OAM_ADDR : OAM_ADDR + NUM_SPRITES * 4], dtype=np.int32
+        ).reshape(NUM_SPRITES, 4)
+        sprite_height = 16 if lcdc & 0x04 else 8
+        y = oam[:, 0] - 16
+        x = oam[:, 1] - 8
+        on_screen = (-sprite_height < y) & (y < 144) & (-8 < x) & (x < 160)
+
+        # One entry per sprite tile - the second tile of 8x16 sprites is the row below
+        tiles = oam[on_screen, 2][:, None] + np.arange(sprite_height // 8)
+        rows = (y[on_screen] // 8 - self.y)[:, None] + np.arange(sprite_height // 8)
+        columns = np.broadcast_to((x[on_screen] // 8 - self.x)[:, None], rows.shape)
+
+        inside = (rows >= 0) & (rows < self.height) & (columns >= 0)
+        inside &= columns < self.width
+        cells = (rows * self.width + columns)[inside]
+        values = self.mapping[tiles[inside]] + self.sprite_offset
+
+        # Later sprites are drawn over earlier ones, keep the last write of each cell
+        cells, last = np.unique(cells[::-1], return_index=True)
+        self._grid.flat[cells] = values[::-1][last]
+        self._sprite_cells = cells
@@ -11,12 +11,37 @@ https://github.com/lixado/PyBoy-RL/blob/main/AISettings/MarioAISettings.py
 from abc import ABCMeta
 
 import numpy as np
+from pyboy.plugins.game_wrapper_super_mario_land import mapping_compressed
 from pyboy.utils import WindowEvent
 
+from pyboy_environment.environments.game_area import GameArea
 from pyboy_environment.environments.pyboy_environment import PyboyEnvironment
+from pyboy_environment.environments.ram_schema import RamField, RamSchema
+
+# The game wrapper's game area - the screen below the HUD, in tiles
+GAME_AREA_SECTION = (0, 2, 20, 16)
+GAME_AREA_ROWS = range(
+    GAME_AREA_SECTION[1], GAME_AREA_SECTION[1] + GAME_AREA_SECTION[3]
+)
 
 
 class MarioEnvironment(PyboyEnvironment, metaclass=ABCMeta):
+    ram_schema = RamSchema(
+        [
+            RamField("lives", 0xDA15),
+            RamField("coins", 0xFFFA),
+            RamField("stage", 0x982E),
+            RamField("world", 0x982C),
+            # Timer digits are the tile indexes shown on screen
+            RamField("time", 0x9831, width=3, encoding="digits"),
+            RamField("dead_timer", 0xFFA6),
+            RamField("dead_jump_timer", 0xC0AC),
+            RamField("game_state", 0xFFB3),
+            RamField("level_block", 0xC0AB),
+            RamField("mario_x", 0xC202),
+        ]
+    )
+
     def __init__(
         self,
         act_freq: int,
@@ -24,8 +49,16 @@ class MarioEnvironment(PyboyEnvironment, metaclass=ABCMeta):
         release_button: list[WindowEvent],
         emulation_speed: int = 0,
         headless: bool = False,
+        render_mode: str = "last",
+        observation_mode: str = "ram",
+        frame_size: tuple[int, int] = (84, 84),
+        frame_stack: int = 3,
     ) -> None:
 
+        self._game_area = GameArea(
+            GAME_AREA_SECTION, mapping=mapping_compressed, sprites=True
+        )
+
         super().__init__(
             task="mario",
             rom_name="SuperMarioLand.gb",
@@ -36,6 +69,10 @@ class MarioEnvironment(PyboyEnvironment, metaclass=ABCMeta):
             release_button=release_button,
             emulation_speed=emulation_speed,
             headless=headless,
+            render_mode=render_mode,
+            observation_mode=observation_mode,
+            frame_size=frame_size,
+            frame_stack=frame_stack,
         )
 
     def _get_state(self) -> np.ndarray:
@@ -44,64 +81,38 @@ class MarioEnvironment(PyboyEnvironment, metaclass=ABCMeta):
         return self.game_area().flatten().tolist()
 
     def _generate_game_stats(self) -> dict[str, int]:
+        ram = self._read_ram_schema()
         return {
-            "lives": self._get_lives(),
+            "lives": ram["lives"],
             "score": self._get_score(),
-            "coins": self._get_coins(),
-            "stage": self._get_stage(),
-            "world": self._get_world(),
-            "x_position": self._get_x_position(),
-            "time": self._get_time(),
-            "dead_timer": self._get_dead_timer(),
-            "dead_jump_timer": self._get_dead_jump_timer(),
-            "game_over": self._get_game_over(),
+            "coins": ram["coins"],
+            "stage": ram["stage"],
+            "world": ram["world"],
+            "x_position": self._get_x_position(ram),
+            "time": ram["time"],
+            "dead_timer": ram["dead_timer"],
+            "dead_jump_timer": ram["dead_jump_timer"],
+            "game_over": ram["game_state"] == 0x39,
         }
 
-    def _get_x_position(self):
+    def _get_x_position(self, ram: dict[str, int]) -> int:
         # Copied from: https://github.com/lixado/PyBoy-RL/blob/main/AISettings/MarioAISettings.py
         # Do not understand how this works...
-        level_block = self._read_m(0xC0AB)
-        mario_x = self._read_m(0xC202)
         scx = self.pyboy.screen.tilemap_position_list[16][0]
         real = (scx - 7) % 16 if (scx - 7) % 16 != 0 else 16
-        real_x_position = level_block * 16 + real + mario_x
+        real_x_position = ram["level_block"] * 16 + real + ram["mario_x"]
         return real_x_position
 
-    def _get_time(self):
-        hundreds = self._read_m(0x9831)
-        tens = self._read_m(0x9832)
-        ones = self._read_m(0x9833)
-        return int(str(hundreds) + str(tens) + str(ones))
-
-    def _get_lives(self):
-        return self._read_m(0xDA15)
-
     def _get_score(self):
         mario = self.pyboy.game_wrapper
         return mario.score
 
-    def _get_coins(self):
-        return self._read_m(0xFFFA)
-
-    def _get_stage(self):
-        return self._read_m(0x982E)
-
-    def _get_world(self):
-        return self._read_m(0x982C)
-
-    def _get_game_over(self):
-        return self._read_m(0xFFB3) == 0x39
-
     def _get_mario_pose(self):
         return self._read_m(0xC203)
 
-    def _get_dead_timer(self):
-        return self._read_m(0xFFA6)
-
-    def _get_dead_jump_timer(self):
-        return self._read_m(0xC0AC)
-
     def game_area(self) -> np.ndarray:
-        mario = self.pyboy.game_wrapper
-        mario.game_area_mapping(mario.mapping_compressed, 0)
-        return mario.game_area()
+        # Same grid as game_wrapper.game_area() with mapping_compressed, as a read-only
+        # view that is updated in place - see FrameStack.view
+        positions = self.pyboy.screen.tilemap_position_list
+        scroll = [positions[row * 8][:2] for row in GAME_AREA_ROWS]
+        return self._game_area.update(self.pyboy.memory, scroll)
@@ -6,6 +6,7 @@ import numpy as np
 from pyboy.utils import WindowEvent
 
 from pyboy_environment.environments.mario.mario_environment import MarioEnvironment
+from pyboy_environment.environments.pyboy_environment import OBSERVATION_PIXELS
 
 
 class MarioRun(MarioEnvironment):
@@ -14,6 +15,10 @@ class MarioRun(MarioEnvironment):
         act_freq: int,
         emulation_speed: int = 0,
         headless: bool = False,
+        render_mode: str = "last",
+        observation_mode: str = "ram",
+        frame_size: tuple[int, int] = (84, 84),
+        frame_stack: int = 3,
     ) -> None:
 
         valid_actions: List[WindowEvent] = [
@@ -40,6 +45,10 @@ class MarioRun(MarioEnvironment):
             release_button=release_button,
             emulation_speed=emulation_speed,
             headless=headless,
+            render_mode=render_mode,
+            observation_mode=observation_mode,
+            frame_size=frame_size,
+            frame_stack=frame_stack,
         )
 
         self.max_level_progress = 0
@@ -48,6 +57,15 @@ class MarioRun(MarioEnvironment):
         self.max_level_progress = 0
         return super().reset()
 
+    def _get_episode_state(self) -> dict:
+        episode_state = super()._get_episode_state()
+        episode_state["max_level_progress"] = self.max_level_progress
+        return episode_state
+
+    def _set_episode_state(self, episode_state: dict) -> None:
+        super()._set_episode_state(episode_state)
+        self.max_level_progress = episode_state["max_level_progress"]
+
     @cached_property
     def min_action_value(self) -> float:
         return 0
@@ -57,7 +75,9 @@ class MarioRun(MarioEnvironment):
         return 1
 
     @cached_property
-    def observation_space(self) -> int:
+    def observation_space(self) -> int | tuple[int, int, int]:
+        if self.observation_mode == OBSERVATION_PIXELS:
+            return self.frame_stack.shape
         return len(self._get_state())
 
     @cached_property
@@ -78,8 +98,7 @@ class MarioRun(MarioEnvironment):
             else:
                 self.pyboy.send_input(self.release_button[i])
 
-        for i in range(self.act_freq):
-            self.pyboy.tick()
+        self._tick(self.act_freq)
 
     def _calculate_reward(self, new_state: Dict[str, int]) -> float:
         reward_stats = {
@@ -0,0 +1,95 @@
+# Walkable on-screen tiles - the collision list of the current tileset, as a lookup
+# table cached per tileset, plus the grass tile of outdoor tilesets
+# https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/data/tilesets/collision_tile_ids.asm
+
+import numpy as np
+
+from pyboy_environment.environments.game_area import (
+    HIGH_TILEMAP_ADDR,
+    LCDC_ADDR,
+    LOW_TILEMAP_ADDR,
+    SCX_ADDR,
+    SCY_ADDR,
+    SIGNED_TILE_IDENTIFIERS,
+    TILEMAP_SIZE,
+)
+
+TILESET_COLLISION_PTR_ADDR = 0xD530  # wTilesetCollisionPtr, little endian
+GRASS_TILE_ADDR = 0xD535  # wGrassTile
+TILESET_TYPE_ADDR = 0xFFD7  # hTilesetType, 0 for indoor tilesets
+MAX_COLLISION_TILES = 0x180
+COLLISION_LIST_END = 0xFF
+
+SCREEN_TILES = (18, 20)
+# Covers every collision byte + 0x100, not just the tile identifiers in use
+WALKABLE_TABLE_SIZE = 0x200
+
+
+def read_screen_tilemap(memory) -> np.ndarray:
+    # Background tile identifiers visible on screen - (18, 20)
+    lcdc = memory[LCDC_ADDR]
+    start = HIGH_TILEMAP_ADDR if lcdc & 0x08 else LOW_TILEMAP_ADDR
+    tilemap = np.array(
+        memory[start : start + TILEMAP_SIZE * TILEMAP_SIZE], dtype=np.uint16
+    ).reshape(TILEMAP_SIZE, TILEMAP_SIZE)
+    if not lcdc & 0x10:
+        tilemap = SIGNED_TILE_IDENTIFIERS[tilemap]
+
+    rows = (np.arange(SCREEN_TILES[0]) + memory[SCY_ADDR] // 8) % TILEMAP_SIZE
+    columns = (np.arange(SCREEN_TILES[1]) + memory[SCX_ADDR] // 8) % TILEMAP_SIZE
+    return tilemap[np.ix_(rows, columns)]
+
+
+class CollisionMap:
+    def __init__(self) -> None:
+        # (collision pointer, tileset type, grass tile) -> walkable lookup table
+        self._walkable_tables: dict[tuple[int, int, int], np.ndarray] = {}
+
+    def walkable_table(self, memory) -> np.ndarray:
+        collision_ptr = memory[TILESET_COLLISION_PTR_ADDR] | (
+            memory[TILESET_COLLISION_PTR_ADDR + 1] << 8
+        )
+        tileset_type = memory[TILESET_TYPE_ADDR]
+        grass_tile = memory[GRASS_TILE_ADDR] if tileset_type > 0 else 0xFF
+
+        key = (collision_ptr, tileset_type, grass_tile)
+        table = self._walkable_tables.get(key)
+        if table is None:
+            table = self._build_walkable_table(memory, collision_ptr, grass_tile)
+            self._walkable_tables[key] = table
+        return table
+
+    def walkable_matrix(
+        self, memory, screen_tiles: np.ndarray | None = None
+    ) -> np.ndarray:
+        # One entry per 16x16 pixel map block - the bottom left tile of each block
+        if screen_tiles is None:
+            screen_tiles = read_screen_tilemap(memory)
+        return self.walkable_table(memory)[screen_tiles[1::2, ::2]]
+
+    def collision_grid(
+        self, memory, screen_tiles: np.ndarray | None = None
+    ) -> np.ndarray:
+        # walkable_matrix upscaled to one entry per on-screen tile - (18, 20)
+        walkable = self.walkable_matrix(memory, screen_tiles).astype(np.uint32)
+        rows, columns = walkable.shape
+        return np.broadcast_to(
+            walkable[:, None, :, None], (rows, 2, columns, 2)
+        ).reshape(rows * 2, columns * 2)
+
+    def _build_walkable_table(
+        self, memory, collision_ptr: int, grass_tile: int
+    ) -> np.ndarray:
+        collision_tiles = np.array(
+            memory[collision_ptr : collision_ptr + MAX_COLLISION_TILES],
+            dtype=np.uint16,
+        )
+        end = np.flatnonzero(collision_tiles == COLLISION_LIST_END)
+        if end.size > 0:
+            collision_tiles = collision_tiles[: end[0]]
+
+        table = np.zeros(WALKABLE_TABLE_SIZE, dtype=np.uint8)
+        table[collision_tiles + 0x100] = 1
+        if grass_tile != 0xFF:
+            table[grass_tile + 0x100] = 1
+        return table
@@ -0,0 +1,69 @@
+# Event flags (0xD747 - 0xD886) and the flags each update set or cleared
+# https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/event_constants.asm
+
+import numpy as np
+
+from pyboy_environment.environments.ram_schema import POPCOUNT_TABLE
+
+EVENT_FLAGS_START = 0xD747
+EVENT_FLAGS_END = 0xD886
+
+EMPTY_FLAGS = np.zeros(0, dtype=np.int64)
+
+
+class EventTracker:
+    def __init__(
+        self, start: int = EVENT_FLAGS_START, end: int = EVENT_FLAGS_END
+    ) -> None:
+        self.start = start
+        self.end = end
+
+        self.flags: np.ndarray | None = None
+        self.count = 0
+
+        # Flag indexes (byte * 8 + bit) that were set/cleared by the last update
+        self.newly_set = EMPTY_FLAGS
+        self.newly_cleared = EMPTY_FLAGS
+
+    def clear(self) -> None:
+        # The next update becomes the baseline and reports no flips
+        self.flags = None
+
+    def update(self, memory) -> None:
+        flags = np.array(memory[self.start : self.end], dtype=np.uint8)
+
+        if self.flags is None:
+            self.count = int(POPCOUNT_TABLE[flags].sum())
+            self.newly_set = EMPTY_FLAGS
+            self.newly_cleared = EMPTY_FLAGS
+            self.flags = flags
+            return
+
+        changed_bytes = np.flatnonzero(flags != self.flags)
+        if changed_bytes.size == 0:
+            self.newly_set = EMPTY_FLAGS
+            self.newly_cleared = EMPTY_FLAGS
+            return
+
+        old_bits = np.unpackbits(self.flags[changed_bytes], bitorder="little")
+        new_bits = np.unpackbits(flags[changed_bytes], bitorder="little")
+        indexes = (changed_bytes[:, None] * 8 + np.arange(8)).ravel()
+
+        self.newly_set = indexes[new_bits > old_bits]
+        self.newly_cleared = indexes[new_bits < old_bits]
+        self.count += self.newly_set.size - self.newly_cleared.size
+        self.flags = flags
+
+    def byte_counts(self) -> list[int]:
+        # Set flags per byte of the flag block
+        return POPCOUNT_TABLE[self.flags].tolist()
+
+    def is_set(self, flag: int) -> bool:
+        return bool(self.flags[flag // 8] >> (flag % 8) & 1)
+
+    def get_state(self) -> tuple:
+        return (self.flags, self.count, self.newly_set, self.newly_cleared)
+
+    def set_state(self, state: tuple) -> None:
+        # Arrays are replaced rather than modified on update so can be shared
+        self.flags, self.count, self.newly_set, self.newly_cleared = state
@@ -0,0 +1,95 @@
+# Adaptive frame skip - fast-forwards walking, scripted movement (wJoyIgnore) and
+# dialog after an action, up to frame_budget frames. Menus are left to the agent.
+# https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/ram/wram.asm
+
+from typing import TYPE_CHECKING
+
+from pyboy_environment.environments.pokemon.macro_actions import (
+    BUTTON_A,
+    FONT_LOADED_ADDR,
+    PRESS_FRAMES,
+)
+from pyboy_environment.environments.ram_condition import RamPredicate
+
+if TYPE_CHECKING:
+    from pyboy_environment.environments.pokemon.pokemon_environment import (
+        PokemonEnvironment,
+    )
+
+WALK_COUNTER_ADDR = 0xCFC5  # wWalkCounter, counts down the frames of a step
+JOY_IGNORE_ADDR = 0xCD6B  # wJoyIgnore, set bits are buttons the game ignores
+# Prompt arrow tile of a text box waiting for a button press, at (18, 16) in wTileMap
+TEXT_ARROW_ADDR = 0xC3A0 + 16 * 20 + 18
+TEXT_ARROW_TILE = 0xEE
+
+DIRECTION_BUTTONS = 0xF0
+
+CHECK_FRAMES = 4
+# Longest wait for the next prompt while text is printed
+TEXT_FRAMES = 90
+
+DEFAULT_FRAME_BUDGET = 1200
+
+
+class FrameSkipper:
+    def __init__(
+        self, env: "PokemonEnvironment", frame_budget: int = DEFAULT_FRAME_BUDGET
+    ) -> None:
+        self.env = env
+        self.frame_budget = frame_budget
+        # Frames skipped after the last action
+        self.frames = 0
+
+        self._walk_done = RamPredicate([(WALK_COUNTER_ADDR, 0xFF, "==", 0)])
+        self._script_done = RamPredicate(
+            [
+                (JOY_IGNORE_ADDR, DIRECTION_BUTTONS, "!=", DIRECTION_BUTTONS),
+                (TEXT_ARROW_ADDR, 0xFF, "==", TEXT_ARROW_TILE),
+            ],
+            any_of=True,
+        )
+        self._text_done = RamPredicate(
+            [
+                (TEXT_ARROW_ADDR, 0xFF, "==", TEXT_ARROW_TILE),
+                (FONT_LOADED_ADDR, 1, "==", 0),
+            ],
+            any_of=True,
+        )
+
+    def run(self) -> int:
+        self.frames = 0
+        env = self.env
+        memory = env.pyboy.memory
+
+        if env.emulation_speed != 0:
+            env.pyboy.set_emulation_speed(0)
+        try:
+            while self.frames < self.frame_budget:
+                if memory[TEXT_ARROW_ADDR] == TEXT_ARROW_TILE:
+                    self._advance_text()
+                elif memory[WALK_COUNTER_ADDR] != 0:
+                    self._tick_until(self._walk_done)
+                elif memory[JOY_IGNORE_ADDR] & DIRECTION_BUTTONS == DIRECTION_BUTTONS:
+                    self._tick_until(self._script_done)
+                else:
+                    break
+        finally:
+            if env.emulation_speed != 0:
+                env.pyboy.set_emulation_speed(env.emulation_speed)
+        return self.frames
+
+    def _tick_until(
+        self, predicate: RamPredicate, max_frames: int | None = None
+    ) -> None:
+        budget = self.frame_budget - self.frames
+        if max_frames is not None:
+            budget = min(budget, max_frames)
+        self.frames += self.env.tick_until(predicate, budget, CHECK_FRAMES)
+
+    def _advance_text(self) -> None:
+        env = self.env
+        env.pyboy.send_input(env.valid_actions[BUTTON_A])
+        env._tick(PRESS_FRAMES, last=False)
+        env.pyboy.send_input(env.release_button[BUTTON_A])
+        self.frames += PRESS_FRAMES
+        self._tick_until(self._text_done, TEXT_FRAMES)
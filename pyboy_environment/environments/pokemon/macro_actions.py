@@ -0,0 +1,179 @@
+# Macro actions - button sequences run as a single agent step, stopping when RAM shows
+# they are done or after frame_budget frames
+# https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/ram/wram.asm
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from pyboy_environment.environments.pokemon.pokemon_environment import (
+        PokemonEnvironment,
+    )
+
+X_ADDR = 0xD362  # wXCoord
+Y_ADDR = 0xD361  # wYCoord
+MAP_ADDR = 0xD35E  # wCurMap
+BATTLE_ADDR = 0xD057  # wIsInBattle
+FONT_LOADED_ADDR = 0xCFC4  # wFontLoaded, bit 0 set while a text box or menu is shown
+TOP_MENU_ITEM_X_ADDR = 0xCC25  # wTopMenuItemX
+CURRENT_MENU_ITEM_ADDR = 0xCC26  # wCurrentMenuItem
+MAX_MENU_ITEM_ADDR = 0xCC28  # wMaxMenuItem
+
+# Indexes into PokemonEnvironment.valid_actions
+DOWN, LEFT, RIGHT, UP, BUTTON_A, BUTTON_B = range(6)
+
+WALK_DISTANCES = (1, 2, 4, 8)
+MENU_ITEMS = 4
+# wTopMenuItemX of the left/right column of the battle menu, 2 rows each
+BATTLE_MENU_COLUMNS = (9, 15)
+
+# Frames a button is held for a press, and between completion checks
+PRESS_FRAMES = 4
+CHECK_FRAMES = 4
+# Frames without movement before a walk counts as blocked, and to finish the last step
+BLOCKED_FRAMES = 24
+SETTLE_FRAMES = 8
+
+DEFAULT_FRAME_BUDGET = 600
+
+
+@dataclass(frozen=True)
+class MacroAction:
+    name: str
+    button: int = BUTTON_A
+    count: int = 1
+
+
+# press: one button press (act_freq frames)
+# walk: hold a direction for count tiles, or until stopped by a wall, map change,
+#   battle or text box
+# clear_text: press A until no text box or menu is shown
+# select_menu_item: move the cursor to item count and press A, in a list menu or the
+#   battle menu (0 FIGHT, 1 ITEM, 2 PKMN, 3 RUN) - nothing is pressed without a menu
+MACRO_ACTIONS: tuple[MacroAction, ...] = (
+    tuple(MacroAction("press", button) for button in range(6))
+    + tuple(
+        MacroAction("walk", direction, distance)
+        for direction in (DOWN, LEFT, RIGHT, UP)
+        for distance in WALK_DISTANCES
+    )
+    + (MacroAction("clear_text"),)
+    + tuple(MacroAction("select_menu_item", count=item) for item in range(MENU_ITEMS))
+)
+
+
+class MacroActionRunner:
+    def __init__(
+        self, env: "PokemonEnvironment", frame_budget: int = DEFAULT_FRAME_BUDGET
+    ) -> None:
+        self.env = env
+        self.frame_budget = frame_budget
+        # Frames run by the last macro
+        self.frames = 0
+
+        self._macros: dict[str, Callable[[MacroAction], None]] = {
+            "press": self._press,
+            "walk": self._walk,
+            "clear_text": self._clear_text,
+            "select_menu_item": self._select_menu_item,
+        }
+
+    def run(self, macro: MacroAction) -> int:
+        self.frames = 0
+        self._macros[macro.name](macro)
+        return self.frames
+
+    def _read(self, addr: int) -> int:
+        return self.env.pyboy.memory[addr]
+
+    def _tick(self, count: int) -> None:
+        count = min(count, self.frame_budget - self.frames)
+        self.env._tick(count, last=False)
+        self.frames += max(count, 0)
+
+    def _finish(self) -> None:
+        # Lets the last movement/animation settle, past the budget if needed
+        self.env._tick(SETTLE_FRAMES)
+        self.frames += SETTLE_FRAMES
+
+    def _has_budget(self) -> bool:
+        return self.frames < self.frame_budget
+
+    def _tap(self, button: int) -> None:
+        self.env.pyboy.send_input(self.env.valid_actions[button])
+        self._tick(PRESS_FRAMES)
+        self.env.pyboy.send_input(self.env.release_button[button])
+
+    def _text_shown(self) -> bool:
+        return bool(self._read(FONT_LOADED_ADDR) & 1)
+
+    def _press(self, macro: MacroAction) -> None:
+        self.env._press_button(macro.button)
+        self.frames += self.env.act_freq
+
+    def _walk(self, macro: MacroAction) -> None:
+        start_map = self._read(MAP_ADDR)
+        position = (self._read(X_ADDR), self._read(Y_ADDR))
+        moved = 0
+        still_frames = 0
+
+        self.env.pyboy.send_input(self.env.valid_actions[macro.button])
+        while moved < macro.count and self._has_budget():
+            self._tick(CHECK_FRAMES)
+
+            new_position = (self._read(X_ADDR), self._read(Y_ADDR))
+            if new_position != position:
+                moved += 1
+                position = new_position
+                still_frames = 0
+            else:
+                still_frames += CHECK_FRAMES
+
+            if (
+                still_frames >= BLOCKED_FRAMES
+                or self._read(MAP_ADDR) != start_map
+                or self._read(BATTLE_ADDR) != 0
+                or self._text_shown()
+            ):
+                break
+        self.env.pyboy.send_input(self.env.release_button[macro.button])
+        self._finish()
+
+    def _clear_text(self, macro: MacroAction) -> None:
+        while self._text_shown() and self._has_budget():
+            self._tap(BUTTON_A)
+            self._tick(CHECK_FRAMES)
+        self._finish()
+
+    def _select_menu_item(self, macro: MacroAction) -> None:
+        # Direction taps without a menu would walk the player around
+        if not self._text_shown():
+            self._finish()
+            return
+
+        target = macro.count
+        in_battle_menu = (
+            self._read(BATTLE_ADDR) != 0
+            and self._read(TOP_MENU_ITEM_X_ADDR) in BATTLE_MENU_COLUMNS
+        )
+        if in_battle_menu:
+            column = BATTLE_MENU_COLUMNS[target // 2]
+            if self._read(TOP_MENU_ITEM_X_ADDR) != column and self._has_budget():
+                self._tap(RIGHT if column > BATTLE_MENU_COLUMNS[0] else LEFT)
+                self._tick(CHECK_FRAMES)
+            if self._read(TOP_MENU_ITEM_X_ADDR) != column:
+                self._finish()
+                return
+            target %= 2
+        target = min(target, self._read(MAX_MENU_ITEM_ADDR))
+
+        for _ in range(MENU_ITEMS):
+            current = self._read(CURRENT_MENU_ITEM_ADDR)
+            if current == target or not self._has_budget():
+                break
+            self._tap(DOWN if current < target else UP)
+            self._tick(CHECK_FRAMES)
+
+        if self._read(CURRENT_MENU_ITEM_ADDR) == target:
+            self._tap(BUTTON_A)
+        self._finish()
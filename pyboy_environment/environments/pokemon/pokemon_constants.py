@@ -1,6 +1,7 @@
 # https://github.com/pret/pokered/tree/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants
 
 import json
+from functools import cache
 from pathlib import Path
 
 here = Path(__file__).parent
@@ -15,19 +16,34 @@ def load_dict(path):
         return data
 
 
-pokemon = load_dict(f"{here}/pokemon_constants.json")
+# The constant tables are parsed on first use rather than at import time
+CONSTANT_FILES = {
+    "pokemon": "pokemon_constants.json",
+    "types": "type_constants.json",
+    "map_locations": "map_constants.json",
+}
+
+
+@cache
+def load_constants(name):
+    return load_dict(f"{here}/{CONSTANT_FILES[name]}")
+
+
+def __getattr__(name):
+    if name in CONSTANT_FILES:
+        return load_constants(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_pokemon(pokemon_id):
+    pokemon = load_constants("pokemon")
     if pokemon_id in pokemon:
         return pokemon[pokemon_id]
     return "Unknown Pokemon"
 
 
-types = load_dict(f"{here}/type_constants.json")
-
-
 def get_type(type_id):
+    types = load_constants("types")
     if type_id in types:
         return types[type_id]
     return "Unknown Type"
@@ -40,11 +56,9 @@ def get_status(status_id):
     return "Unknown Status"
 
 
-map_locations = load_dict(f"{here}/map_constants.json")
-
-
 def get_map_location(map_idx):
     # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/map_constants.asm
+    map_locations = load_constants("map_locations")
     if map_idx in map_locations:
         return map_locations[map_idx]
     return "Unknown Location"
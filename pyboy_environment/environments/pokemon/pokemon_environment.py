@@ -1,14 +1,56 @@
 from functools import cached_property
 from abc import abstractmethod
+from typing import TYPE_CHECKING
 
 import numpy as np
 from pyboy.utils import WindowEvent
 
-from pyboy_environment.environments.pyboy_environment import PyboyEnvironment
+from pyboy_environment.environments.pyboy_environment import (
+    OBSERVATION_PIXELS,
+    PyboyEnvironment,
+)
+from pyboy_environment.environments.game_area import GameArea, register_scroll
 from pyboy_environment.environments.pokemon import pokemon_constants as pkc
+from pyboy_environment.environments.pokemon.collision import CollisionMap
+from pyboy_environment.environments.pokemon.event_tracker import EventTracker
+from pyboy_environment.environments.pokemon.frame_skip import FrameSkipper
+from pyboy_environment.environments.pokemon.macro_actions import (
+    MACRO_ACTIONS,
+    MacroActionRunner,
+)
+from pyboy_environment.environments.pokemon.ram_structs import (
+    PARTY_SIZE,
+    PokemonStructs,
+    pokeball_count,
+)
+from pyboy_environment.environments.pokemon.rom_events import STRUCT_FRAMES, RomEvents
+from pyboy_environment.environments.pokemon.visit_counts import VisitCounts
+from pyboy_environment.environments.ram_schema import RamField, RamSchema
+
+if TYPE_CHECKING:
+    from pyboy import PyBoy
 
 
 class PokemonEnvironment(PyboyEnvironment):
+    # https://datacrystal.tcrf.net/wiki/Pok%C3%A9mon_Red_and_Blue/RAM_map
+    ram_schema = RamSchema(
+        [
+            RamField("x", 0xD362),
+            RamField("y", 0xD361),
+            RamField("map_id", 0xD35E),
+            RamField("battle_type", 0xD057),
+            RamField("player_sprite_status", 0xC207),
+            RamField("current_selected_menu_item", 0xCC26),
+            RamField("party_size", 0xD163),
+            # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/pokemon_constants.asm
+            RamField("ids", 0xD164, count=PARTY_SIZE),
+            RamField("badges", 0xD356, encoding="bitcount"),
+            RamField("caught_pokemon", 0xD2F7, width=19, encoding="bitcount"),
+            RamField("seen_pokemon", 0xD30A, width=19, encoding="bitcount"),
+            RamField("money", 0xD347, width=3, encoding="bcd"),
+        ]
+    )
+
     def __init__(
         self,
         act_freq: int,
@@ -17,9 +59,38 @@ class PokemonEnvironment(PyboyEnvironment):
         headless: bool = False,
         init_name: str = "has_pokedex.state",
         discrete: bool = False,
+        render_mode: str = "last",
+        observation_mode: str = "ram",
+        frame_size: tuple[int, int] = (84, 84),
+        frame_stack: int = 3,
+        macro_actions: bool = False,
+        frame_skip: bool = False,
+        rom_hooks: bool = False,
     ) -> None:
 
         self.discrete = discrete
+        # Actions select from MACRO_ACTIONS instead of single button presses
+        self.macro_runner = MacroActionRunner(self) if macro_actions else None
+        # Fast-forwards walking, cutscenes and dialog after each action
+        self.frame_skipper = FrameSkipper(self) if frame_skip else None
+        # Frames run by the last step, including the skipped ones. Rewards earned while
+        # skipping are part of the step reward and not reported separately, splitting it
+        # would run the task's reward function (and its side effects) twice.
+        self.step_info = {"frames": 0, "skipped_frames": 0}
+        # Events recorded by ROM execution hooks, registered when the emulator starts
+        self.rom_events = RomEvents() if rom_hooks else None
+        # Battle type, frame and party/bag stats of the last party/bag read
+        self._struct_stats: tuple[int, int, dict] | None = None
+
+        self.event_tracker = EventTracker()
+        # Party, active battle pokemon and bag - see ram_structs.py
+        self.structs = PokemonStructs()
+        # Walkable tile lookup tables, cached per tileset
+        self.collision_map = CollisionMap()
+        # On-screen background tile identifiers, updated incrementally
+        self.background = GameArea()
+        # Visits per (map_id, x, y) across episodes, for count based exploration
+        self.visit_counts = VisitCounts()
 
         valid_actions: list[WindowEvent] = [
             WindowEvent.PRESS_ARROW_DOWN,
@@ -49,12 +120,56 @@ class PokemonEnvironment(PyboyEnvironment):
             valid_actions=valid_actions,
             release_button=release_button,
             headless=headless,
+            render_mode=render_mode,
+            observation_mode=observation_mode,
+            frame_size=frame_size,
+            frame_stack=frame_stack,
         )
 
     ##################################################################################
     ############################## ENVIRONMENT CONTRACT ##############################
     ##################################################################################
 
+    def reset(self) -> np.ndarray:
+        # Event flags of the new episode are the baseline for its first step
+        self.event_tracker.clear()
+        return super().reset()
+
+    def _start_emulator(self) -> "PyBoy":
+        pyboy = super()._start_emulator()
+        if self.rom_events is not None:
+            self.rom_events.register(pyboy)
+        return pyboy
+
+    def _invalidate_game_stats(self) -> None:
+        super()._invalidate_game_stats()
+        self._struct_stats = None
+        if self.rom_events is not None:
+            # restore() puts the events of the snapshot back afterwards
+            self.rom_events.clear()
+
+    def _get_episode_state(self) -> dict:
+        # Visit counts are kept across episodes and branches, they are not included
+        episode_state = super()._get_episode_state()
+        # Covers the frames of the last macro action and frame skip
+        episode_state["step_info"] = dict(self.step_info)
+        episode_state["event_tracker"] = self.event_tracker.get_state()
+        if self.rom_events is not None:
+            episode_state["rom_events"] = self.rom_events.get_state(
+                self.pyboy.frame_count
+            )
+        return episode_state
+
+    def _set_episode_state(self, episode_state: dict) -> None:
+        super()._set_episode_state(episode_state)
+        self.step_info = dict(episode_state["step_info"])
+        self.event_tracker.set_state(episode_state["event_tracker"])
+        if self.rom_events is not None:
+            # An event active at the snapshot still gates its rewards after restore
+            self.rom_events.set_state(
+                episode_state["rom_events"], self.pyboy.frame_count
+            )
+
     @cached_property
     def min_action_value(self) -> float:
         return 0
@@ -64,19 +179,21 @@ class PokemonEnvironment(PyboyEnvironment):
         return 1
 
     @cached_property
-    def observation_space(self) -> int:
+    def observation_space(self) -> int | tuple[int, int, int]:
+        if self.observation_mode == OBSERVATION_PIXELS:
+            return self.frame_stack.shape
         return len(self._get_state())
 
     @cached_property
     def action_num(self) -> int:
         if self.discrete:
-            return len(self.valid_actions)
+            return self._num_choices()
 
         return 1
 
     def sample_action(self) -> list[int]:
         if self.discrete:
-            length = len(self.valid_actions)
+            length = self._num_choices()
             random_index = np.random.randint(0, length)
             return random_index
 
@@ -85,7 +202,7 @@ class PokemonEnvironment(PyboyEnvironment):
     def _get_state(self) -> np.ndarray:
         # Implement your state retrieval logic here - compact state based representation
 
-        game_stats = self._generate_game_stats()
+        game_stats = self._get_game_stats()
         (state,) = (
             [
                 game_stats["location"]["x"],
@@ -105,28 +222,68 @@ class PokemonEnvironment(PyboyEnvironment):
 
         return state
 
+    def _num_choices(self) -> int:
+        if self.macro_runner is not None:
+            return len(MACRO_ACTIONS)
+        return len(self.valid_actions)
+
     def _run_action_on_emulator(self, action, actionable_ticks=5) -> None:
+        num_choices = self._num_choices()
         if self.discrete:
             pyboy_action_idx = action
         else:
             value = np.clip(action[0], 0.0, 0.9999999)
 
-            bin_width = 1.0 / len(self.valid_actions)
+            bin_width = 1.0 / num_choices
 
             pyboy_action_idx = int(value // bin_width)
 
-        if pyboy_action_idx >= len(self.valid_actions):
-            pyboy_action_idx = len(self.valid_actions) - 1
+        if pyboy_action_idx >= num_choices:
+            pyboy_action_idx = num_choices - 1
 
+        if self.macro_runner is not None:
+            frames = self.macro_runner.run(MACRO_ACTIONS[pyboy_action_idx])
+        else:
+            self._press_button(pyboy_action_idx)
+            frames = self.act_freq
+
+        skipped_frames = 0
+        if self.frame_skipper is not None:
+            skipped_frames = self.frame_skipper.run()
+        if self.rom_events is not None:
+            self.rom_events.take(self.pyboy.memory, self.pyboy.frame_count)
+        self.step_info = {
+            "frames": frames + skipped_frames,
+            "skipped_frames": skipped_frames,
+        }
+
+        self._record_visit()
+
+    def _press_button(self, pyboy_action_idx: int) -> None:
         # At 2 ticks the agent can change direction it is looking on the spot
         # At 3 ticks the behaviour is not consistent
         # At 4 and more ticks the agent can change direction only by moving in that direction
         action_ticks = 4
         self.pyboy.send_input(self.valid_actions[pyboy_action_idx])
-        self.pyboy.tick(action_ticks, render=False, sound=False)
+        self._tick(action_ticks, last=False)
 
         self.pyboy.send_input(self.release_button[pyboy_action_idx])
-        self.pyboy.tick(self.act_freq - action_ticks, sound=False)
+        self._tick(self.act_freq - action_ticks)
+
+    def _record_visit(self) -> None:
+        # Once per step, after the action - the reset location is not counted
+        self.visit_counts.visit(
+            self._read_m(0xD35E), self._read_m(0xD362), self._read_m(0xD361)
+        )
+
+    def set_visit_sharing(self, share: bool) -> None:
+        self.visit_counts.share = share
+
+    def take_visits(self) -> np.ndarray:
+        return self.visit_counts.take_visits()
+
+    def add_visits(self, visits: np.ndarray) -> None:
+        self.visit_counts.add_visits(visits)
 
     @abstractmethod
     def _calculate_reward(self, new_state: dict) -> float:
@@ -146,222 +303,107 @@ class PokemonEnvironment(PyboyEnvironment):
     ##################################################################################
 
     def _generate_game_stats(self) -> dict[str, any]:
+        ram = self._read_ram_schema()
         stats = {
-            "location": self._get_location(),
-            "battle_type": self._read_battle_type(),
-            "current_pokemon_id": self._get_active_pokemon_id(),
-            "current_pokemon_health": self._get_current_pokemon_health(),
-            "enemy_pokemon_health": self._get_enemy_pokemon_health(),
-            "party_size": self._get_party_size(),
-            "ids": self._read_party_id(),
-            "pokemon": [pkc.get_pokemon(id) for id in self._read_party_id()],
-            "levels": self._read_party_level(),
-            "type_id": self._read_party_type(),
-            "type": [pkc.get_type(id) for id in self._read_party_type()],
-            "hp": self._read_party_hp(),
-            "xp": self._read_party_xp(),
-            "status": self._read_party_status(),
-            "badges": self._get_badge_count(),
-            "caught_pokemon": self._read_caught_pokemon_count(),
-            "seen_pokemon": self._read_seen_pokemon_count(),
-            "money": self._read_money(),
-            "events": self._read_events(),
-            "items": self._read_items(),
+            "location": self._get_location(ram),
+            "battle_type": ram["battle_type"],
+            "party_size": ram["party_size"],
+            "ids": ram["ids"],
+            "pokemon": [pkc.get_pokemon(id) for id in ram["ids"]],
+            "badges": ram["badges"],
+            "caught_pokemon": ram["caught_pokemon"],
+            "seen_pokemon": ram["seen_pokemon"],
+            "money": ram["money"],
         }
+        stats.update(self._get_event_stats())
+        stats.update(self._get_struct_stats(ram["battle_type"]))
         return stats
 
-    def _get_location(self) -> dict[str, any]:
-        x_pos = self._read_m(0xD362)
-        y_pos = self._read_m(0xD361)
-        map_n = self._read_m(0xD35E)
+    def _get_struct_stats(self, battle_type: int) -> dict[str, any]:
+        # Party, battle and bag stats - reused outside of battle while the ROM hooks
+        # show nothing has changed them, see rom_events.py. The RAM schema fields are
+        # a few bytes and still decoded every step.
+        frame = self.pyboy.frame_count
+        if (
+            self.rom_events is not None
+            and self._struct_stats is not None
+            and battle_type == 0
+            and self._struct_stats[0] == 0
+            and frame - self._struct_stats[1] < STRUCT_FRAMES
+            and not self.rom_events.structs_changed()
+        ):
+            return self._struct_stats[2]
 
-        return {
-            "x": x_pos,
-            "y": y_pos,
-            "map_id": map_n,
-            "map": pkc.get_map_location(map_n),
+        structs = self._read_structs()
+        party = structs.party
+        # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/type_constants.asm
+        type_ids = party["type"].ravel().tolist()
+        struct_stats = {
+            "current_pokemon_id": int(structs.player["species"]),
+            "current_pokemon_health": int(structs.player["hp"]),
+            "enemy_pokemon_health": int(structs.enemy["hp"]),
+            "levels": party["level"].tolist(),
+            "type_id": type_ids,
+            "type": [pkc.get_type(id) for id in type_ids],
+            "hp": {"current": party["hp"].tolist(), "max": party["max_hp"].tolist()},
+            "xp": structs.party_exp().tolist(),
+            # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/status_constants.asm
+            "status": party["status"].tolist(),
+            # Fixed capacity copy of the bag - item/quantity per slot
+            "items": structs.bag.copy(),
         }
+        self._struct_stats = (battle_type, frame, struct_stats)
+        return struct_stats
 
-    def _get_party_size(self) -> int:
-        return self._read_m(0xD163)
+    def _read_structs(self) -> PokemonStructs:
+        self.structs.update(self.pyboy.memory)
+        return self.structs
 
-    def _get_badge_count(self) -> int:
-        return self._bit_count(self._read_m(0xD356))
+    def _get_event_stats(self) -> dict[str, any]:
+        # museum_ticket = (0xD754, 0)
+        tracker = self.event_tracker
+        tracker.update(self.pyboy.memory)
+        return {
+            # Set flags per byte of 0xD747 - 0xD886
+            "events": tracker.byte_counts(),
+            "event_count": tracker.count,
+            # Flag indexes (byte * 8 + bit) set since the last step
+            "new_events": tracker.newly_set.tolist(),
+        }
+
+    def _get_location(self, ram: dict[str, any]) -> dict[str, any]:
+        return {
+            "x": ram["x"],
+            "y": ram["y"],
+            "map_id": ram["map_id"],
+            "map": pkc.get_map_location(ram["map_id"]),
+        }
 
     def _is_in_grass_tile(self) -> bool:
         player_sprite_status = self._read_m(0xC207)
         return player_sprite_status == 0x80
 
-    def _get_pokeball_count(self, items) -> int:
-        total_count = 0
-
-        # Iterate through the dictionary of items the player (keys) has and their counts (values)
-        for itemId, count in items.items():
-            # Iterate through the types of Pokeballs. If the item (key) matches any of the Pokeball type ids, add the count to the total number of Pokeballs
-            if itemId in range(0x0, 0x5):
-                total_count += count
-
-        return total_count
-
-    def _read_party_id(self) -> list[int]:
-        # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/pokemon_constants.asm
-        return [
-            self._read_m(addr)
-            for addr in [0xD164, 0xD165, 0xD166, 0xD167, 0xD168, 0xD169]
-        ]
-
-    def _read_party_type(self) -> list[int]:
-        # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/type_constants.asm
-        return [
-            self._read_m(addr)
-            for addr in [
-                0xD170,
-                0xD171,
-                0xD19C,
-                0xD19D,
-                0xD1C8,
-                0xD1C9,
-                0xD1F4,
-                0xD1F5,
-                0xD220,
-                0xD221,
-                0xD24C,
-                0xD24D,
-            ]
-        ]
-
-    def _read_party_level(self) -> list[int]:
-        return [
-            self._read_m(addr)
-            for addr in [0xD18C, 0xD1B8, 0xD1E4, 0xD210, 0xD23C, 0xD268]
-        ]
-
-    def _read_party_status(self) -> list[int]:
-        # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/status_constants.asm
-        return [
-            self._read_m(addr)
-            for addr in [0xD16F, 0xD19B, 0xD1C7, 0xD1F3, 0xD21F, 0xD24B]
-        ]
+    def _get_pokeball_count(self, items: np.ndarray) -> int:
+        return pokeball_count(items)
 
-    def _read_party_hp(self) -> dict[str, list[int]]:
-        hp = [
-            self._read_hp(addr)
-            for addr in [0xD16C, 0xD198, 0xD1C4, 0xD1F0, 0xD21C, 0xD248]
-        ]
-        max_hp = [
-            self._read_hp(addr)
-            for addr in [0xD18D, 0xD1B9, 0xD1E5, 0xD211, 0xD23D, 0xD269]
-        ]
-        return {"current": hp, "max": max_hp}
-
-    def _read_party_xp(self) -> list[int]:
-        return [
-            self._read_triple(addr)
-            for addr in [0xD179, 0xD1A5, 0xD1D1, 0xD1FD, 0xD229, 0xD255]
-        ]
+    def _event_active(self, event: str) -> bool:
+        # Without ROM hooks any step may have had the event - see rom_events.py
+        return self.rom_events is None or self.rom_events.is_active(event)
 
-    def _read_hp(self, start: int) -> int:
-        return 256 * self._read_m(start) + self._read_m(start + 1)
+    def _get_screen_background_tilemap(self) -> np.ndarray:
+        # Background tilemap only, so NPCs are skipped - a view, see FrameStack.view
+        memory = self.pyboy.memory
+        return self.background.update(memory, register_scroll(memory))
 
-    def _read_caught_pokemon_count(self) -> int:
-        return sum(
-            list(self._bit_count(self._read_m(i)) for i in range(0xD2F7, 0xD30A))
+    def _get_screen_walkable_matrix(self) -> np.ndarray:
+        return self.collision_map.walkable_matrix(
+            self.pyboy.memory, self._get_screen_background_tilemap()
         )
 
-    def _read_seen_pokemon_count(self) -> int:
-        return sum(
-            list(self._bit_count(self._read_m(i)) for i in range(0xD30A, 0xD31D))
-        )
-
-    def _read_money(self) -> int:
-        return (
-            100 * 100 * self._read_bcd(self._read_m(0xD347))
-            + 100 * self._read_bcd(self._read_m(0xD348))
-            + self._read_bcd(self._read_m(0xD349))
-        )
-
-    def _read_events(self) -> list[int]:
-        event_flags_start = 0xD747
-        event_flags_end = 0xD886
-        # museum_ticket = (0xD754, 0)
-        # base_event_flags = 13
-        return [
-            self._bit_count(self._read_m(i))
-            for i in range(event_flags_start, event_flags_end)
-        ]
-
-    def _read_battle_type(self) -> int:
-        return self._read_m(0xD057)
-
-    def _read_items(self) -> dict[str, int]:
-        # returns a dictionary of owned items
-        # BROKEN (needs to be expressed in terms of its max capacity to avoid dictionary changing size and consequently input space)
-        total_items = self._read_m(0xD31D)
-        if total_items == 0:
-            return {}
-
-        addr = 0xD31E
-        items = {}
-
-        for i in range(total_items):
-            item_id = self._read_m(addr + 2 * i)
-            item_count = self._read_m(addr + 2 * i + 1)
-            items[f"item_{item_id}"] = item_count
-
-        return items
-
-    def _get_active_pokemon_id(self) -> int:
-        return self._read_m(0xD014)
-
-    def _get_enemy_pokemon_health(self) -> int:
-        return self._read_hp(0xCFE6)
-
-    def _get_current_pokemon_health(self) -> int:
-        return self._read_hp(0xD015)
-
-    def _get_screen_background_tilemap(self):
-        # SIMILAR TO CURRENT pyboy.game_wrapper()._game_area_np(), BUT ONLY FOR BACKGROUND TILEMAP, SO NPC ARE SKIPPED
-        bsm = self.pyboy.botsupport_manager()
-        ((scx, scy), (wx, wy)) = bsm.screen().tilemap_position()
-        tilemap = np.array(bsm.tilemap_background()[:, :])
-        return np.roll(np.roll(tilemap, -scy // 8, axis=0), -scx // 8, axis=1)[:18, :20]
-
-    def _get_screen_walkable_matrix(self):
-        walkable_tiles_indexes = []
-        collision_ptr = self.pyboy.get_memory_value(0xD530) + (
-            self.pyboy.get_memory_value(0xD531) << 8
+    def game_area_collision(self) -> np.ndarray:
+        return self.collision_map.collision_grid(
+            self.pyboy.memory, self._get_screen_background_tilemap()
         )
-        tileset_type = self.pyboy.get_memory_value(0xFFD7)
-        if tileset_type > 0:
-            grass_tile_index = self.pyboy.get_memory_value(0xD535)
-            if grass_tile_index != 0xFF:
-                walkable_tiles_indexes.append(grass_tile_index + 0x100)
-        for i in range(0x180):
-            tile_index = self.pyboy.get_memory_value(collision_ptr + i)
-            if tile_index == 0xFF:
-                break
-            else:
-                walkable_tiles_indexes.append(tile_index + 0x100)
-        screen_tiles = self._get_screen_background_tilemap()
-        bottom_left_screen_tiles = screen_tiles[1 : 1 + screen_tiles.shape[0] : 2, ::2]
-        walkable_matrix = np.isin(
-            bottom_left_screen_tiles, walkable_tiles_indexes
-        ).astype(np.uint8)
-        return walkable_matrix
-
-    def game_area_collision(self):
-        shape = (20, 18)
-        game_area_section = (0, 0) + shape
-        width = game_area_section[2]
-        height = game_area_section[3]
-
-        game_area = np.ndarray(shape=(height, width), dtype=np.uint32)
-        _collision = self._get_screen_walkable_matrix()
-        for i in range(height // 2):
-            for j in range(width // 2):
-                game_area[i * 2][j * 2 : j * 2 + 2] = _collision[i][j]
-                game_area[i * 2 + 1][j * 2 : j * 2 + 2] = _collision[i][j]
-        return game_area
 
     ##################################################################################
     ############################### BASE REWARD HELPERS ##############################
@@ -371,6 +413,9 @@ class PokemonEnvironment(PyboyEnvironment):
         self, new_state: dict[str, any], reward: float = 1
     ) -> float:
         # Does not consider any other method of acquiring pokeballs
+        if not self._event_active("bag_change"):
+            return 0
+
         previous_count = self._get_pokeball_count(self.prior_game_stats["items"])
         new_count = self._get_pokeball_count(new_state["items"])
 
@@ -382,7 +427,7 @@ class PokemonEnvironment(PyboyEnvironment):
     def _catch_pokemon_reward(
         self, new_state: dict[str, any], reward: float = 1, pokeball_thrown: bool = True
     ) -> float:
-        if not pokeball_thrown:
+        if not pokeball_thrown or not self._event_active("catch"):
             return 0
 
         previous_count = self.prior_game_stats["party_size"]
@@ -415,6 +460,9 @@ class PokemonEnvironment(PyboyEnvironment):
         self, new_state: dict[str, any], multiplier: float = 1
     ) -> float:
         reward = 0
+        if not self._event_active("level_up"):
+            return reward
+
         prev_levels = self.prior_game_stats["levels"]
         current_levels = new_state["levels"]
         for i, prev_level in enumerate(prev_levels):
@@ -429,6 +477,9 @@ class PokemonEnvironment(PyboyEnvironment):
     def _start_battle_reward(
         self, new_state: dict[str, any], reward: float = 1, battle_type: int = 1
     ) -> float:
+        if not self._event_active("battle_start"):
+            return 0
+
         if (
             new_state["battle_type"] == battle_type
             and self.prior_game_stats["battle_type"] == 0
@@ -439,6 +490,9 @@ class PokemonEnvironment(PyboyEnvironment):
     def _throw_pokeball_reward(
         self, new_state: dict[str, any], reward: float = 1
     ) -> float:
+        if not self._event_active("ball_throw"):
+            return 0
+
         previous_count = self._get_pokeball_count(self.prior_game_stats["items"])
         new_count = self._get_pokeball_count(new_state["items"])
 
@@ -506,5 +560,20 @@ class PokemonEnvironment(PyboyEnvironment):
     def _money_reward(self, new_state: dict[str, any]) -> float:
         return new_state["money"] - self.prior_game_stats["money"]
 
+    def _novelty_reward(self, new_state: dict[str, any], reward: float = 1) -> float:
+        # Count based exploration bonus - reward / sqrt(visits to the current tile)
+        location = new_state["location"]
+        return reward * self.visit_counts.novelty(
+            location["map_id"], location["x"], location["y"]
+        )
+
+    def _new_tile_reward(self, new_state: dict[str, any], reward: float = 1) -> float:
+        # Rewards the first visit of a tile, across episodes - see _record_visit
+        location = new_state["location"]
+        count = self.visit_counts.count(
+            location["map_id"], location["x"], location["y"]
+        )
+        return reward if count == 1 else 0
+
     def _event_reward(self, new_state: dict[str, any]) -> float:
-        return sum(new_state["events"]) - sum(self.prior_game_stats["events"])
+        return new_state["event_count"] - self.prior_game_stats["event_count"]
@@ -0,0 +1,109 @@
+# NumPy structured views over the party, battle pokemon and bag, each read with one
+# memory slice into a buffer the views update in place
+# https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/macros/ram.asm
+# https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/ram/wram.asm
+
+import numpy as np
+
+PARTY_SIZE = 6
+BAG_CAPACITY = 20
+
+PARTY_COUNT_ADDR = 0xD163
+PARTY_ADDR = 0xD16B  # wPartyMons
+PLAYER_BATTLE_MON_ADDR = 0xD014  # wBattleMon
+ENEMY_BATTLE_MON_ADDR = 0xCFE5  # wEnemyMon
+BAG_COUNT_ADDR = 0xD31D  # wNumBagItems, followed by the item/quantity pairs
+
+# https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/item_constants.asm
+POKEBALL_IDS = (0x01, 0x02, 0x03, 0x04)  # master, ultra, great, poke ball
+
+# party_struct - 44 bytes
+PARTY_MON_DTYPE = np.dtype(
+    [
+        ("species", "u1"),
+        ("hp", ">u2"),
+        ("box_level", "u1"),
+        ("status", "u1"),
+        ("type", "u1", (2,)),
+        ("catch_rate", "u1"),
+        ("moves", "u1", (4,)),
+        ("ot_id", ">u2"),
+        ("exp", "u1", (3,)),  # 24 bit big endian - see party_exp
+        ("stat_exp", ">u2", (5,)),
+        ("dvs", ">u2"),
+        ("pp", "u1", (4,)),
+        ("level", "u1"),
+        ("max_hp", ">u2"),
+        ("attack", ">u2"),
+        ("defense", ">u2"),
+        ("speed", ">u2"),
+        ("special", ">u2"),
+    ]
+)
+
+# battle_struct - 29 bytes
+BATTLE_MON_DTYPE = np.dtype(
+    [
+        ("species", "u1"),
+        ("hp", ">u2"),
+        ("party_pos", "u1"),
+        ("status", "u1"),
+        ("type", "u1", (2,)),
+        ("catch_rate", "u1"),
+        ("moves", "u1", (4,)),
+        ("dvs", ">u2"),
+        ("level", "u1"),
+        ("max_hp", ">u2"),
+        ("attack", ">u2"),
+        ("defense", ">u2"),
+        ("speed", ">u2"),
+        ("special", ">u2"),
+        ("pp", "u1", (4,)),
+    ]
+)
+
+BAG_ITEM_DTYPE = np.dtype([("item", "u1"), ("quantity", "u1")])
+
+EXP_WEIGHTS = np.array([256 * 256, 256, 1], dtype=np.int64)
+
+
+class PokemonStructs:
+    def __init__(self) -> None:
+        self._party = np.zeros(PARTY_SIZE * PARTY_MON_DTYPE.itemsize, dtype=np.uint8)
+        self._player = np.zeros(BATTLE_MON_DTYPE.itemsize, dtype=np.uint8)
+        self._enemy = np.zeros(BATTLE_MON_DTYPE.itemsize, dtype=np.uint8)
+        # Item count followed by the item/quantity pairs
+        self._bag = np.zeros(1 + BAG_CAPACITY * BAG_ITEM_DTYPE.itemsize, dtype=np.uint8)
+
+        self.party = self._party.view(PARTY_MON_DTYPE)
+        self.player = self._player.view(BATTLE_MON_DTYPE).reshape(())
+        self.enemy = self._enemy.view(BATTLE_MON_DTYPE).reshape(())
+        # Fixed capacity - empty slots read as item 0 (no item) with quantity 0
+        self.bag = self._bag[1:].view(BAG_ITEM_DTYPE)
+
+        self.party_size = 0
+        self.bag_size = 0
+
+    def update(self, memory) -> None:
+        self.party_size = min(memory[PARTY_COUNT_ADDR], PARTY_SIZE)
+        self._party[:] = memory[PARTY_ADDR : PARTY_ADDR + self._party.size]
+
+        self._player[:] = memory[
+            PLAYER_BATTLE_MON_ADDR : PLAYER_BATTLE_MON_ADDR + self._player.size
+        ]
+        self._enemy[:] = memory[
+            ENEMY_BATTLE_MON_ADDR : ENEMY_BATTLE_MON_ADDR + self._enemy.size
+        ]
+
+        self._bag[:] = memory[BAG_COUNT_ADDR : BAG_COUNT_ADDR + self._bag.size]
+        self.bag_size = min(int(self._bag[0]), BAG_CAPACITY)
+        # Slots past the item count hold the 0xFF terminator and stale data
+        self._bag[1 + 2 * self.bag_size :] = 0
+
+    def party_exp(self) -> np.ndarray:
+        return self.party["exp"] @ EXP_WEIGHTS
+
+
+def pokeball_count(bag: np.ndarray) -> int:
+    is_pokeball = np.isin(bag["item"], POKEBALL_IDS)
+    return int(bag["quantity"][is_pokeball].sum())
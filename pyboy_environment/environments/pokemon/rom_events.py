@@ -0,0 +1,117 @@
+# Game events recorded by hooks on pokered routines, resolved from the symbol file
+# next to the ROM, instead of found by diffing RAM. Events whose hooks are missing
+# are always active.
+# https://github.com/pret/pokered
+
+import logging
+from collections import Counter
+
+from pyboy_environment.environments.pokemon.macro_actions import FONT_LOADED_ADDR
+
+# Gifts, trades and the PC change the party through _AddPartyMon/_RemovePokemon/_MoveMon,
+# marts, the item PC and item gifts change the bag through the inventory routines
+ROM_HOOKS: dict[str, tuple[str, ...]] = {
+    "battle_start": ("InitBattle",),
+    "ball_throw": ("ItemUseBall",),
+    "catch": ("_AddEnemyMonToPlayerParty",),
+    "item_use": ("UseItem_",),
+    # Levels only go up through experience (in battle) or items
+    "level_up": ("GainExperience", "UseItem_"),
+    "map_load": ("LoadMapData",),
+    "party_change": (
+        "_AddPartyMon",
+        "_RemovePokemon",
+        "_MoveMon",
+        "SwitchPartyMon",
+        "HealParty",
+        "EvolutionAfterBattle",
+        "ApplyOutOfBattlePoisonDamage.applyDamageLoop",
+    ),
+    "bag_change": (
+        "AddItemToInventory_",
+        "RemoveItemFromInventory_",
+        "HandleItemListSwapping",
+    ),
+}
+
+# Events after which the party/bag are read again. Entering a map also rereads them,
+# to catch changes by routines that are not hooked.
+STRUCT_EVENTS = frozenset(
+    ("catch", "item_use", "level_up", "party_change", "bag_change", "map_load")
+)
+
+# A routine can wait on a text box before the RAM it is hooked for changes, so events
+# stay active while one is shown and for EVENT_FRAMES frames after
+EVENT_FRAMES = 300
+# Longest the party/bag stats are reused for without any event
+STRUCT_FRAMES = 600
+
+
+class RomEvents:
+    def __init__(self, hooks: dict[str, tuple[str, ...]] | None = None) -> None:
+        self.hooks = dict(ROM_HOOKS if hooks is None else hooks)
+        # Events with every one of their routines hooked
+        self.hooked: set[str] = set()
+
+        self.pending: Counter[str] = Counter()
+        # Events of the last step - see take
+        self.step: Counter[str] = Counter()
+        # Frame each active event was last fired or extended at
+        self.active: dict[str, int] = {}
+
+    def register(self, pyboy) -> None:
+        # A routine shared by several events gets one hook recording all of them
+        events_by_symbol: dict[str, list[str]] = {}
+        for event, symbols in self.hooks.items():
+            for symbol in symbols:
+                events_by_symbol.setdefault(symbol, []).append(event)
+
+        missing = set()
+        for symbol, events in events_by_symbol.items():
+            try:
+                pyboy.hook_register(None, symbol, self._record, events)
+            except ValueError:
+                logging.warning(f"No ROM hook for {', '.join(events)}: {symbol}")
+                missing.update(events)
+        self.hooked = set(self.hooks) - missing
+
+    def _record(self, events: list[str]) -> None:
+        self.pending.update(events)
+
+    def take(self, memory, frame: int) -> Counter[str]:
+        # Once per step, after the action
+        self.step = self.pending
+        self.pending = Counter()
+
+        text_shown = memory[FONT_LOADED_ADDR] & 1
+        for event in self.step:
+            self.active[event] = frame
+        for event, last_frame in list(self.active.items()):
+            if text_shown:
+                self.active[event] = frame
+            elif frame - last_frame > EVENT_FRAMES:
+                del self.active[event]
+        return self.step
+
+    def clear(self) -> None:
+        # RAM changed without the game running (reset, load_state)
+        self.pending = Counter()
+        self.step = Counter()
+        self.active.clear()
+
+    def get_state(self, frame: int) -> tuple:
+        # Active events are kept by age, pyboy's frame count is not part of a save state
+        ages = {event: frame - last_frame for event, last_frame in self.active.items()}
+        return (self.step.copy(), ages)
+
+    def set_state(self, state: tuple, frame: int) -> None:
+        step, ages = state
+        self.pending = Counter()
+        self.step = step.copy()
+        self.active = {event: frame - age for event, age in ages.items()}
+
+    def is_active(self, event: str) -> bool:
+        return event not in self.hooked or event in self.active
+
+    def structs_changed(self) -> bool:
+        return any(self.is_active(event) for event in STRUCT_EVENTS)
@@ -35,6 +35,13 @@ class PokemonBrock(PokemonEnvironment):
         emulation_speed: int = 0,
         headless: bool = False,
         discrete: bool = False,
+        render_mode: str = "last",
+        observation_mode: str = "ram",
+        frame_size: tuple[int, int] = (84, 84),
+        frame_stack: int = 3,
+        macro_actions: bool = False,
+        frame_skip: bool = False,
+        rom_hooks: bool = False,
     ) -> None:
         self.tasks = [0] * NUM_TASKS
         self.tasks[0] = 1
@@ -46,9 +53,27 @@ class PokemonBrock(PokemonEnvironment):
             init_name="has_pokedex.state",
             emulation_speed=emulation_speed,
             headless=headless,
+            render_mode=render_mode,
+            observation_mode=observation_mode,
+            frame_size=frame_size,
+            frame_stack=frame_stack,
+            macro_actions=macro_actions,
+            frame_skip=frame_skip,
+            rom_hooks=rom_hooks,
             discrete=discrete,
         )
 
+    def _get_episode_state(self) -> dict:
+        episode_state = super()._get_episode_state()
+        episode_state["tasks"] = list(self.tasks)
+        episode_state["current_task"] = self.current_task
+        return episode_state
+
+    def _set_episode_state(self, episode_state: dict) -> None:
+        super()._set_episode_state(episode_state)
+        self.tasks[:] = episode_state["tasks"]
+        self.current_task = episode_state["current_task"]
+
     ################################################################
     ########################### Game Info ##########################
     ################################################################
@@ -67,7 +92,7 @@ class PokemonBrock(PokemonEnvironment):
     def _select_task(self, game_stats: dict) -> int:
         if game_stats["levels"][0] < 8:
             return 0  # fight
-        elif game_stats["party_size"] < 3 and self._get_num_pokeballs() < 10:
+        elif game_stats["party_size"] < 3 and game_stats["num_pokeballs"] < 10:
             if game_stats["map_id"] != 1 and game_stats["map_id"] != 0x2A:
                 return 1  # enter pokemart village
             elif game_stats["map_id"] == 1:
@@ -93,39 +118,17 @@ class PokemonBrock(PokemonEnvironment):
 
         return True
 
-    def _get_location(self) -> dict[str, any]:
+    def _get_location(self, ram: dict[str, any]) -> dict[str, any]:
         # OVERRIDE to remove map name (string)
-        x_pos = self._read_m(0xD362)
-        y_pos = self._read_m(0xD361)
-        map_n = self._read_m(0xD35E)
-
         return {
-            "x": x_pos,
-            "y": y_pos,
-            "map_id": map_n,
+            "x": ram["x"],
+            "y": ram["y"],
+            "map_id": ram["map_id"],
         }
 
-    def _get_current_selected_menu_item(self) -> int:
-        return self._read_m(0xCC26)
-
     def _get_index_current_pokemon(self) -> int:
         return self._read_m(0xCC2F)
 
-    def _get_current_pokemon_id(self) -> int:
-        return self._read_m(0xD014)
-
-    def _get_num_pokeballs(self) -> int:
-        items = self._read_items()
-        keys = items.keys()
-        num_pokeballs = 0
-
-        for i in range(0x5):
-            key = f"item_{i}"
-            if key in keys:
-                num_pokeballs += items[key]
-
-        return num_pokeballs
-
     ################################################################
     ######################## Training Info #########################
     ################################################################
@@ -137,23 +140,27 @@ class PokemonBrock(PokemonEnvironment):
         }
 
     def _generate_game_stats(self) -> dict[str, any]:
+        ram = self._read_ram_schema()
+        structs = self._read_structs()
+        party = structs.party
 
         game_stats = {
-            **self._get_location(),
-            "in_grass": self._is_in_grass_tile(),
-            "party_size": self._get_party_size(),
-            "ids": self._read_party_id(),
-            "levels": self._read_party_level(),
-            **self._read_party_hp(),
-            "xp": self._read_party_xp(),
-            "status": self._read_party_status(),
-            "badges": self._get_badge_count(),
-            "money": self._read_money(),
-            "battle_type": self._read_battle_type(),
-            "enemy_pokemon_health": self._get_enemy_pokemon_health(),
-            "current_pokemon_id": self._get_current_pokemon_id(),
-            "num_pokeballs": self._get_num_pokeballs(),
-            "current_selected_menu_item": self._get_current_selected_menu_item(),
+            **self._get_location(ram),
+            "in_grass": ram["player_sprite_status"] == 0x80,
+            "party_size": ram["party_size"],
+            "ids": ram["ids"],
+            "levels": party["level"].tolist(),
+            "current": party["hp"].tolist(),
+            "max": party["max_hp"].tolist(),
+            "xp": structs.party_exp().tolist(),
+            "status": party["status"].tolist(),
+            "badges": ram["badges"],
+            "money": ram["money"],
+            "battle_type": ram["battle_type"],
+            "enemy_pokemon_health": int(structs.enemy["hp"]),
+            "current_pokemon_id": int(structs.player["species"]),
+            "num_pokeballs": self._get_pokeball_count(structs.bag),
+            "current_selected_menu_item": ram["current_selected_menu_item"],
         }
 
         self._set_tasks(game_stats)
@@ -161,7 +168,7 @@ class PokemonBrock(PokemonEnvironment):
         return game_stats
 
     def _get_state(self) -> np.ndarray:
-        game_stats = self._generate_game_stats()
+        game_stats = self._get_game_stats()
         state = self._get_state_from_stats(game_stats)
         return state
 
@@ -221,8 +228,8 @@ class PokemonBrock(PokemonEnvironment):
             return 0
 
     def _reward_task_buy_pokeball(self, new_state: dict) -> float:
-        delta_pokeball = self._get_num_pokeballs(new_state) - self._get_num_pokeballs(
-            self.prior_game_stats
+        delta_pokeball = (
+            new_state["num_pokeballs"] - self.prior_game_stats["num_pokeballs"]
         )
         if delta_pokeball > 0:
             return delta_pokeball * PURCHASE_POKEBALL_MULTIPLIER
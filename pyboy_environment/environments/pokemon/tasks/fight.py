@@ -22,6 +22,13 @@ class PokemonFight(PokemonEnvironment):
         emulation_speed: int = 0,
         headless: bool = False,
         discrete: bool = False,
+        render_mode: str = "last",
+        observation_mode: str = "ram",
+        frame_size: tuple[int, int] = (84, 84),
+        frame_stack: int = 3,
+        macro_actions: bool = False,
+        frame_skip: bool = False,
+        rom_hooks: bool = False,
     ) -> None:
 
         super().__init__(
@@ -30,6 +37,13 @@ class PokemonFight(PokemonEnvironment):
             init_name="has_pokedex.state",
             emulation_speed=emulation_speed,
             headless=headless,
+            render_mode=render_mode,
+            observation_mode=observation_mode,
+            frame_size=frame_size,
+            frame_stack=frame_stack,
+            macro_actions=macro_actions,
+            frame_skip=frame_skip,
+            rom_hooks=rom_hooks,
             discrete=discrete,
         )
 
@@ -0,0 +1,136 @@
+# Visit counts per (map_id, x, y) for count based exploration, one uint16 grid per map.
+# With share set, visits can be passed between the environments of a
+# VecPyboyEnvironment - see enable_visit_sharing.
+
+import numpy as np
+
+MAX_COUNT = np.iinfo(np.uint16).max
+MAX_COORDINATE = 256
+INITIAL_SIZE = 32
+
+EMPTY_VISITS = np.zeros((0, 3), dtype=np.uint8)
+
+
+def _grown_size(size: int, coordinate: int) -> int:
+    while size <= coordinate:
+        size *= 2
+    return min(size, MAX_COORDINATE)
+
+
+class VisitCounts:
+    def __init__(self, share: bool = False) -> None:
+        self.grids: dict[int, np.ndarray] = {}
+        # Number of distinct (map_id, x, y) visited
+        self.coverage = 0
+        # Keeps the visits for take_visits - see share_visits
+        self.share = share
+        self._visits: list[tuple[int, int, int]] = []
+
+    def clear(self) -> None:
+        self.grids = {}
+        self.coverage = 0
+        self._visits = []
+
+    def visit(self, map_id: int, x: int, y: int) -> int:
+        grid = self._grid(map_id, x, y)
+        count = grid[y, x]
+        if count == 0:
+            self.coverage += 1
+        if count < MAX_COUNT:
+            count += 1
+            grid[y, x] = count
+        if self.share:
+            self._visits.append((map_id, x, y))
+        return int(count)
+
+    def count(self, map_id: int, x: int, y: int) -> int:
+        grid = self.grids.get(map_id)
+        if grid is None or y >= grid.shape[0] or x >= grid.shape[1]:
+            return 0
+        return int(grid[y, x])
+
+    def novelty(self, map_id: int, x: int, y: int) -> float:
+        # 1 / sqrt(n) count based bonus, 1 for a tile that has not been visited
+        return 1.0 / np.sqrt(max(self.count(map_id, x, y), 1))
+
+    def map_coverage(self) -> dict[int, int]:
+        return {
+            map_id: int(np.count_nonzero(grid)) for map_id, grid in self.grids.items()
+        }
+
+    def take_visits(self) -> np.ndarray:
+        # (N, 3) uint8 array of the (map_id, x, y) visits made since the last call
+        visits = np.array(self._visits, dtype=np.uint8).reshape(-1, 3)
+        self._visits = []
+        return visits if visits.size else EMPTY_VISITS
+
+    def add_visits(self, visits: np.ndarray) -> None:
+        # Applies visits made elsewhere - these are not returned by take_visits
+        visits = np.asarray(visits, dtype=np.intp).reshape(-1, 3)
+        for map_id in np.unique(visits[:, 0]):
+            map_visits = visits[visits[:, 0] == map_id]
+            x, y = map_visits[:, 1], map_visits[:, 2]
+            grid = self._grid(int(map_id), int(x.max()), int(y.max()))
+            added = np.zeros(grid.shape, dtype=np.int64)
+            np.add.at(added, (y, x), 1)
+            self._add(grid, added)
+
+    def merge(self, other: "VisitCounts") -> None:
+        for map_id, other_grid in other.grids.items():
+            rows, columns = other_grid.shape
+            grid = self._grid(map_id, columns - 1, rows - 1)
+            added = np.zeros(grid.shape, dtype=np.int64)
+            added[:rows, :columns] = other_grid
+            self._add(grid, added)
+
+    def get_state(self) -> dict:
+        return {
+            "grids": {map_id: grid.copy() for map_id, grid in self.grids.items()},
+            "coverage": self.coverage,
+        }
+
+    def set_state(self, state: dict) -> None:
+        self.grids = {map_id: grid.copy() for map_id, grid in state["grids"].items()}
+        self.coverage = state["coverage"]
+        self._visits = []
+
+    def _add(self, grid: np.ndarray, added: np.ndarray) -> None:
+        self.coverage += int(np.count_nonzero((grid == 0) & (added > 0)))
+        np.minimum(grid + added, MAX_COUNT, out=added)
+        grid[...] = added
+
+    def _grid(self, map_id: int, x: int, y: int) -> np.ndarray:
+        grid = self.grids.get(map_id)
+        if grid is None:
+            grid = np.zeros(
+                (_grown_size(INITIAL_SIZE, y), _grown_size(INITIAL_SIZE, x)),
+                dtype=np.uint16,
+            )
+            self.grids[map_id] = grid
+        elif y >= grid.shape[0] or x >= grid.shape[1]:
+            rows, columns = grid.shape
+            grown = np.zeros(
+                (_grown_size(rows, y), _grown_size(columns, x)), dtype=np.uint16
+            )
+            grown[:rows, :columns] = grid
+            grid = grown
+            self.grids[map_id] = grid
+        return grid
+
+
+def enable_visit_sharing(vec_env) -> None:
+    vec_env.call("set_visit_sharing", True)
+
+
+def share_visits(vec_env) -> None:
+    # Gives every worker of a VecPyboyEnvironment the visits the other workers made
+    # since the last call, so all of them count visits over one global map.
+    # Requires enable_visit_sharing to have been called first.
+    visits = vec_env.call("take_visits")
+    offsets = np.cumsum([0] + [len(worker_visits) for worker_visits in visits])
+    combined = np.concatenate(visits)
+    others = [
+        np.concatenate([combined[:start], combined[end:]])
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+    vec_env.call_each("add_visits", others)
@@ -1,14 +1,43 @@
 from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
 
+import io
 import logging
+import os
 import cv2
+from typing import TYPE_CHECKING
+
 import numpy as np
-from pyboy import PyBoy
+
+from pyboy_environment.environments.frame_stack import FrameStack
+from pyboy_environment.environments.ram_condition import RamCondition, RamPredicate
+from pyboy_environment.environments.ram_schema import RamSchema
+from pyboy_environment.environments.step_metrics import StepMetrics
 
 import signal
 
+if TYPE_CHECKING:
+    from pyboy import PyBoy
+
+# When the PPU renders the screen while ticking the emulator.
+# Observations are RAM/tilemap based, the screen is only needed for grab_frame.
+RENDER_NEVER = "never"
+RENDER_LAST = "last"  # only the final frame of each step
+RENDER_ALWAYS = "always"
+RENDER_MODES = (RENDER_NEVER, RENDER_LAST, RENDER_ALWAYS)
+
+# What step/reset return as the state
+OBSERVATION_RAM = "ram"  # the task's compact RAM/tilemap based _get_state
+OBSERVATION_PIXELS = "pixels"  # stacked grayscale screen frames - see frame_stack.py
+OBSERVATION_MODES = (OBSERVATION_RAM, OBSERVATION_PIXELS)
+
+
+def config_dir() -> str:
+    # ROMs and task init states - CARES_RL_CONFIGS points at an alternative (e.g. fixture) directory
+    return os.environ.get("CARES_RL_CONFIGS", f"{Path.home()}/cares_rl_configs")
+
 
 def sig_handler(signum, frame):
     logging.info("Seg faulted :(")
@@ -16,7 +45,15 @@ def sig_handler(signum, frame):
     raise RuntimeError("Seg fault")
 
 
+@dataclass(frozen=True)
+class EnvironmentSnapshot:
+    emulator_state: bytes
+    episode_state: dict
+
+
 class PyboyEnvironment(metaclass=ABCMeta):
+    # Declarative description of the RAM values used for game stats - see ram_schema.py
+    ram_schema: RamSchema | None = None
 
     def __init__(
         self,
@@ -29,16 +66,23 @@ class PyboyEnvironment(metaclass=ABCMeta):
         release_button: list,
         emulation_speed: int = 0,
         headless: bool = False,
+        render_mode: str = RENDER_LAST,
+        observation_mode: str = OBSERVATION_RAM,
+        frame_size: tuple[int, int] = (84, 84),
+        frame_stack: int = 3,
     ) -> None:
         signal.signal(signal.SIGSEGV, sig_handler)
 
         self.task = task
         self.domain = domain
 
-        path = f"{Path.home()}/cares_rl_configs/{self.domain}"
+        path = f"{config_dir()}/{self.domain}"
         self.rom_path = f"{path}/{rom_name}"
         self.init_path = f"{path}/task_init_states/{init_state_file_name}"
 
+        # Raw bytes of every state file loaded so far, keyed by path
+        self._state_cache: dict[str, bytes] = {}
+
         self.combo_actions = 0
 
         self.valid_actions = valid_actions
@@ -49,66 +93,246 @@ class PyboyEnvironment(metaclass=ABCMeta):
 
         self.headless = headless
 
-        head = "null" if headless else "SDL2"
-        self.pyboy = PyBoy(
-            self.rom_path,
-            window=head,
-            sound_emulated=False,
-            no_input=True,
-        )
+        if render_mode not in RENDER_MODES:
+            raise ValueError(
+                f"Unknown render mode: {render_mode}, expected one of {RENDER_MODES}"
+            )
+        self.render_mode = render_mode
+
+        if observation_mode not in OBSERVATION_MODES:
+            raise ValueError(
+                f"Unknown observation mode: {observation_mode}, expected one of {OBSERVATION_MODES}"
+            )
+        if observation_mode == OBSERVATION_PIXELS and render_mode == RENDER_NEVER:
+            raise ValueError("Pixel observations require the screen to be rendered")
+        self.observation_mode = observation_mode
+        self.frame_stack = FrameStack(*frame_size, num_frames=frame_stack)
+
+        self.emulation_speed = emulation_speed
+
+        # The emulator is only built on first use (normally the first reset) - see pyboy
+        self._pyboy: "PyBoy | None" = None
 
-        self.prior_game_stats = self._generate_game_stats()
-        self.screen = self.pyboy.screen
+        # Per-phase step/reset timings, disabled by default - env.metrics.enable()
+        self.metrics = StepMetrics()
+
+        # Decoded game stats are cached per emulator frame - see _get_game_stats
+        self._game_stats = None
+        self._game_stats_frame = -1
+
+        self.prior_game_stats = None
 
         self.steps = 0
 
         self.seed = 0
 
-        self.pyboy.set_emulation_speed(emulation_speed)
+    @property
+    def pyboy(self) -> "PyBoy":
+        if self._pyboy is None:
+            self._pyboy = self._start_emulator()
+        return self._pyboy
+
+    @property
+    def screen(self):
+        return self.pyboy.screen
 
-        self.reset()
+    def _start_emulator(self) -> "PyBoy":
+        # Imported here as pyboy (and SDL2) dominate import time and are not needed
+        # until an environment actually runs
+        from pyboy import PyBoy
+
+        head = "null" if self.headless else "SDL2"
+        pyboy = PyBoy(
+            self.rom_path,
+            window=head,
+            sound_emulated=False,
+            no_input=True,
+        )
+        pyboy.set_emulation_speed(self.emulation_speed)
+        return pyboy
 
     def set_seed(self, seed: int) -> None:
         self.seed = seed
         # There isn't a random element to set that I am aware of...
 
     def reset(self) -> np.ndarray:
+        self.metrics.end_episode()
+        return self.metrics.measure("reset", self._reset)
+
+    def _reset(self) -> np.ndarray:
         self.steps = 0
 
-        with open(self.init_path, "rb") as f:
-            self.pyboy.load_state(f)
+        self._load_state(self.init_path)
+
+        if self.observation_mode == OBSERVATION_PIXELS:
+            # The screen buffer is not part of a saved state, render one frame to fill it
+            self._tick(1)
 
-        self.prior_game_stats = self._generate_game_stats()
+        self.prior_game_stats = self._get_game_stats()
 
+        if self.observation_mode == OBSERVATION_PIXELS:
+            return self.frame_stack.reset(self.screen.ndarray)
         return self._get_state()
 
-    def grab_frame(self, height: int = 240, width: int = 300) -> np.ndarray:
-        frame = np.array(self.screen.image)
-        frame = cv2.resize(frame, (width, height))
-        # Convert to BGR for use with OpenCV
-        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-        return frame
+    def preload_states(self, paths: list[str]) -> None:
+        # Read extra start states up front so switching init_path never touches disk
+        for path in paths:
+            self._read_state(path)
+
+    def _read_state(self, path: str) -> bytes:
+        if path not in self._state_cache:
+            with open(path, "rb") as f:
+                self._state_cache[path] = f.read()
+        return self._state_cache[path]
+
+    def _load_state(self, path: str) -> None:
+        self.pyboy.load_state(io.BytesIO(self._read_state(path)))
+        self._invalidate_game_stats()
+
+    def snapshot(self) -> EnvironmentSnapshot:
+        # In-memory branch point for tree search - restore() can be called on it any number of times
+        with io.BytesIO() as f:
+            self.pyboy.save_state(f)
+            emulator_state = f.getvalue()
+        return EnvironmentSnapshot(emulator_state, self._get_episode_state())
+
+    def restore(self, snapshot: EnvironmentSnapshot) -> None:
+        self.pyboy.load_state(io.BytesIO(snapshot.emulator_state))
+        self._invalidate_game_stats()
+        self._set_episode_state(snapshot.episode_state)
+
+    def _get_episode_state(self) -> dict:
+        # Game stats dicts are never modified after they are generated so can be shared.
+        # Subclasses with extra episode fields extend this and _set_episode_state.
+        episode_state = {"steps": self.steps, "prior_game_stats": self.prior_game_stats}
+        if self.observation_mode == OBSERVATION_PIXELS:
+            # The stacked frames from before the snapshot belong to its branch
+            episode_state["frame_stack"] = self.frame_stack.get_state()
+        if self.metrics.enabled:
+            episode_state["metrics"] = self.metrics.get_state()
+        return episode_state
+
+    def _set_episode_state(self, episode_state: dict) -> None:
+        self.steps = episode_state["steps"]
+        self.prior_game_stats = episode_state["prior_game_stats"]
+        if "frame_stack" in episode_state:
+            self.frame_stack.set_state(episode_state["frame_stack"])
+        if "metrics" in episode_state:
+            self.metrics.set_state(episode_state["metrics"])
+
+    def close(self) -> None:
+        if self._pyboy is not None:
+            self._pyboy.stop(save=False)
+            self._pyboy = None
+
+    def grab_frame(
+        self, height: int = 240, width: int = 300, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        # BGR for use with OpenCV, a new array unless written into out
+        frame = cv2.cvtColor(self.screen.ndarray, cv2.COLOR_RGBA2BGR)
+        return cv2.resize(frame, (width, height), dst=out)
 
     def game_area(self) -> np.ndarray:
         return self.pyboy.game_area()
 
     def step(self, action) -> tuple:
+        return self.metrics.measure("step", self._step, action)
+
+    def _step(self, action) -> tuple:
+        if self.prior_game_stats is None:
+            # Stepping before the first reset starts from the task's init state
+            self.reset()
+
+        # Each phase goes through metrics.measure, which only times it when metrics are enabled
+        measure = self.metrics.measure
         self.steps += 1
 
-        self._run_action_on_emulator(action)
+        measure("run_action", self._run_action_on_emulator, action)
 
-        state = self._get_state()
+        state = measure("get_state", self._get_observation)
 
-        current_game_stats = self._generate_game_stats()
-        reward = self._calculate_reward(current_game_stats)
+        current_game_stats = self._get_game_stats()
+        reward = measure("reward", self._calculate_reward, current_game_stats)
 
-        done = self._check_if_done(current_game_stats)
-        truncated = self._check_if_truncated(current_game_stats)
+        done = measure("done", self._check_if_done, current_game_stats)
+        truncated = measure("truncated", self._check_if_truncated, current_game_stats)
 
         self.prior_game_stats = current_game_stats
 
         return state, reward, done, truncated
 
+    def _get_observation(self) -> np.ndarray:
+        if self.observation_mode == OBSERVATION_PIXELS:
+            return self.frame_stack.push(self.screen.ndarray)
+        return self._get_state()
+
+    def _get_game_stats(self) -> dict:
+        # RAM only changes when the emulator ticks, so every call within one step
+        # (state, reward, done, truncated, overlay info) shares a single decode
+        frame = self.pyboy.frame_count
+        if self._game_stats_frame != frame:
+            self._game_stats = self.metrics.measure(
+                "game_stats", self._generate_game_stats
+            )
+            self._game_stats_frame = frame
+        return self._game_stats
+
+    def _invalidate_game_stats(self) -> None:
+        # Required whenever RAM changes without a tick (e.g. load_state)
+        self._game_stats_frame = -1
+
+    def _tick(self, count: int, last: bool = True) -> None:
+        # Advances the emulator count frames in as few pyboy.tick calls as the render mode allows.
+        # last marks the final batch of ticks in a step, which is the one rendered in RENDER_LAST.
+        if count <= 0:
+            return
+
+        if self.render_mode == RENDER_ALWAYS:
+            for _ in range(count):
+                self.pyboy.tick(1, render=True, sound=False)
+        else:
+            render = self.render_mode == RENDER_LAST and last
+            self.pyboy.tick(count, render=render, sound=False)
+
+    def tick_until(
+        self,
+        predicate: RamPredicate | list[RamCondition | tuple],
+        max_frames: int,
+        check_every: int = 1,
+    ) -> int:
+        # Ticks check_every frames at a time until predicate holds or max_frames have
+        # run, and returns the frames run - 0 if it already holds. A list of conditions
+        # must all hold.
+        if not isinstance(predicate, RamPredicate):
+            predicate = RamPredicate(predicate)
+
+        memory = self.pyboy.memory
+        predicate.start(memory)
+        if predicate(memory):
+            return 0
+
+        # RENDER_LAST only renders the final frame, so the predicate is checked one
+        # frame before each chunk ends and the frame after it holds is also run
+        lookahead = self.render_mode == RENDER_LAST
+
+        frames = 0
+        while frames < max_frames:
+            count = min(check_every, max_frames - frames)
+            frames += count
+            if lookahead:
+                self._tick(count - 1, last=False)
+                finished = frames == max_frames or predicate(memory)
+                self._tick(1, last=finished)
+            else:
+                self._tick(count, last=False)
+                finished = predicate(memory)
+            if finished:
+                break
+        return frames
+
+    def _read_ram_schema(self) -> dict[str, int | list[int]]:
+        return self.ram_schema.decode(self.pyboy.memory)
+
     def _read_m(self, addr: int) -> int:
         return self.pyboy.memory[addr]
 
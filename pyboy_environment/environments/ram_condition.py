@@ -0,0 +1,70 @@
+# RAM conditions for PyboyEnvironment.tick_until, compiled once into closures.
+# op="changed" compares against the value read when the predicate was started.
+
+import operator
+from dataclasses import dataclass
+from typing import Callable
+
+COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+OPS = tuple(COMPARISONS) + ("changed",)
+
+
+@dataclass(frozen=True)
+class RamCondition:
+    addr: int
+    mask: int = 0xFF
+    op: str = "=="
+    value: int = 0
+
+    def __post_init__(self) -> None:
+        if self.op not in OPS:
+            raise ValueError(f"Unknown op: {self.op}, expected one of {OPS}")
+
+
+class RamPredicate:
+    def __init__(
+        self,
+        conditions: list[RamCondition | tuple],
+        any_of: bool = False,
+    ) -> None:
+        if not conditions:
+            raise ValueError("A RamPredicate needs at least one condition")
+        self.conditions = [
+            c if isinstance(c, RamCondition) else RamCondition(*c) for c in conditions
+        ]
+        self.any_of = any_of
+
+        terms = [_compile(i, condition) for i, condition in enumerate(self.conditions)]
+        if len(terms) == 1:
+            self._function = terms[0]
+        elif any_of:
+            self._function = lambda m, b: any(term(m, b) for term in terms)
+        else:
+            self._function = lambda m, b: all(term(m, b) for term in terms)
+        self._baseline: tuple[int, ...] = (0,) * len(self.conditions)
+
+    def start(self, memory) -> None:
+        # Records the values "changed" conditions compare against
+        self._baseline = tuple(
+            memory[condition.addr] & condition.mask for condition in self.conditions
+        )
+
+    def __call__(self, memory) -> bool:
+        return self._function(memory, self._baseline)
+
+
+def _compile(index: int, condition: RamCondition) -> Callable[..., bool]:
+    # (memory, baseline) -> bool for one condition
+    addr, mask = condition.addr, condition.mask
+    if condition.op == "changed":
+        return lambda m, b: m[addr] & mask != b[index]
+
+    compare, value = COMPARISONS[condition.op], condition.value
+    return lambda m, b: compare(m[addr] & mask, value)
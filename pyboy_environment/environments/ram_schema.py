@@ -0,0 +1,168 @@
+# Declarative RAM fields, decoded from a few bulk memory slices per step
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Number of set bits for every possible byte value
+POPCOUNT_TABLE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(
+    axis=1, dtype=np.int64
+)
+
+ENCODINGS = ("uint", "bcd", "digits", "bitcount", "raw")
+
+
+@dataclass(frozen=True)
+class RamField:
+    """
+    name: key of the decoded value
+    addr: address of the first byte
+    width: bytes per value
+    encoding: uint (u8/u16/u24), bcd (two decimal digits per byte), digits (one
+        decimal digit per byte), bitcount (set bits across width) or raw (each byte)
+    endian: byte order of multi-byte values - "big" or "little"
+    count: number of values; a count above 1 decodes to a list
+    stride: bytes between consecutive values, defaults to width
+    """
+
+    name: str
+    addr: int
+    width: int = 1
+    encoding: str = "uint"
+    endian: str = "big"
+    count: int = 1
+    stride: int | None = None
+
+    def addresses(self) -> np.ndarray:
+        stride = self.width if self.stride is None else self.stride
+        starts = self.addr + stride * np.arange(self.count)
+        return starts[:, None] + np.arange(self.width)[None, :]
+
+
+def _decode_uint(data: np.ndarray, endian: str) -> np.ndarray:
+    return data @ _weights(256, data.shape[1], endian)
+
+
+def _decode_bcd(data: np.ndarray, endian: str) -> np.ndarray:
+    digits = (data >> 4) * 10 + (data & 0x0F)
+    return digits @ _weights(100, data.shape[1], endian)
+
+
+def _decode_digits(data: np.ndarray, endian: str) -> np.ndarray:
+    return data @ _weights(10, data.shape[1], endian)
+
+
+def _decode_bitcount(data: np.ndarray, _: str) -> np.ndarray:
+    return POPCOUNT_TABLE[data].sum(axis=1)
+
+
+def _decode_raw(data: np.ndarray, _: str) -> np.ndarray:
+    return data.reshape(-1)
+
+
+def _weights(base: int, width: int, endian: str) -> np.ndarray:
+    weights = base ** np.arange(width, dtype=np.int64)
+    return weights[::-1] if endian == "big" else weights
+
+
+DECODERS = {
+    "uint": _decode_uint,
+    "bcd": _decode_bcd,
+    "digits": _decode_digits,
+    "bitcount": _decode_bitcount,
+    "raw": _decode_raw,
+}
+
+
+class RamSchema:
+    def __init__(self, fields: list[RamField], max_gap: int = 32) -> None:
+        names = [field.name for field in fields]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate field names in RAM schema: {names}")
+
+        for field in fields:
+            if field.encoding not in DECODERS:
+                raise ValueError(
+                    f"Unknown encoding {field.encoding} for {field.name}, expected one of {ENCODINGS}"
+                )
+            if field.endian not in ("big", "little"):
+                raise ValueError(f"Unknown endianness {field.endian} for {field.name}")
+
+        self.fields = fields
+        self.segments = self._build_segments(fields, max_gap)
+
+        # Position of every address inside the concatenated segment buffer
+        size = sum(stop - start for start, stop in self.segments)
+        self._buffer = np.zeros(size, dtype=np.int64)
+        self._offsets = []
+        offset = 0
+        for start, stop in self.segments:
+            self._offsets.append(offset)
+            offset += stop - start
+
+        self._groups = self._build_groups(fields)
+
+    @property
+    def names(self) -> list[str]:
+        return [field.name for field in self.fields]
+
+    def decode(self, memory) -> dict[str, int | list[int]]:
+        return self.decode_buffer(self.read(memory))
+
+    def read(self, memory) -> np.ndarray:
+        # Bulk read every segment into the reusable buffer
+        for (start, stop), offset in zip(self.segments, self._offsets):
+            self._buffer[offset : offset + stop - start] = memory[start:stop]
+        return self._buffer
+
+    def decode_buffer(self, buffer: np.ndarray) -> dict[str, int | list[int]]:
+        values = {}
+        for encoding, endian, indices, fields, splits in self._groups:
+            decoded = DECODERS[encoding](buffer[indices], endian).tolist()
+            for field, start, stop in zip(fields, splits[:-1], splits[1:]):
+                if field.count == 1 and encoding != "raw":
+                    values[field.name] = decoded[start]
+                else:
+                    values[field.name] = decoded[start:stop]
+        return {name: values[name] for name in self.names}
+
+    def _build_segments(
+        self, fields: list[RamField], max_gap: int
+    ) -> list[tuple[int, int]]:
+        addresses = np.unique(np.concatenate([f.addresses().ravel() for f in fields]))
+
+        segments = []
+        start = previous = int(addresses[0])
+        for addr in addresses[1:].tolist():
+            if addr - previous > max_gap:
+                segments.append((start, previous + 1))
+                start = addr
+            previous = addr
+        segments.append((start, previous + 1))
+        return segments
+
+    def _buffer_index(self, addresses: np.ndarray) -> np.ndarray:
+        starts = np.array([start for start, _ in self.segments])
+        segment = np.searchsorted(starts, addresses, side="right") - 1
+        return np.array(self._offsets)[segment] + addresses - starts[segment]
+
+    def _build_groups(self, fields: list[RamField]) -> list[tuple]:
+        # Fields sharing an encoding, endianness and width decode in one operation
+        grouped: dict[tuple, list[RamField]] = {}
+        for field in fields:
+            grouped.setdefault((field.encoding, field.endian, field.width), []).append(
+                field
+            )
+
+        groups = []
+        for (encoding, endian, _), group_fields in grouped.items():
+            indices = np.concatenate(
+                [self._buffer_index(field.addresses()) for field in group_fields]
+            )
+            lengths = [
+                field.count * (field.width if encoding == "raw" else 1)
+                for field in group_fields
+            ]
+            splits = np.concatenate([[0], np.cumsum(lengths)]).tolist()
+            groups.append((encoding, endian, indices, group_fields, splits))
+        return groups
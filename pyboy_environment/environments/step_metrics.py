@@ -0,0 +1,125 @@
+# Optional per-phase timers and callbacks for PyboyEnvironment.step/reset.
+# When disabled StepMetrics.measure only calls the phase.
+
+import time
+from typing import Callable
+
+import numpy as np
+
+PHASES = (
+    "step",
+    "run_action",
+    "get_state",
+    "game_stats",
+    "reward",
+    "done",
+    "truncated",
+    "reset",
+)
+
+# Bucket i of a histogram counts durations in [2 ** (i - 1), 2 ** i) nanoseconds
+HISTOGRAM_BUCKETS = 64
+
+
+class PhaseStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = np.zeros(HISTOGRAM_BUCKETS, dtype=np.int64)
+
+    def copy(self) -> "PhaseStats":
+        stats = PhaseStats()
+        stats.count = self.count
+        stats.total_ns = self.total_ns
+        stats.max_ns = self.max_ns
+        stats.histogram = self.histogram.copy()
+        return stats
+
+    def record(self, elapsed_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.histogram[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "max_us": self.max_ns / 1e3,
+        }
+
+
+class StepMetrics:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+
+        self._before: dict[str, list[Callable]] = {phase: [] for phase in PHASES}
+        self._after: dict[str, list[Callable]] = {phase: [] for phase in PHASES}
+
+        self.clear()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        self.cumulative = {phase: PhaseStats() for phase in PHASES}
+        self.episode = {phase: PhaseStats() for phase in PHASES}
+        self.episodes = 0
+
+    def end_episode(self) -> None:
+        if self.episode["step"].count > 0:
+            self.episodes += 1
+        self.episode = {phase: PhaseStats() for phase in PHASES}
+
+    def get_state(self) -> dict[str, PhaseStats]:
+        # Per-episode totals, cumulative totals keep counting the work actually done
+        return {phase: stats.copy() for phase, stats in self.episode.items()}
+
+    def set_state(self, state: dict[str, PhaseStats]) -> None:
+        self.episode = {phase: stats.copy() for phase, stats in state.items()}
+
+    def register_callback(
+        self,
+        phase: str,
+        before: Callable[[str], None] | None = None,
+        after: Callable[[str, int], None] | None = None,
+    ) -> None:
+        # before(phase) runs before the phase, after(phase, elapsed_ns) after it
+        if phase not in PHASES:
+            raise ValueError(f"Unknown phase: {phase}, expected one of {PHASES}")
+        if before is not None:
+            self._before[phase].append(before)
+        if after is not None:
+            self._after[phase].append(after)
+
+    def measure(self, phase: str, function: Callable, *args):
+        if not self.enabled:
+            return function(*args)
+
+        for callback in self._before[phase]:
+            callback(phase)
+
+        start = time.perf_counter_ns()
+        result = function(*args)
+        elapsed_ns = time.perf_counter_ns() - start
+
+        self.cumulative[phase].record(elapsed_ns)
+        self.episode[phase].record(elapsed_ns)
+
+        for callback in self._after[phase]:
+            callback(phase, elapsed_ns)
+
+        return result
+
+    def summary(self, episode: bool = False) -> dict[str, dict[str, float]]:
+        stats = self.episode if episode else self.cumulative
+        return {phase: stats[phase].summary() for phase in PHASES}
+
+    def histogram(self, phase: str, episode: bool = False) -> np.ndarray:
+        stats = self.episode if episode else self.cumulative
+        return stats[phase].histogram.copy()
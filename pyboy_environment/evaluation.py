@@ -0,0 +1,202 @@
+# Parallel policy evaluation - episodes are dispatched one per idle worker, the one
+# expected to run longest first, and results are yielded as episodes finish.
+#
+#     results = list(evaluate(make_episodes("pokemon", "brock", 24, 32), policy))
+
+import math
+import multiprocessing as mp
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing.util import Finalize
+from typing import Callable, Iterator
+
+import numpy as np
+
+from pyboy_environment.environments import PyboyEnvironment
+
+
+@dataclass(frozen=True)
+class EpisodeSpec:
+    domain: str
+    task: str
+    act_freq: int
+    seed: int
+    max_steps: int | None = None
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return (self.domain, self.task, self.act_freq)
+
+
+@dataclass(frozen=True)
+class EpisodeResult:
+    spec: EpisodeSpec
+    episode_return: float
+    length: int
+    done: bool
+    truncated: bool
+    game_stats: dict = field(repr=False)
+    seconds: float
+
+
+def make_episodes(
+    domain: str,
+    task: str,
+    act_freq: int,
+    num_episodes: int,
+    seed: int = 0,
+    max_steps: int | None = None,
+) -> list[EpisodeSpec]:
+    return [
+        EpisodeSpec(domain, task, act_freq, seed + i, max_steps)
+        for i in range(num_episodes)
+    ]
+
+
+def make_env(spec: EpisodeSpec, env_kwargs: dict) -> PyboyEnvironment:
+    from pyboy_environment import suite
+
+    kwargs = {"headless": True, "render_mode": "never"}
+    kwargs.update(env_kwargs)
+    return suite.make(spec.domain, spec.task, spec.act_freq, **kwargs)
+
+
+# Per worker process state, set up once by _init_worker
+_worker_envs: dict[tuple[str, str, int], PyboyEnvironment] = {}
+_worker_config: dict = {}
+
+
+def _init_worker(policy, env_fn, env_kwargs) -> None:
+    _worker_config.update(policy=policy, env_fn=env_fn, env_kwargs=env_kwargs)
+    # Pool workers exit without running atexit handlers, multiprocessing finalizers do run
+    Finalize(None, _close_worker_envs, exitpriority=10)
+
+
+def _close_worker_envs() -> None:
+    for env in _worker_envs.values():
+        env.close()
+    _worker_envs.clear()
+
+
+def _run_episode(spec: EpisodeSpec) -> EpisodeResult:
+    env = _worker_envs.get(spec.key)
+    if env is None:
+        env = _worker_config["env_fn"](spec, _worker_config["env_kwargs"])
+        _worker_envs[spec.key] = env
+    policy = _worker_config["policy"]
+
+    env.set_seed(spec.seed)
+    np.random.seed(spec.seed)
+
+    start = time.perf_counter()
+    state = env.reset()
+    episode_return, length = 0.0, 0
+    done = truncated = False
+    while not (done or truncated):
+        action = env.sample_action() if policy is None else policy(state)
+        state, reward, done, truncated = env.step(action)
+        episode_return += reward
+        length += 1
+        if not done and spec.max_steps is not None and length >= spec.max_steps:
+            truncated = True
+
+    return EpisodeResult(
+        spec,
+        episode_return,
+        length,
+        bool(done),
+        bool(truncated),
+        env._get_game_stats(),
+        time.perf_counter() - start,
+    )
+
+
+def _expected_length(
+    spec: EpisodeSpec,
+    lengths: dict[tuple[str, str, int], list[int]],
+    length_hints: dict[tuple[str, str], int],
+) -> float:
+    finished = lengths.get(spec.key)
+    if finished:
+        estimate = sum(finished) / len(finished)
+    else:
+        estimate = length_hints.get((spec.domain, spec.task), math.inf)
+    if spec.max_steps is not None:
+        estimate = min(estimate, spec.max_steps)
+    return estimate
+
+
+def _next_episode(
+    pending: list[EpisodeSpec],
+    lengths: dict[tuple[str, str, int], list[int]],
+    length_hints: dict[tuple[str, str], int],
+) -> EpisodeSpec:
+    # Longest expected episode first, in submission order among equals
+    index = max(
+        range(len(pending)),
+        key=lambda i: (_expected_length(pending[i], lengths, length_hints), -i),
+    )
+    return pending.pop(index)
+
+
+def evaluate(
+    episodes: list[EpisodeSpec],
+    policy: Callable | None = None,
+    num_workers: int | None = None,
+    start_method: str | None = None,
+    env_kwargs: dict | None = None,
+    length_hints: dict[tuple[str, str], int] | None = None,
+    env_fn: Callable[[EpisodeSpec, dict], PyboyEnvironment] = make_env,
+) -> Iterator[EpisodeResult]:
+    # policy(state) -> action must be picklable, None samples random actions
+    pending = list(episodes)
+    num_workers = min(num_workers or mp.cpu_count(), len(pending))
+    env_kwargs = env_kwargs or {}
+    length_hints = length_hints or {}
+    lengths: dict[tuple[str, str, int], list[int]] = {}
+
+    if not pending:
+        return
+
+    with ProcessPoolExecutor(
+        num_workers,
+        mp_context=mp.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(policy, env_fn, env_kwargs),
+    ) as pool:
+        running = set()
+        while pending or running:
+            while pending and len(running) < num_workers:
+                spec = _next_episode(pending, lengths, length_hints)
+                running.add(pool.submit(_run_episode, spec))
+
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                lengths.setdefault(result.spec.key, []).append(result.length)
+                yield result
+
+
+def summarize(results: list[EpisodeResult]) -> dict[str, dict[str, float]]:
+    # Return and length statistics per domain/task/act_freq
+    grouped: dict[tuple[str, str, int], list[EpisodeResult]] = {}
+    for result in results:
+        grouped.setdefault(result.spec.key, []).append(result)
+
+    summary = {}
+    for (domain, task, act_freq), group in grouped.items():
+        returns = np.array([result.episode_return for result in group])
+        lengths = np.array([result.length for result in group])
+        summary[f"{domain}/{task}@{act_freq}"] = {
+            "episodes": len(group),
+            "return_mean": float(returns.mean()),
+            "return_std": float(returns.std()),
+            "return_min": float(returns.min()),
+            "return_max": float(returns.max()),
+            "length_mean": float(lengths.mean()),
+            "length_max": int(lengths.max()),
+            "done_rate": float(np.mean([result.done for result in group])),
+            "seconds": float(sum(result.seconds for result in group)),
+        }
+    return summary
@@ -0,0 +1,130 @@
+# Fork server for VecPyboyEnvironment workers - a spawned process builds and resets
+# each environment once, then forks ready to step workers from it. Unix only.
+
+import logging
+import multiprocessing as mp
+import os
+import signal
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import recv_handle, send_handle
+from typing import Callable, Hashable
+
+from pyboy_environment.environments import PyboyEnvironment
+
+
+class ForkedProcess:
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+
+    def is_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def join(self, timeout: float | None = None) -> None:
+        # The server reaps its workers, so a finished worker simply stops existing
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive():
+            if deadline is not None and time.monotonic() > deadline:
+                return
+            time.sleep(0.001)
+
+    def terminate(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def _serve(
+    remote: Connection,
+    parent_remote: Connection,
+    env_fns: dict[Hashable, Callable[[], PyboyEnvironment]],
+) -> None:
+    from pyboy_environment.vector_environment import _run_worker
+
+    parent_remote.close()
+    # Forked workers are reaped automatically instead of becoming zombies
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    templates = {}
+    for key, env_fn in env_fns.items():
+        env = env_fn()
+        env.reset()
+        templates[key] = env
+    remote.send(None)
+
+    try:
+        while True:
+            command, key = remote.recv()
+            if command == "close":
+                break
+            if command != "fork":
+                raise ValueError(f"Unknown fork server command: {command}")
+
+            worker_fd = recv_handle(remote)
+            pid = os.fork()
+            if pid == 0:
+                remote.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                try:
+                    _run_worker(Connection(worker_fd), templates[key])
+                finally:
+                    os._exit(0)
+
+            os.close(worker_fd)
+            remote.send(pid)
+    except (KeyboardInterrupt, EOFError):
+        logging.info("Fork server stopped")
+    finally:
+        for env in templates.values():
+            env.close()
+        remote.close()
+
+
+class EnvironmentForkServer:
+    def __init__(
+        self,
+        env_fns: dict[Hashable, Callable[[], PyboyEnvironment]],
+        start_method: str = "spawn",
+    ) -> None:
+        context = mp.get_context(start_method)
+        self.remote, work_remote = context.Pipe()
+        self.process = context.Process(
+            target=_serve, args=(work_remote, self.remote, env_fns), daemon=True
+        )
+        self.process.start()
+        work_remote.close()
+        self.closed = False
+
+        # Wait for the templates so the first fork is not charged their startup
+        self.remote.recv()
+
+    def fork(self, key: Hashable) -> tuple[Connection, ForkedProcess]:
+        # Returns the requester's end of the new worker's pipe and the worker process
+        remote, work_remote = mp.Pipe()
+        self.remote.send(("fork", key))
+        send_handle(self.remote, work_remote.fileno(), self.process.pid)
+        pid = self.remote.recv()
+        work_remote.close()
+        return remote, ForkedProcess(pid)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self.remote.send(("close", None))
+        except (BrokenPipeError, EOFError):
+            pass
+        self.process.join()
+        self.remote.close()
+        self.closed = True
+
+    def __enter__(self) -> "EnvironmentForkServer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,165 @@
+# Action replay with per-step RAM checksums, to find the first step where two runs
+# diverge. The environment's settings and visit counts are restored after a run and
+# its next step starts a new episode.
+#
+# Usage: python -m pyboy_environment.replay <domain> <task> <act_freq> <actions.npy>
+#     [--init_state path] [--save checksums.npy] [--expected checksums.npy]
+
+import argparse
+import io
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from pyboy_environment.environments import PyboyEnvironment
+from pyboy_environment.environments.pyboy_environment import RENDER_NEVER
+
+# Work RAM and high RAM - everything the game itself keeps state in
+CHECKSUM_RANGES = ((0xC000, 0xE000), (0xFF80, 0xFFFF))
+
+
+def ram_checksum(memory, ranges=CHECKSUM_RANGES) -> int:
+    checksum = 0
+    for start, end in ranges:
+        checksum = zlib.crc32(bytes(memory[start:end]), checksum)
+    return checksum
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    # checksums[i] is the checksum after action i
+    checksums: np.ndarray
+    divergent_step: int | None
+    seconds: float
+
+    @property
+    def steps(self) -> int:
+        return len(self.checksums)
+
+    @property
+    def matched(self) -> bool:
+        return self.divergent_step is None
+
+
+class ReplayRunner:
+    def __init__(self, env: PyboyEnvironment, ranges=CHECKSUM_RANGES) -> None:
+        self.env = env
+        self.ranges = ranges
+
+    def run(
+        self,
+        actions,
+        init_state: bytes | str | Path | None = None,
+        act_freq: int | None = None,
+        expected: np.ndarray | None = None,
+        stop_on_divergence: bool = True,
+    ) -> ReplayResult:
+        # init_state is the state bytes or a path to them, the env's init state by default
+        env = self.env
+        previous_act_freq = env.act_freq
+        if act_freq is not None:
+            env.act_freq = act_freq
+
+        # Replayed steps are not exploration, Pokemon visit counts are put back
+        visit_counts = getattr(env, "visit_counts", None)
+        visit_state = visit_counts.get_state() if visit_counts is not None else None
+
+        render_mode = env.render_mode
+        env.render_mode = RENDER_NEVER
+        env.pyboy.set_emulation_speed(0)
+        try:
+            env.reset()
+            if init_state is not None:
+                if not isinstance(init_state, bytes):
+                    init_state = env._read_state(str(init_state))
+                env.pyboy.load_state(io.BytesIO(init_state))
+                env._invalidate_game_stats()
+
+            checksums = np.zeros(len(actions), dtype=np.uint32)
+            divergent_step = None
+            memory = env.pyboy.memory
+            run_action = env._run_action_on_emulator
+
+            start = time.perf_counter()
+            for step, action in enumerate(actions):
+                run_action(action)
+                checksums[step] = ram_checksum(memory, self.ranges)
+
+                if (
+                    divergent_step is None
+                    and expected is not None
+                    and step < len(expected)
+                    and checksums[step] != expected[step]
+                ):
+                    divergent_step = step
+                    if stop_on_divergence:
+                        checksums = checksums[: step + 1]
+                        break
+            seconds = time.perf_counter() - start
+        finally:
+            env.act_freq = previous_act_freq
+            if visit_counts is not None:
+                visit_counts.set_state(visit_state)
+            env.render_mode = render_mode
+            env.pyboy.set_emulation_speed(env.emulation_speed)
+            # The emulator is no longer at the state of the last step/reset
+            env._invalidate_game_stats()
+            env.prior_game_stats = None
+
+        if (
+            divergent_step is None
+            and expected is not None
+            and len(expected) != len(checksums)
+        ):
+            # One run is longer, it diverges where the shorter one ends
+            divergent_step = min(len(expected), len(checksums))
+
+        return ReplayResult(checksums, divergent_step, seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("domain")
+    parser.add_argument("task")
+    parser.add_argument("act_freq", type=int)
+    parser.add_argument("actions", type=Path)
+    parser.add_argument("--init_state", type=Path, default=None)
+    parser.add_argument("--save", type=Path, default=None)
+    parser.add_argument("--expected", type=Path, default=None)
+    args = parser.parse_args()
+
+    from pyboy_environment import suite
+
+    env = suite.make(
+        args.domain,
+        args.task,
+        args.act_freq,
+        headless=True,
+        discrete=True,
+        render_mode=RENDER_NEVER,
+    )
+    actions = np.load(args.actions, mmap_mode="r")
+    expected = np.load(args.expected) if args.expected is not None else None
+
+    result = ReplayRunner(env).run(actions, args.init_state, expected=expected)
+    env.close()
+
+    print(
+        f"Replayed {result.steps} steps in {result.seconds:.1f} s "
+        f"({result.steps / max(result.seconds, 1e-9):.0f} steps/s)"
+    )
+    if args.save is not None:
+        np.save(args.save, result.checksums)
+    if expected is not None:
+        if result.matched:
+            print("Checksums match")
+        else:
+            print(f"Diverged at step {result.divergent_step}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
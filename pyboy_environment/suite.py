@@ -1,8 +1,11 @@
-from pyboy_environment.environments import PyboyEnvironment
-from pyboy_environment.environments.mario.mario_run import MarioRun
-from pyboy_environment.environments.pokemon.tasks.fight import PokemonFight
-from pyboy_environment.environments.pokemon.tasks.catch import PokemonCatch
-from pyboy_environment.environments.pokemon.tasks.brock import PokemonBrock
+from functools import partial
+from typing import TYPE_CHECKING
+
+# Domains, pyboy and the vector environment are imported on first use so that
+# importing the suite (e.g. in every worker process) stays cheap
+if TYPE_CHECKING:
+    from pyboy_environment.environments import PyboyEnvironment
+    from pyboy_environment.vector_environment import VecPyboyEnvironment
 
 
 def make(
@@ -12,22 +15,125 @@ def make(
     emulation_speed: int = 0,
     headless: bool = False,
     discrete: bool = False,
-) -> PyboyEnvironment:
+    render_mode: str = "last",
+    observation_mode: str = "ram",
+    frame_size: tuple[int, int] = (84, 84),
+    frame_stack: int = 3,
+    macro_actions: bool = False,
+    frame_skip: bool = False,
+    rom_hooks: bool = False,
+) -> "PyboyEnvironment":
+    env_kwargs = {
+        "render_mode": render_mode,
+        "observation_mode": observation_mode,
+        "frame_size": frame_size,
+        "frame_stack": frame_stack,
+    }
 
     if domain == "mario":
+        if macro_actions:
+            raise ValueError("Macro actions are only available for Pokemon")
+        if frame_skip:
+            raise ValueError("Frame skip is only available for Pokemon")
+        if rom_hooks:
+            raise ValueError("ROM hooks are only available for Pokemon")
         if task == "run":
-            env = MarioRun(act_freq, emulation_speed, headless)
+            from pyboy_environment.environments.mario.mario_run import MarioRun
+
+            env = MarioRun(act_freq, emulation_speed, headless, **env_kwargs)
         else:
             raise ValueError(f"Unknown Mario task: {task}")
     elif domain == "pokemon":
         if task == "catch":
-            env = PokemonCatch(act_freq, emulation_speed, headless, discrete)
+            from pyboy_environment.environments.pokemon.tasks.catch import (
+                PokemonCatch,
+            )
+
+            env = PokemonCatch(
+                act_freq,
+                emulation_speed,
+                headless,
+                discrete,
+                macro_actions=macro_actions,
+                frame_skip=frame_skip,
+                rom_hooks=rom_hooks,
+                **env_kwargs,
+            )
         elif task == "fight":
-            env = PokemonFight(act_freq, emulation_speed, headless, discrete)
+            from pyboy_environment.environments.pokemon.tasks.fight import (
+                PokemonFight,
+            )
+
+            env = PokemonFight(
+                act_freq,
+                emulation_speed,
+                headless,
+                discrete,
+                macro_actions=macro_actions,
+                frame_skip=frame_skip,
+                rom_hooks=rom_hooks,
+                **env_kwargs,
+            )
         elif task == "brock":
-            env = PokemonBrock(act_freq, emulation_speed, headless, discrete)
+            from pyboy_environment.environments.pokemon.tasks.brock import (
+                PokemonBrock,
+            )
+
+            env = PokemonBrock(
+                act_freq,
+                emulation_speed,
+                headless,
+                discrete,
+                macro_actions=macro_actions,
+                frame_skip=frame_skip,
+                rom_hooks=rom_hooks,
+                **env_kwargs,
+            )
         else:
             raise ValueError(f"Unknown Pokemon task: {task}")
     else:
         raise ValueError(f"Unknown pyboy environment: {task}")
     return env
+
+
+def make_vec(
+    domain: str,
+    task: str,
+    num_envs: int,
+    act_freq: int,
+    emulation_speed: int = 0,
+    headless: bool = True,
+    discrete: bool = False,
+    render_mode: str | None = None,
+    observation_mode: str = "ram",
+    frame_size: tuple[int, int] = (84, 84),
+    frame_stack: int = 3,
+    macro_actions: bool = False,
+    frame_skip: bool = False,
+    rom_hooks: bool = False,
+    start_method: str | None = None,
+) -> "VecPyboyEnvironment":
+    from pyboy_environment.vector_environment import VecPyboyEnvironment
+
+    if render_mode is None:
+        # Pixel observations need the last frame of every step rendered
+        render_mode = "last" if observation_mode == "pixels" else "never"
+
+    # One env_fn shared by every worker, so "fork_server" builds a single template
+    env_fn = partial(
+        make,
+        domain,
+        task,
+        act_freq,
+        emulation_speed,
+        headless,
+        discrete,
+        render_mode,
+        observation_mode,
+        frame_size,
+        frame_stack,
+        macro_actions,
+        frame_skip,
+        rom_hooks,
+    )
+    return VecPyboyEnvironment([env_fn] * num_envs, start_method=start_method)
@@ -37,17 +37,14 @@ if __name__ == "__main__":
 
         state, reward, done, truncated = env.step(action)
 
-        stats = env._generate_game_stats()
+        stats = env._get_game_stats()
         logging.info(f"Stats: {stats}")
 
         reward = env._calculate_reward(stats)
         logging.info(f"Reward: {reward}")
 
-        score = env._read_m(0x9820)
-        logging.info(f"Score: {score}")
-
-        coins = env._get_coins()
-        logging.info(f"Coins: {coins}")
+        logging.info(f"Score: {stats['score']}")
+        logging.info(f"Coins: {stats['coins']}")
 
         if done or truncated:
             state = env.reset()
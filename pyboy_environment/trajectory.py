@@ -0,0 +1,293 @@
+# Trajectory recording for offline RL into memory-mapped .npy chunks, flushed (and
+# optionally compressed) by a background thread. Rows are obs, action, reward, done,
+# truncated, next_obs, episode and the selected game stats.
+
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from pyboy_environment.environments import PyboyEnvironment
+
+INDEX_FILE = "trajectory.json"
+BASE_COLUMNS = (
+    "obs",
+    "action",
+    "reward",
+    "done",
+    "truncated",
+    "next_obs",
+    "episode",
+)
+
+
+def _chunk_name(index: int) -> str:
+    return f"chunk_{index:06d}"
+
+
+def _select_stat(game_stats: dict, name: str):
+    value = game_stats
+    for key in name.split("."):
+        value = value[key]
+    return value
+
+
+class TrajectoryRecorder:
+    def __init__(
+        self,
+        env: PyboyEnvironment,
+        directory: str | Path,
+        stats: list[str] | None = None,
+        chunk_size: int = 10000,
+        compress: bool = False,
+    ) -> None:
+        self.env = env
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.stats = list(stats) if stats is not None else []
+        self.chunk_size = chunk_size
+        self.compress = compress
+
+        self.episode = -1
+        self.rows = 0
+        self._state = None
+
+        # Column dtype and row shape, set from the environment by the first chunk
+        self._types: dict[str, tuple[np.dtype, tuple]] | None = None
+        self._chunk_index = 0
+        self._chunk: dict[str, np.memmap] | None = None
+        self._chunk_rows = 0
+        # (name, rows, format) of every written chunk - only used by the writer thread
+        self._chunks: list[tuple[str, int, str]] = []
+
+        self._queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_chunks, daemon=True)
+        self._writer.start()
+        self.closed = False
+
+    def __getattr__(self, name: str):
+        # Everything that is not recording goes straight to the environment
+        if name == "env":
+            raise AttributeError(name)
+        return getattr(self.env, name)
+
+    def reset(self) -> np.ndarray:
+        state = self.env.reset()
+        # Pixel observations are views updated in place by the next step
+        self._state = np.array(state)
+        self.episode += 1
+        return state
+
+    def step(self, action) -> tuple:
+        if self._state is None:
+            self.reset()
+
+        state, reward, done, truncated = self.env.step(action)
+        next_state = np.array(state)
+        self._record(self._state, action, reward, done, truncated, next_state)
+        self._state = next_state
+        return state, reward, done, truncated
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+        self.env.close()
+        self.closed = True
+
+    def flush(self) -> None:
+        # Hands the current partial chunk to the writer and waits for all chunks
+        if self._chunk is not None and self._chunk_rows > 0:
+            self._finish_chunk()
+        self._queue.join()
+
+    def _record(self, state, action, reward, done, truncated, next_state) -> None:
+        values = {
+            "obs": state,
+            "action": action,
+            "reward": reward,
+            "done": done,
+            "truncated": truncated,
+            "next_obs": next_state,
+            "episode": self.episode,
+        }
+        if self.stats:
+            game_stats = self.env._get_game_stats()
+            for name in self.stats:
+                values[name] = _select_stat(game_stats, name)
+
+        if self._chunk is None:
+            self._chunk = self._open_chunk(values)
+
+        row = self._chunk_rows
+        for name, value in values.items():
+            self._chunk[name][row] = value
+        self._chunk_rows += 1
+        self.rows += 1
+
+        if self._chunk_rows == self.chunk_size:
+            self._finish_chunk()
+
+    def _column_types(self, values: dict) -> dict[str, tuple[np.dtype, tuple]]:
+        observation_space = self.env.observation_space
+        if isinstance(observation_space, tuple):
+            obs = (np.dtype(np.uint8), observation_space)
+        else:
+            obs = (np.dtype(np.float32), (observation_space,))
+
+        if getattr(self.env, "discrete", False):
+            action = (np.dtype(np.int64), ())
+        else:
+            action = (np.dtype(np.float32), (self.env.action_num,))
+
+        types = {
+            "obs": obs,
+            "action": action,
+            "reward": (np.dtype(np.float32), ()),
+            "done": (np.dtype(np.bool_), ()),
+            "truncated": (np.dtype(np.bool_), ()),
+            "next_obs": obs,
+            "episode": (np.dtype(np.int64), ()),
+        }
+        for name in self.stats:
+            value = np.asarray(values[name])
+            if value.dtype.kind not in "biuf":
+                raise ValueError(f"Game stat {name} is not numeric: {value.dtype}")
+            types[name] = (np.dtype(np.float64), value.shape)
+        return types
+
+    def _open_chunk(self, values: dict) -> dict[str, np.memmap]:
+        if self._types is None:
+            self._types = self._column_types(values)
+
+        path = self.directory / _chunk_name(self._chunk_index)
+        path.mkdir(exist_ok=True)
+        chunk = {}
+        for name, (dtype, shape) in self._types.items():
+            chunk[name] = np.lib.format.open_memmap(
+                path / f"{name}.npy",
+                mode="w+",
+                dtype=dtype,
+                shape=(self.chunk_size,) + shape,
+            )
+        return chunk
+
+    def _finish_chunk(self) -> None:
+        self._queue.put((self._chunk_index, self._chunk, self._chunk_rows))
+        self._chunk_index += 1
+        self._chunk = None
+        self._chunk_rows = 0
+
+    def _write_chunks(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write_chunk(*item)
+            except Exception:
+                logging.exception("Failed to write trajectory chunk")
+            finally:
+                self._queue.task_done()
+
+    def _write_chunk(self, index: int, chunk: dict[str, np.memmap], rows: int) -> None:
+        name = _chunk_name(index)
+        path = self.directory / name
+        for column in chunk.values():
+            column.flush()
+
+        if self.compress:
+            np.savez_compressed(
+                self.directory / f"{name}.npz",
+                **{column: values[:rows] for column, values in chunk.items()},
+            )
+            chunk.clear()
+            for file in path.iterdir():
+                file.unlink()
+            path.rmdir()
+
+        self._chunks.append((name, rows, "npz" if self.compress else "npy"))
+        self._write_index()
+
+    def _write_index(self) -> None:
+        index = {
+            "columns": list(BASE_COLUMNS) + self.stats,
+            "chunk_size": self.chunk_size,
+            "chunks": [
+                {"name": name, "rows": rows, "format": fmt}
+                for name, rows, fmt in sorted(self._chunks)
+            ],
+        }
+        path = self.directory / INDEX_FILE
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(temp_path, path)
+
+    def __enter__(self) -> "TrajectoryRecorder":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class TrajectoryReader:
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        with open(self.directory / INDEX_FILE, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        self.columns: list[str] = index["columns"]
+        self.chunks: list[dict] = index["chunks"]
+
+    def __len__(self) -> int:
+        return sum(chunk["rows"] for chunk in self.chunks)
+
+    def load_chunk(self, chunk: dict, columns: list[str] | None = None) -> dict:
+        columns = self.columns if columns is None else columns
+        rows = chunk["rows"]
+        if chunk["format"] == "npz":
+            with np.load(self.directory / f"{chunk['name']}.npz") as data:
+                return {column: data[column] for column in columns}
+
+        path = self.directory / chunk["name"]
+        return {
+            column: np.load(path / f"{column}.npy", mmap_mode="r")[:rows]
+            for column in columns
+        }
+
+    def batches(self, batch_size: int, columns: list[str] | None = None):
+        # Yields dicts of batch_size rows (the last batch may be smaller), in order
+        pending: list[dict] = []
+        pending_rows = 0
+        for chunk in self.chunks:
+            data = self.load_chunk(chunk, columns)
+            start = 0
+            while start < chunk["rows"]:
+                take = min(batch_size - pending_rows, chunk["rows"] - start)
+                pending.append(
+                    {
+                        name: values[start : start + take]
+                        for name, values in data.items()
+                    }
+                )
+                pending_rows += take
+                start += take
+                if pending_rows == batch_size:
+                    yield self._concatenate(pending)
+                    pending, pending_rows = [], 0
+
+        if pending:
+            yield self._concatenate(pending)
+
+    def _concatenate(self, parts: list[dict]) -> dict:
+        if len(parts) == 1:
+            return parts[0]
+        return {
+            name: np.concatenate([part[name] for part in parts]) for name in parts[0]
+        }
@@ -0,0 +1,266 @@
+# Batched environment with one PyboyEnvironment per worker process
+
+import logging
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from typing import Callable
+
+import numpy as np
+
+from pyboy_environment.environments import PyboyEnvironment
+from pyboy_environment.fork_server import EnvironmentForkServer
+
+FORK_SERVER = "fork_server"
+
+
+def _worker(
+    remote: Connection,
+    parent_remote: Connection,
+    env_fn: Callable[[], PyboyEnvironment],
+) -> None:
+    parent_remote.close()
+    _run_worker(remote, env_fn())
+
+
+def _run_worker(remote: Connection, env: PyboyEnvironment) -> None:
+    try:
+        while True:
+            command, data = remote.recv()
+            if command == "step":
+                state, reward, done, truncated = env.step(data)
+                final_state = None
+                if done or truncated:
+                    # Reset in place so the learner never waits on a separate reset call.
+                    # Pixel states are views of the frame stack that reset overwrites.
+                    final_state = np.array(state)
+                    state = env.reset()
+                remote.send((state, reward, done, truncated, final_state))
+            elif command == "reset":
+                remote.send(env.reset())
+            elif command == "sample_action":
+                remote.send(env.sample_action())
+            elif command == "set_seed":
+                env.set_seed(data)
+                remote.send(None)
+            elif command == "get_attr":
+                remote.send(getattr(env, data))
+            elif command == "call":
+                name, args, kwargs = data
+                remote.send(getattr(env, name)(*args, **kwargs))
+            elif command == "close":
+                break
+            else:
+                raise ValueError(f"Unknown worker command: {command}")
+    except KeyboardInterrupt:
+        logging.info("Worker interrupted")
+    finally:
+        env.close()
+        remote.close()
+
+
+class VecPyboyEnvironment:
+    def __init__(
+        self,
+        env_fns: list[Callable[[], PyboyEnvironment]],
+        start_method: str | None = None,
+    ) -> None:
+        self.num_envs = len(env_fns)
+        self.env_fns = list(env_fns)
+        self.closed = False
+
+        # "fork_server" forks every worker from an environment built and reset once
+        # per distinct env_fn - see fork_server.py
+        self.fork_server = None
+        if start_method == FORK_SERVER:
+            templates = {id(env_fn): env_fn for env_fn in self.env_fns}
+            self.fork_server = EnvironmentForkServer(templates)
+        else:
+            self.context = mp.get_context(start_method)
+
+        self.remotes = []
+        self.processes = []
+        for env_fn in self.env_fns:
+            remote, process = self._start_worker(env_fn)
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+        # Populated on every step with the terminal state of each worker that was auto-reset
+        self.final_states: list = [None] * self.num_envs
+        # Workers with a step_async in flight
+        self.waiting: set[int] = set()
+
+        self.action_num = self.get_attr("action_num", 0)
+        self.observation_space = self.get_attr("observation_space", 0)
+        self.min_action_value = self.get_attr("min_action_value", 0)
+        self.max_action_value = self.get_attr("max_action_value", 0)
+
+    def set_seed(self, seed: int) -> None:
+        self._check_not_waiting()
+        for i, remote in enumerate(self.remotes):
+            remote.send(("set_seed", seed + i))
+        for remote in self.remotes:
+            remote.recv()
+
+    def reset(self) -> np.ndarray:
+        self._check_not_waiting()
+        for remote in self.remotes:
+            remote.send(("reset", None))
+        return self._stack([remote.recv() for remote in self.remotes])
+
+    def step(self, actions) -> tuple:
+        self.step_async(actions)
+        return self.step_wait()
+
+    def step_async(self, actions, indices: list[int] | None = None) -> None:
+        # Starts stepping the given workers (all by default) and returns immediately,
+        # so the next actions can be computed while those environments emulate
+        indices = self._indices(indices)
+        if len(actions) != len(indices):
+            raise ValueError(
+                f"Expected {len(indices)} actions, received {len(actions)}"
+            )
+
+        for i in indices:
+            if i in self.waiting:
+                raise RuntimeError(f"Environment {i} is already stepping")
+
+        for i, action in zip(indices, actions):
+            self.remotes[i].send(("step", action))
+            self.waiting.add(i)
+
+    def step_wait(self, indices: list[int] | None = None) -> tuple:
+        # Collects the results of step_async for the given workers (all by default), in order
+        indices = self._indices(indices)
+        for i in indices:
+            if i not in self.waiting:
+                raise RuntimeError(f"Environment {i} has no step in progress")
+
+        results = []
+        for i in indices:
+            results.append(self.remotes[i].recv())
+            self.waiting.remove(i)
+
+        states, rewards, dones, truncateds, final_states = zip(*results)
+        for i, final_state in zip(indices, final_states):
+            self.final_states[i] = final_state
+
+        return (
+            self._stack(states),
+            np.array(rewards, dtype=np.float64),
+            np.array(dones, dtype=bool),
+            np.array(truncateds, dtype=bool),
+        )
+
+    async def astep(self, actions, indices: list[int] | None = None) -> tuple:
+        # asyncio variant of step - other coroutines run while the workers emulate
+        import asyncio
+
+        self.step_async(actions, indices)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.step_wait, indices)
+
+    def sample_action(self) -> np.ndarray:
+        self._check_not_waiting()
+        for remote in self.remotes:
+            remote.send(("sample_action", None))
+        return np.array([remote.recv() for remote in self.remotes])
+
+    def get_attr(self, name: str, index: int):
+        self._check_not_waiting([index])
+        self.remotes[index].send(("get_attr", name))
+        return self.remotes[index].recv()
+
+    def call(self, name: str, *args, **kwargs) -> list:
+        self._check_not_waiting()
+        for remote in self.remotes:
+            remote.send(("call", (name, args, kwargs)))
+        return [remote.recv() for remote in self.remotes]
+
+    def call_each(self, name: str, args: list) -> list:
+        # Like call, but worker i is called with args[i]
+        if len(args) != self.num_envs:
+            raise ValueError(
+                f"Expected {self.num_envs} arguments, received {len(args)}"
+            )
+        self._check_not_waiting()
+        for remote, arg in zip(self.remotes, args):
+            remote.send(("call", (name, (arg,), {})))
+        return [remote.recv() for remote in self.remotes]
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        for i in list(self.waiting):
+            self.remotes[i].recv()
+        self.waiting.clear()
+
+        for remote in self.remotes:
+            try:
+                remote.send(("close", None))
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self.processes:
+            process.join()
+        for remote in self.remotes:
+            remote.close()
+
+        if self.fork_server is not None:
+            self.fork_server.close()
+
+        self.closed = True
+
+    def recycle(self, index: int) -> None:
+        # Replaces worker index with a fresh one, e.g. to release memory it has built up
+        if index in self.waiting:
+            self.remotes[index].recv()
+            self.waiting.remove(index)
+        self._stop_worker(index)
+        self.final_states[index] = None
+        self.remotes[index], self.processes[index] = self._start_worker(
+            self.env_fns[index]
+        )
+
+    def _start_worker(self, env_fn: Callable[[], PyboyEnvironment]) -> tuple:
+        if self.fork_server is not None:
+            return self.fork_server.fork(id(env_fn))
+
+        remote, work_remote = self.context.Pipe()
+        process = self.context.Process(
+            target=_worker, args=(work_remote, remote, env_fn), daemon=True
+        )
+        process.start()
+        work_remote.close()
+        return remote, process
+
+    def _stop_worker(self, index: int) -> None:
+        try:
+            self.remotes[index].send(("close", None))
+        except (BrokenPipeError, EOFError):
+            pass
+        self.processes[index].join()
+        self.remotes[index].close()
+
+    def _check_not_waiting(self, indices: list[int] | None = None) -> None:
+        # A worker with a step in flight would answer with its step result instead
+        waiting = sorted(self.waiting.intersection(self._indices(indices)))
+        if waiting:
+            raise RuntimeError(
+                f"Environments {waiting} are still stepping, call step_wait first"
+            )
+
+    def _indices(self, indices: list[int] | None) -> list[int]:
+        return list(range(self.num_envs)) if indices is None else list(indices)
+
+    def _stack(self, states) -> np.ndarray:
+        return np.stack([np.asarray(state) for state in states])
+
+    def __enter__(self) -> "VecPyboyEnvironment":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if not getattr(self, "closed", True):
+            self.close()
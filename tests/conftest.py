@@ -0,0 +1,119 @@
+import pickle
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+X_ADDR, Y_ADDR = 0xD362, 0xD361
+RIGHT, UP = 2, 3
+
+
+class FakePyBoy:
+    # Enough of pyboy.PyBoy to run environments without a ROM. Memory is a flat list,
+    # input events are (button, pressed) pairs, on_tick(pyboy) runs once per frame and
+    # save states are the pickled memory.
+    def __init__(self) -> None:
+        self.memory = [0] * 0x10000
+        self.frame_count = 0
+        self.on_tick = None
+        # Buttons held, and pressed since the last tick
+        self.held: set[int] = set()
+        self.pressed: list[int] = []
+        self.rendered: list[int] = []
+        self.speeds: list[int] = []
+        self.hooks: dict = {}
+        self.missing_symbols: tuple[str, ...] = ()
+        # RGBA screen buffer
+        self.screen = SimpleNamespace(ndarray=np.zeros((144, 160, 4), dtype=np.uint8))
+
+    def send_input(self, event) -> None:
+        button, pressed = event
+        if pressed:
+            self.held.add(button)
+            self.pressed.append(button)
+        else:
+            self.held.discard(button)
+
+    def tick(self, count: int = 1, render: bool = True, sound: bool = True) -> bool:
+        for _ in range(count):
+            self.frame_count += 1
+            if self.on_tick is not None:
+                self.on_tick(self)
+        self.pressed.clear()
+        if render and count > 0:
+            self.rendered.append(self.frame_count)
+        return True
+
+    def set_emulation_speed(self, speed: int) -> None:
+        self.speeds.append(speed)
+
+    def save_state(self, f) -> None:
+        pickle.dump(self.memory, f)
+
+    def load_state(self, f) -> None:
+        self.memory[:] = pickle.load(f)
+
+    def state_bytes(self) -> bytes:
+        return pickle.dumps(self.memory)
+
+    def hook_register(self, bank, addr, callback, context) -> None:
+        if addr in self.missing_symbols:
+            raise ValueError(f"Symbol not found: {addr}")
+        if addr in self.hooks:
+            raise ValueError("Hook already registered for this bank and address.")
+        self.hooks[addr] = (callback, context)
+
+    def call(self, symbol: str) -> None:
+        # Runs a hooked routine
+        callback, context = self.hooks[symbol]
+        callback(context)
+
+    def stop(self, save: bool = True) -> None:
+        pass
+
+
+@pytest.fixture
+def pyboy() -> FakePyBoy:
+    return FakePyBoy()
+
+
+def walk(pyboy: FakePyBoy) -> None:
+    # Pressing right or up moves the player one tile
+    while pyboy.pressed:
+        button = pyboy.pressed.pop()
+        if button == RIGHT:
+            pyboy.memory[X_ADDR] += 1
+        elif button == UP:
+            pyboy.memory[Y_ADDR] -= 1
+
+
+def walk_slowly(pyboy: FakePyBoy) -> None:
+    # As walk, with the walk counter (0xCFC5) counting down the 16 frames of a step
+    memory = pyboy.memory
+    if pyboy.pressed:
+        memory[0xCFC5] = 16
+    elif memory[0xCFC5]:
+        memory[0xCFC5] -= 1
+    walk(pyboy)
+
+
+def attach(env, pyboy: FakePyBoy):
+    # Runs a Pokemon environment on the fake emulator with tuple button actions, its
+    # init state has the player at (0, 20)
+    env._pyboy = pyboy
+    if env.rom_events is not None:
+        env.rom_events.register(pyboy)
+    env.valid_actions = [(button, True) for button in range(6)]
+    env.release_button = [(button, False) for button in range(6)]
+    pyboy.on_tick = walk
+    pyboy.memory[Y_ADDR] = 20
+    env._state_cache[env.init_path] = pyboy.state_bytes()
+    return env
+
+
+@pytest.fixture
+def brock(pyboy):
+    from pyboy_environment.environments.pokemon.tasks.brock import PokemonBrock
+
+    env = PokemonBrock(act_freq=24, headless=True, discrete=True, render_mode="never")
+    return attach(env, pyboy)
@@ -0,0 +1,63 @@
+import numpy as np
+
+from pyboy_environment.environments.pokemon.collision import (
+    GRASS_TILE_ADDR,
+    LCDC_ADDR,
+    LOW_TILEMAP_ADDR,
+    SCX_ADDR,
+    TILESET_COLLISION_PTR_ADDR,
+    TILESET_TYPE_ADDR,
+    CollisionMap,
+    read_screen_tilemap,
+)
+
+
+def make_memory() -> list[int]:
+    memory = [0] * 0x10000
+    memory[LCDC_ADDR] = 0x80  # background map 0x9800, signed tile data
+    memory[TILESET_COLLISION_PTR_ADDR : TILESET_COLLISION_PTR_ADDR + 2] = [0x00, 0x40]
+    memory[0x4000:0x4003] = [0x01, 0x02, 0xFF]
+    memory[TILESET_TYPE_ADDR] = 1
+    memory[GRASS_TILE_ADDR] = 0x05
+    return memory
+
+
+def test_screen_tilemap_scrolls_and_maps_signed_tiles():
+    memory = make_memory()
+    memory[LOW_TILEMAP_ADDR + 1] = 0x01
+    memory[LOW_TILEMAP_ADDR + 2] = 0x81
+    memory[SCX_ADDR] = 8
+
+    tiles = read_screen_tilemap(memory)
+
+    assert tiles.shape == (18, 20)
+    assert tiles[0, 0] == 0x101
+    assert tiles[0, 1] == 0x81
+
+
+def test_walkable_tiles_and_collision_grid():
+    memory = make_memory()
+    memory[LOW_TILEMAP_ADDR + 32 : LOW_TILEMAP_ADDR + 36] = [0x02, 0x02, 0x05, 0x05]
+    memory[LOW_TILEMAP_ADDR + 32 * 3 + 2] = 0x03
+
+    collision_map = CollisionMap()
+    walkable = collision_map.walkable_matrix(memory)
+    grid = collision_map.collision_grid(memory)
+
+    assert walkable.shape == (9, 10)
+    assert walkable[0, :3].tolist() == [1, 1, 0]
+    assert walkable[1, 1] == 0
+    assert grid.shape == (18, 20)
+    assert np.array_equal(grid, np.kron(walkable, np.ones((2, 2), dtype=np.uint32)))
+
+
+def test_walkable_table_cached_per_tileset():
+    memory = make_memory()
+    collision_map = CollisionMap()
+    table = collision_map.walkable_table(memory)
+
+    memory[0x4000] = 0x09  # ignored until the tileset changes
+    assert collision_map.walkable_table(memory) is table
+
+    memory[TILESET_TYPE_ADDR] = 0
+    assert collision_map.walkable_table(memory)[0x109] == 1
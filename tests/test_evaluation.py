@@ -0,0 +1,63 @@
+from pyboy_environment.evaluation import (
+    EpisodeSpec,
+    _next_episode,
+    evaluate,
+    make_episodes,
+    summarize,
+)
+
+
+class CountdownEnvironment:
+    # Episodes last seed + 1 steps with a reward of 1 per step
+    def set_seed(self, seed: int) -> None:
+        self.length = seed + 1
+
+    def reset(self) -> list[int]:
+        self.steps = 0
+        return [0]
+
+    def sample_action(self) -> int:
+        return 0
+
+    def step(self, action) -> tuple:
+        self.steps += 1
+        return [self.steps], 1.0, self.steps == self.length, False
+
+    def _get_game_stats(self) -> dict:
+        return {"steps": self.steps}
+
+    def close(self) -> None:
+        pass
+
+
+def make_countdown(spec: EpisodeSpec, env_kwargs: dict) -> CountdownEnvironment:
+    return CountdownEnvironment()
+
+
+def test_evaluate_streams_every_episode():
+    episodes = make_episodes("mario", "run", 24, num_episodes=6, max_steps=4)
+    results = list(
+        evaluate(episodes, num_workers=2, start_method="fork", env_fn=make_countdown)
+    )
+
+    assert sorted(result.spec.seed for result in results) == list(range(6))
+    for result in results:
+        assert result.length == min(result.spec.seed + 1, 4)
+        assert result.episode_return == result.length
+        assert result.game_stats == {"steps": result.length}
+        assert result.truncated == (result.spec.seed >= 4)
+
+    summary = summarize(results)["mario/run@24"]
+    assert summary["episodes"] == 6
+    assert summary["length_max"] == 4
+
+
+def test_longest_expected_episode_dispatched_first():
+    mario = EpisodeSpec("mario", "run", 24, 0)
+    brock = EpisodeSpec("pokemon", "brock", 24, 0)
+    capped = EpisodeSpec("pokemon", "brock", 24, 1, max_steps=10)
+
+    lengths = {mario.key: [100, 300]}
+    assert _next_episode([mario, capped, brock], lengths, {}) == brock
+    assert _next_episode([mario, capped], lengths, {}) == mario
+    assert _next_episode([mario, capped], {}, {("mario", "run"): 5}) == capped
@@ -0,0 +1,70 @@
+from conftest import RIGHT, attach
+
+from pyboy_environment.environments.pokemon.event_tracker import (
+    EVENT_FLAGS_END,
+    EVENT_FLAGS_START,
+    EventTracker,
+)
+from pyboy_environment.environments.pokemon.tasks.catch import PokemonCatch
+
+
+def test_first_update_is_baseline():
+    memory = [0] * 0x10000
+    memory[EVENT_FLAGS_START] = 0b1011
+    tracker = EventTracker()
+    tracker.update(memory)
+
+    assert tracker.count == 3
+    assert tracker.newly_set.size == 0
+    assert tracker.newly_cleared.size == 0
+
+
+def test_flipped_flags():
+    memory = [0] * 0x10000
+    memory[EVENT_FLAGS_START] = 0b0001
+    tracker = EventTracker()
+    tracker.update(memory)
+
+    memory[EVENT_FLAGS_START] = 0b0100
+    memory[EVENT_FLAGS_END - 1] = 0b1000_0000
+    tracker.update(memory)
+
+    last_flag = (EVENT_FLAGS_END - EVENT_FLAGS_START) * 8 - 1
+    assert tracker.newly_set.tolist() == [2, last_flag]
+    assert tracker.newly_cleared.tolist() == [0]
+    assert tracker.count == 2
+    assert tracker.is_set(last_flag)
+    assert not tracker.is_set(0)
+
+    tracker.update(memory)
+    assert tracker.newly_set.size == 0
+    assert tracker.count == 2
+
+
+def test_clear_resets_baseline():
+    memory = [0] * 0x10000
+    tracker = EventTracker()
+    tracker.update(memory)
+
+    memory[EVENT_FLAGS_START + 1] = 0xFF
+    tracker.clear()
+    tracker.update(memory)
+
+    assert tracker.count == 8
+    assert tracker.newly_set.size == 0
+
+
+def test_game_stats_keep_per_byte_events(pyboy):
+    pyboy.memory[EVENT_FLAGS_START] = 0b0001
+    env = attach(PokemonCatch(act_freq=24, headless=True, discrete=True), pyboy)
+    env.reset()
+    stats = env.prior_game_stats
+    assert len(stats["events"]) == EVENT_FLAGS_END - EVENT_FLAGS_START
+    assert stats["events"][0] == 1 and stats["event_count"] == 1
+
+    pyboy.memory[EVENT_FLAGS_START + 1] = 0b0110
+    env.step(RIGHT)
+    stats = env.prior_game_stats
+    assert stats["events"][:3] == [1, 2, 0]
+    assert stats["event_count"] == 3
+    assert stats["new_events"] == [9, 10]
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+
+from pyboy_environment.vector_environment import VecPyboyEnvironment
+
+
+class ResetCountingEnvironment:
+    action_num = 1
+    observation_space = 2
+    min_action_value = 0
+    max_action_value = 1
+
+    def __init__(self) -> None:
+        self.resets = 0
+        self.steps = 0
+
+    def set_seed(self, seed: int) -> None:
+        pass
+
+    def reset(self) -> list[int]:
+        self.resets += 1
+        self.steps = 0
+        return [self.resets, self.steps]
+
+    def sample_action(self) -> int:
+        return 0
+
+    def step(self, action) -> tuple:
+        self.steps += 1
+        return [self.resets, self.steps], 1.0, False, False
+
+    def pid(self) -> int:
+        return os.getpid()
+
+    def close(self) -> None:
+        pass
+
+
+def make_env() -> ResetCountingEnvironment:
+    return ResetCountingEnvironment()
+
+
+def test_workers_forked_from_reset_template():
+    with VecPyboyEnvironment([make_env] * 3, start_method="fork_server") as env:
+        # Every worker starts from the template, which was reset once in the server
+        assert env.get_attr("resets", 0) == 1
+        pids = env.call("pid")
+        assert len(set(pids)) == 3
+
+        states, rewards, _, _ = env.step(np.zeros((3, 1)))
+        assert states.tolist() == [[1, 1]] * 3
+
+        env.recycle(1)
+        assert env.call("pid")[1] not in pids
+        assert env.get_attr("steps", 1) == 0
@@ -0,0 +1,101 @@
+from conftest import RIGHT, attach, walk_slowly
+
+from pyboy_environment.environments.pokemon.frame_skip import (
+    JOY_IGNORE_ADDR,
+    TEXT_ARROW_ADDR,
+    TEXT_ARROW_TILE,
+    WALK_COUNTER_ADDR,
+    FrameSkipper,
+)
+from pyboy_environment.environments.pokemon.macro_actions import (
+    BUTTON_A,
+    FONT_LOADED_ADDR,
+)
+from pyboy_environment.environments.pokemon.tasks.catch import PokemonCatch
+from pyboy_environment.environments.pyboy_environment import PyboyEnvironment
+
+
+class FakeEnvironment:
+    # The walk counter and a cutscene count down every frame, A shows the next of
+    # `pages` text prompts 10 frames later and closes the text box after the last
+    emulation_speed = 1
+    render_mode = "never"
+    valid_actions = [(button, True) for button in range(6)]
+    release_button = [(button, False) for button in range(6)]
+    tick_until = PyboyEnvironment.tick_until
+
+    def __init__(self, pyboy, pages: int = 0) -> None:
+        self.pyboy = pyboy
+        self.frames = 0
+        self.cutscene = 0
+        self.pages = pages
+        self.next_page = None
+
+    def _tick(self, count: int, last: bool = True) -> None:
+        memory = self.pyboy.memory
+        for _ in range(count):
+            self.frames += 1
+            if memory[WALK_COUNTER_ADDR]:
+                memory[WALK_COUNTER_ADDR] -= 1
+            if self.cutscene:
+                self.cutscene -= 1
+                memory[JOY_IGNORE_ADDR] = 0xFF if self.cutscene else 0
+            if BUTTON_A in self.pyboy.held and memory[TEXT_ARROW_ADDR]:
+                memory[TEXT_ARROW_ADDR] = 0
+                self.pages -= 1
+                self.next_page = self.frames + 10
+            if self.next_page == self.frames:
+                if self.pages:
+                    memory[TEXT_ARROW_ADDR] = TEXT_ARROW_TILE
+                else:
+                    memory[FONT_LOADED_ADDR] = 0
+
+
+def test_skips_walking_and_cutscenes(pyboy):
+    env = FakeEnvironment(pyboy)
+    skipper = FrameSkipper(env)
+
+    assert skipper.run() == 0
+
+    env.pyboy.memory[WALK_COUNTER_ADDR] = 7
+    assert 7 <= skipper.run() < 7 + 4
+    assert env.pyboy.memory[WALK_COUNTER_ADDR] == 0
+
+    env.cutscene = 50
+    env.pyboy.memory[JOY_IGNORE_ADDR] = 0xFF
+    assert 50 <= skipper.run() < 50 + 4
+    assert env.pyboy.speeds == [0, 1, 0, 1, 0, 1]
+
+
+def test_advances_dialog_and_budget(pyboy):
+    env = FakeEnvironment(pyboy, pages=3)
+    memory = env.pyboy.memory
+    memory[FONT_LOADED_ADDR] = 1
+    memory[TEXT_ARROW_ADDR] = TEXT_ARROW_TILE
+    skipper = FrameSkipper(env)
+
+    skipper.run()
+    assert env.pages == 0
+    assert memory[FONT_LOADED_ADDR] == 0
+    assert not env.pyboy.held
+
+    memory[WALK_COUNTER_ADDR] = 200
+    assert FrameSkipper(env, frame_budget=100).run() == 100
+
+
+def test_step_reports_skipped_frames(pyboy):
+    env = PokemonCatch(act_freq=24, headless=True, discrete=True, frame_skip=True)
+    attach(env, pyboy)
+
+    pyboy.on_tick = walk_slowly
+    env.reset()
+    env.step(RIGHT)
+    assert env.step_info == {"frames": 24, "skipped_frames": 0}
+
+    # The action ends half way through a step onto the next tile
+    env.act_freq = 8
+    env.step(RIGHT)
+    skipped = env.step_info["skipped_frames"]
+    assert 12 <= skipped < 12 + 4
+    assert env.step_info["frames"] == 8 + skipped
+    assert pyboy.memory[WALK_COUNTER_ADDR] == 0
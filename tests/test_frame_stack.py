@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from pyboy_environment.environments.frame_stack import FrameStack, screen_sample_indexes
+
+
+def make_screen(value: int) -> np.ndarray:
+    screen = np.zeros((144, 160, 4), dtype=np.uint8)
+    screen[:, :, :3] = value
+    screen[:, :, 3] = 255
+    return screen
+
+
+def test_reset_fills_every_frame():
+    frames = FrameStack(height=84, width=84, num_frames=3)
+    view = frames.reset(make_screen(100))
+
+    assert view.shape == (3, 84, 84)
+    assert np.all(view == 100)
+
+
+def test_push_orders_oldest_to_newest():
+    frames = FrameStack(height=42, width=40, num_frames=3)
+    frames.reset(make_screen(0))
+
+    for value in (10, 20, 30, 40):
+        view = frames.push(make_screen(value))
+
+    assert [int(frame[0, 0]) for frame in view] == [20, 30, 40]
+
+
+def test_view_is_read_only_and_reuses_buffer():
+    frames = FrameStack(num_frames=2)
+    first = frames.reset(make_screen(50))
+    second = frames.push(make_screen(60))
+
+    assert np.shares_memory(first, second)
+    with pytest.raises(ValueError):
+        second[0, 0, 0] = 1
+
+
+def test_grayscale_weights():
+    screen = np.zeros((144, 160, 4), dtype=np.uint8)
+    screen[:, :, 0] = 255
+    view = FrameStack(num_frames=1).reset(screen)
+
+    assert int(view[0, 0, 0]) == int(255 * 0.299)
+
+
+def test_screen_sample_indexes_reorder_channels():
+    screen = np.arange(144 * 160 * 4, dtype=np.int64).reshape(144, 160, 4)
+    indexes = screen_sample_indexes(screen.shape, 72, 80, (2, 1, 0))
+    frame = np.take(screen.reshape(-1), indexes)
+
+    assert frame.shape == (72, 80, 3)
+    assert list(frame[1, 1]) == list(screen[2, 2, [2, 1, 0]])
+
+
+def test_state_round_trip():
+    frames = FrameStack(height=42, width=40, num_frames=3)
+    frames.reset(make_screen(0))
+    frames.push(make_screen(10))
+    state = frames.get_state()
+
+    frames.push(make_screen(20))
+    frames.push(make_screen(30))
+    frames.set_state(state)
+    assert [int(frame[0, 0]) for frame in frames.view()] == [0, 0, 10]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from pyboy_environment.environments.game_area import (
+    LCDC_ADDR,
+    LOW_TILEMAP_ADDR,
+    OAM_ADDR,
+    GameArea,
+)
+
+
+def make_memory(seed: int = 0) -> list[int]:
+    memory = [0] * 0x10000
+    memory[LCDC_ADDR] = 0x90  # background map 0x9800, unsigned tile data
+    rng = np.random.default_rng(seed)
+    memory[LOW_TILEMAP_ADDR : LOW_TILEMAP_ADDR + 1024] = rng.integers(
+        0, 256, 1024
+    ).tolist()
+    return memory
+
+
+def test_incremental_updates_match_full_rebuild():
+    memory = make_memory()
+    game_area = GameArea((0, 2, 20, 16))
+    game_area.update(memory, (0, 0))
+
+    memory[LOW_TILEMAP_ADDR + 32 * 3 + 5] = 7
+    memory[LCDC_ADDR] = 0x80  # signed tile data
+    scroll = [(16, 8)] * 8 + [(24, 8)] * 8
+    view = game_area.update(memory, scroll)
+
+    assert np.array_equal(view, GameArea((0, 2, 20, 16)).update(memory, scroll))
+    # Section row 0 is tilemap row 2 + 1, column 0 is tilemap column 0 + 2
+    tile = memory[LOW_TILEMAP_ADDR + 32 * 3 + 2]
+    assert view[0, 0] == (tile + 0x100 if tile < 0x80 else tile)
+    with pytest.raises(ValueError):
+        view[0, 0] = 1
+
+
+def test_sprites_drawn_and_restored():
+    memory = make_memory()
+    mapping = np.arange(0x180) + 1000
+    game_area = GameArea(mapping=mapping, sprites=True)
+    background = game_area.update(memory, (0, 0)).copy()
+
+    memory[OAM_ADDR : OAM_ADDR + 8] = [16 + 8, 8 + 16, 3, 0, 16 + 8, 8 + 16, 4, 0]
+    view = game_area.update(memory, (0, 0))
+    assert view[1, 2] == 1004
+    assert np.count_nonzero(view != background) == 1
+
+    memory[OAM_ADDR : OAM_ADDR + 8] = [0] * 8
+    assert np.array_equal(game_area.update(memory, (0, 0)), background)
@@ -0,0 +1,122 @@
+from pyboy_environment.environments.pokemon.macro_actions import (
+    BATTLE_ADDR,
+    BATTLE_MENU_COLUMNS,
+    BUTTON_A,
+    CURRENT_MENU_ITEM_ADDR,
+    DOWN,
+    FONT_LOADED_ADDR,
+    LEFT,
+    MACRO_ACTIONS,
+    MAX_MENU_ITEM_ADDR,
+    RIGHT,
+    TOP_MENU_ITEM_X_ADDR,
+    UP,
+    X_ADDR,
+    MacroAction,
+    MacroActionRunner,
+)
+
+
+class FakeEnvironment:
+    # Holding right moves one tile every 8 frames up to x = 10 when no text box or
+    # menu is shown. Up/down move the menu cursor, left/right switch battle menu
+    # columns and A closes the text box or menu, recording the selected item.
+    act_freq = 24
+    valid_actions = [(button, True) for button in range(6)]
+    release_button = [(button, False) for button in range(6)]
+
+    def __init__(self, pyboy) -> None:
+        self.pyboy = pyboy
+        self.frames = 0
+        self.selected = None
+
+    def _tick(self, count: int, last: bool = True) -> None:
+        memory = self.pyboy.memory
+        for button in self.pyboy.pressed:
+            self._press(button)
+        self.pyboy.pressed.clear()
+        for _ in range(count):
+            self.frames += 1
+            if (
+                RIGHT in self.pyboy.held
+                and not memory[FONT_LOADED_ADDR]
+                and self.frames % 8 == 0
+            ):
+                memory[X_ADDR] = min(memory[X_ADDR] + 1, 10)
+
+    def _press(self, button: int) -> None:
+        memory = self.pyboy.memory
+        if not memory[FONT_LOADED_ADDR]:
+            return
+        current = memory[CURRENT_MENU_ITEM_ADDR]
+        if button == DOWN:
+            memory[CURRENT_MENU_ITEM_ADDR] = min(
+                current + 1, memory[MAX_MENU_ITEM_ADDR]
+            )
+        elif button == UP:
+            memory[CURRENT_MENU_ITEM_ADDR] = max(current - 1, 0)
+        elif button in (LEFT, RIGHT) and memory[BATTLE_ADDR]:
+            memory[TOP_MENU_ITEM_X_ADDR] = BATTLE_MENU_COLUMNS[button == RIGHT]
+        elif button == BUTTON_A:
+            memory[FONT_LOADED_ADDR] = 0
+            right = memory[TOP_MENU_ITEM_X_ADDR] == BATTLE_MENU_COLUMNS[1]
+            self.selected = current + 2 * right
+
+    def _press_button(self, button: int) -> None:
+        self._tick(self.act_freq)
+
+
+def test_macro_table():
+    assert MACRO_ACTIONS[:6] == tuple(MacroAction("press", b) for b in range(6))
+    assert len(MACRO_ACTIONS) == 6 + 16 + 1 + 4
+
+
+def test_walk_stops_after_count_or_when_blocked(pyboy):
+    env = FakeEnvironment(pyboy)
+    runner = MacroActionRunner(env)
+
+    runner.run(MacroAction("walk", RIGHT, 4))
+    assert env.pyboy.memory[X_ADDR] == 4
+    assert not env.pyboy.held
+
+    frames = runner.run(MacroAction("walk", RIGHT, 8))
+    assert env.pyboy.memory[X_ADDR] == 10
+    assert frames < runner.frame_budget
+
+
+def test_clear_text_and_budget(pyboy):
+    env = FakeEnvironment(pyboy)
+    env.pyboy.memory[FONT_LOADED_ADDR] = 1
+    runner = MacroActionRunner(env, frame_budget=100)
+
+    runner.run(MacroAction("clear_text"))
+    assert env.pyboy.memory[FONT_LOADED_ADDR] == 0
+
+    frames = runner.run(MacroAction("walk", RIGHT, 8))
+    assert frames <= 100 + 8
+
+
+def test_select_menu_item(pyboy):
+    env = FakeEnvironment(pyboy)
+    memory = env.pyboy.memory
+    runner = MacroActionRunner(env)
+
+    # No menu - nothing is pressed
+    runner.run(MacroAction("select_menu_item", count=2))
+    assert not env.pyboy.pressed and env.selected is None
+
+    memory[FONT_LOADED_ADDR] = 1
+    memory[MAX_MENU_ITEM_ADDR] = 3
+    runner.run(MacroAction("select_menu_item", count=2))
+    assert memory[CURRENT_MENU_ITEM_ADDR] == 2
+    assert env.selected == 2
+
+    # Battle menu - RUN is the bottom item of the right column
+    for item in (3, 0):
+        memory[FONT_LOADED_ADDR] = 1
+        memory[BATTLE_ADDR] = 1
+        memory[MAX_MENU_ITEM_ADDR] = 1
+        memory[CURRENT_MENU_ITEM_ADDR] = 0
+        memory[TOP_MENU_ITEM_X_ADDR] = BATTLE_MENU_COLUMNS[0]
+        runner.run(MacroAction("select_menu_item", count=item))
+        assert env.selected == item
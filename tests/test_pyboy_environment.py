@@ -0,0 +1,96 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from conftest import RIGHT, X_ADDR, FakePyBoy
+from pyboy_environment.environments.pyboy_environment import (
+    RENDER_ALWAYS,
+    RENDER_LAST,
+    RENDER_NEVER,
+)
+
+
+def test_game_stats_cached_per_frame_and_invalidated(brock, pyboy):
+    env = brock
+    generated = []
+    generate = env._generate_game_stats
+    env._generate_game_stats = lambda: generated.append(pyboy.frame_count) or generate()
+
+    env.reset()
+    env._get_game_stats()
+    assert len(generated) == 1
+
+    env.step(RIGHT)
+    assert len(generated) == 2
+    assert env._get_game_stats()["x"] == 1
+    snapshot = env.snapshot()
+
+    # load_state changes RAM without a tick, the fake keeps the frame count as is
+    env.step(RIGHT)
+    env.restore(snapshot)
+    assert env._get_game_stats()["x"] == 1
+    env.reset()
+    assert env._get_game_stats()["x"] == 0
+    assert pyboy.memory[X_ADDR] == 0
+    assert len(generated) == 5
+
+
+@pytest.mark.parametrize(
+    "render_mode, rendered",
+    [
+        (RENDER_NEVER, []),
+        (RENDER_LAST, [24, 48]),
+        (RENDER_ALWAYS, list(range(1, 49))),
+    ],
+)
+def test_rendered_ticks(brock, pyboy, render_mode, rendered):
+    env = brock
+    env.render_mode = render_mode
+    env.reset()
+    env.step(RIGHT)
+    env.step(RIGHT)
+    assert pyboy.rendered == rendered
+
+
+def test_suite_import_does_not_load_pyboy():
+    code = "import sys, pyboy_environment.suite; print('pyboy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_emulator_built_on_first_use(monkeypatch):
+    from pyboy_environment.environments.pokemon.tasks.brock import PokemonBrock
+
+    built = []
+    monkeypatch.setattr(
+        PokemonBrock,
+        "_start_emulator",
+        lambda self: built.append(FakePyBoy()) or built[-1],
+    )
+    env = PokemonBrock(act_freq=24, headless=True)
+    assert env._pyboy is None and not built
+
+    assert env.pyboy is env.pyboy
+    assert len(built) == 1
+    env.close()
+    assert env._pyboy is None
+
+
+def test_grab_frame_returns_new_frames(brock, pyboy):
+    screen = pyboy.screen.ndarray
+    screen[:, :, 0] = 200  # red
+    first = brock.grab_frame()
+    assert first.shape == (240, 300, 3)
+    assert first[0, 0].tolist() == [0, 0, 200]
+
+    screen[:, :, 0] = 100
+    second = brock.grab_frame()
+    assert first[0, 0, 2] == 200 and second[0, 0, 2] == 100
+
+    out = np.empty((72, 80, 3), dtype=np.uint8)
+    assert brock.grab_frame(72, 80, out=out) is out
+    assert (out[:, :, 2] == 100).all()
@@ -0,0 +1,80 @@
+import pytest
+
+from pyboy_environment.environments.pyboy_environment import PyboyEnvironment
+from pyboy_environment.environments.ram_condition import RamCondition, RamPredicate
+
+
+def test_predicate_all_any_and_changed():
+    memory = [0] * 0x10000
+    memory[0xD057] = 1
+    predicate = RamPredicate([(0xD057, 0xFF, "changed"), (0xCFC5, 0x0F, "==", 0)])
+    predicate.start(memory)
+    assert not predicate(memory)
+
+    memory[0xD057] = 0
+    memory[0xCFC5] = 0x30  # masked out
+    assert predicate(memory)
+
+    memory[0xD057] = 1
+    either = RamPredicate([RamCondition(0xD057, op=">", value=1), (0xCFC5,)], True)
+    assert not either(memory)
+    memory[0xCFC5] = 0
+    assert either(memory)
+
+
+def test_unknown_op():
+    with pytest.raises(ValueError):
+        RamCondition(0xD057, op="in")
+
+
+def countdown(pyboy) -> None:
+    # 0xCFC5 counts down by one every frame, like the walk counter
+    pyboy.memory[0xCFC5] = max(pyboy.memory[0xCFC5] - 1, 0)
+
+
+class CountdownEnvironment:
+    tick_until = PyboyEnvironment.tick_until
+    _tick = PyboyEnvironment._tick
+
+    def __init__(self, pyboy, counter: int, render_mode: str = "never") -> None:
+        self.pyboy = pyboy
+        self.pyboy.on_tick = countdown
+        self.pyboy.memory[0xCFC5] = counter
+        self.render_mode = render_mode
+
+
+def test_tick_until_returns_frames_used(pyboy):
+    walk_done = [RamCondition(0xCFC5, op="==", value=0)]
+    assert CountdownEnvironment(pyboy, 5).tick_until(walk_done, 20) == 5
+    assert pyboy.frame_count == 5
+    # Already holds - no frame is run
+    assert CountdownEnvironment(pyboy, 0).tick_until(walk_done, 20) == 0
+    assert pyboy.frame_count == 5
+    # Checked after each chunk, the chunk is run in full
+    env = CountdownEnvironment(pyboy, 5)
+    assert env.tick_until(walk_done, 20, check_every=4) == 8
+    assert CountdownEnvironment(pyboy, 50).tick_until(walk_done, 20) == 20
+    assert pyboy.rendered == []
+
+
+def test_tick_until_stops_when_changed(pyboy):
+    changed = [RamCondition(0xCFC5, op="changed")]
+    env = CountdownEnvironment(pyboy, 5)
+    assert env.tick_until(changed, 20) == 1
+    assert pyboy.memory[0xCFC5] == 4
+
+
+def test_tick_until_renders_only_the_last_frame(pyboy):
+    walk_done = [RamCondition(0xCFC5, op="==", value=0)]
+    # Checked the frame before each chunk ends, so one frame runs after it holds
+    env = CountdownEnvironment(pyboy, 30, render_mode="last")
+    assert env.tick_until(walk_done, 100, check_every=4) == 32
+    assert pyboy.rendered == [32]
+
+    env = CountdownEnvironment(pyboy, 5, render_mode="last")
+    assert env.tick_until(walk_done, 20) == 6
+    assert pyboy.rendered == [32, 38]
+
+    env = CountdownEnvironment(pyboy, 50, render_mode="last")
+    assert env.tick_until(walk_done, 20) == 20
+    assert pyboy.rendered == [32, 38, 58]
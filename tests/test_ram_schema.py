@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from pyboy_environment.environments.ram_schema import RamField, RamSchema
+
+
+@pytest.fixture(name="memory")
+def fixture_memory():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=0x10000).tolist()
+
+
+def test_uint_endianness(memory):
+    schema = RamSchema(
+        [
+            RamField("u8", 0xD000),
+            RamField("u16", 0xD010, width=2),
+            RamField("u24_le", 0xD020, width=3, endian="little"),
+        ]
+    )
+    values = schema.decode(memory)
+
+    assert values["u8"] == memory[0xD000]
+    assert values["u16"] == 256 * memory[0xD010] + memory[0xD011]
+    assert values["u24_le"] == (
+        memory[0xD020] + 256 * memory[0xD021] + 256 * 256 * memory[0xD022]
+    )
+
+
+def test_strided_lists(memory):
+    schema = RamSchema(
+        [
+            RamField("levels", 0xD18C, count=6, stride=44),
+            RamField("hp", 0xD16C, width=2, count=6, stride=44),
+            RamField("types", 0xD170, width=2, encoding="raw", count=6, stride=44),
+        ]
+    )
+    values = schema.decode(memory)
+
+    assert values["levels"] == [memory[0xD18C + 44 * i] for i in range(6)]
+    assert values["hp"] == [
+        256 * memory[0xD16C + 44 * i] + memory[0xD16D + 44 * i] for i in range(6)
+    ]
+    assert values["types"] == [
+        memory[0xD170 + 44 * i + j] for i in range(6) for j in range(2)
+    ]
+
+
+def test_bcd_digits_and_bitcount(memory):
+    memory[0xD347:0xD34A] = [0x12, 0x34, 0x56]
+    memory[0x9831:0x9834] = [4, 0, 7]
+    schema = RamSchema(
+        [
+            RamField("money", 0xD347, width=3, encoding="bcd"),
+            RamField("time", 0x9831, width=3, encoding="digits"),
+            RamField("caught", 0xD2F7, width=19, encoding="bitcount"),
+            RamField("events", 0xD747, encoding="bitcount", count=4),
+        ]
+    )
+    values = schema.decode(memory)
+
+    assert values["money"] == 123456
+    assert values["time"] == 407
+    assert values["caught"] == sum(
+        bin(memory[addr]).count("1") for addr in range(0xD2F7, 0xD30A)
+    )
+    assert values["events"] == [
+        bin(memory[addr]).count("1") for addr in range(0xD747, 0xD74B)
+    ]
+
+
+def test_segments_merge_nearby_fields():
+    schema = RamSchema(
+        [RamField("a", 0xD000), RamField("b", 0xD010), RamField("c", 0xFF80)],
+        max_gap=32,
+    )
+    assert schema.segments == [(0xD000, 0xD011), (0xFF80, 0xFF81)]
+
+
+def test_invalid_schema():
+    with pytest.raises(ValueError):
+        RamSchema([RamField("a", 0xD000), RamField("a", 0xD001)])
+    with pytest.raises(ValueError):
+        RamSchema([RamField("a", 0xD000, encoding="float")])
@@ -0,0 +1,47 @@
+from pyboy_environment.environments.pokemon.ram_structs import (
+    BAG_COUNT_ADDR,
+    BATTLE_MON_DTYPE,
+    ENEMY_BATTLE_MON_ADDR,
+    PARTY_ADDR,
+    PARTY_MON_DTYPE,
+    PokemonStructs,
+    pokeball_count,
+)
+
+
+def test_struct_sizes():
+    assert PARTY_MON_DTYPE.itemsize == 44
+    assert BATTLE_MON_DTYPE.itemsize == 29
+
+
+def test_party_fields_match_ram_addresses():
+    memory = [0] * 0x10000
+    second = PARTY_ADDR + 44
+    memory[0xD18C + 44] = 12  # level
+    memory[0xD16C + 44 : 0xD16E + 44] = [0x01, 0x2C]  # hp
+    memory[0xD179 + 44 : 0xD17C + 44] = [0x01, 0x00, 0x05]  # exp
+    memory[second + 5 : second + 7] = [0x14, 0x03]  # types
+
+    structs = PokemonStructs()
+    structs.update(memory)
+
+    assert structs.party["level"][1] == 12
+    assert structs.party["hp"][1] == 300
+    assert structs.party_exp()[1] == 65536 + 5
+    assert structs.party["type"][1].tolist() == [0x14, 0x03]
+
+
+def test_enemy_and_bag():
+    memory = [0] * 0x10000
+    memory[ENEMY_BATTLE_MON_ADDR + 1 : ENEMY_BATTLE_MON_ADDR + 3] = [0x00, 0x2A]
+    memory[BAG_COUNT_ADDR : BAG_COUNT_ADDR + 6] = [2, 0x04, 5, 0x14, 1, 0xFF]
+    memory[BAG_COUNT_ADDR + 6] = 0x03  # stale data after the terminator
+
+    structs = PokemonStructs()
+    structs.update(memory)
+
+    assert int(structs.enemy["hp"]) == 42
+    assert structs.bag_size == 2
+    assert structs.bag.shape == (20,)
+    assert structs.bag["item"][:3].tolist() == [0x04, 0x14, 0]
+    assert pokeball_count(structs.bag) == 5
@@ -0,0 +1,60 @@
+import numpy as np
+
+from conftest import RIGHT, UP, X_ADDR, Y_ADDR
+
+from pyboy_environment.replay import ReplayRunner, ram_checksum
+
+
+class AddingEnvironment:
+    # Each action adds to one RAM byte, so checksums only depend on the actions
+    def __init__(self, pyboy) -> None:
+        self.pyboy = pyboy
+        self.act_freq = 1
+        self.render_mode = "last"
+        self.emulation_speed = 0
+        self.prior_game_stats = None
+
+    def reset(self) -> None:
+        self.pyboy.memory[0xC000] = 0
+
+    def _run_action_on_emulator(self, action) -> None:
+        memory = self.pyboy.memory
+        memory[0xC000] = (memory[0xC000] + action) % 256
+
+    def _invalidate_game_stats(self) -> None:
+        pass
+
+
+def test_replay_is_deterministic_and_finds_divergence(pyboy):
+    runner = ReplayRunner(AddingEnvironment(pyboy))
+    actions = [1, 2, 3, 4]
+
+    first = runner.run(actions)
+    assert first.matched
+    assert first.steps == 4
+    assert first.checksums[0] == ram_checksum([0] * 0xC000 + [1] + [0] * 0x3FFF)
+    assert runner.env.render_mode == "last"
+
+    assert runner.run(actions, expected=first.checksums).matched
+
+    diverged = runner.run([1, 2, 5, 4], expected=first.checksums)
+    assert diverged.divergent_step == 2
+    assert diverged.steps == 3
+
+    shorter = runner.run(actions[:3], expected=first.checksums)
+    assert shorter.divergent_step == 3
+    assert np.array_equal(shorter.checksums, first.checksums[:3])
+
+
+def test_replay_leaves_environment_settings(brock, pyboy):
+    env = brock
+    env.reset()
+    env.step(RIGHT)
+    coverage = env.visit_counts.coverage
+
+    result = ReplayRunner(env).run([RIGHT, UP, RIGHT], act_freq=8)
+    assert result.steps == 3
+    assert (pyboy.memory[X_ADDR], pyboy.memory[Y_ADDR]) == (2, 19)
+    assert env.act_freq == 24
+    assert env.visit_counts.coverage == coverage
+    assert env.prior_game_stats is None
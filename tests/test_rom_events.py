@@ -0,0 +1,91 @@
+from conftest import RIGHT, attach
+
+from pyboy_environment.environments.pokemon.macro_actions import FONT_LOADED_ADDR
+from pyboy_environment.environments.pokemon.ram_structs import BAG_COUNT_ADDR
+from pyboy_environment.environments.pokemon.rom_events import (
+    EVENT_FRAMES,
+    ROM_HOOKS,
+    STRUCT_FRAMES,
+    RomEvents,
+)
+from pyboy_environment.environments.pokemon.tasks.catch import PokemonCatch
+
+
+def test_events_are_queued_per_step(pyboy):
+    events = RomEvents()
+    events.register(pyboy)
+    memory = [0] * 0x10000
+    assert events.hooked == set(ROM_HOOKS)
+
+    pyboy.call("InitBattle")
+    pyboy.call("UseItem_")
+    step = events.take(memory, frame=100)
+    assert step == {"battle_start": 1, "item_use": 1, "level_up": 1}
+    assert events.is_active("battle_start") and not events.is_active("catch")
+    assert events.structs_changed()
+
+    # Text boxes keep events active, after that they expire
+    memory[FONT_LOADED_ADDR] = 1
+    assert events.take(memory, frame=100 + 2 * EVENT_FRAMES) == {}
+    assert events.is_active("battle_start")
+    memory[FONT_LOADED_ADDR] = 0
+    events.take(memory, frame=100 + 3 * EVENT_FRAMES + 1)
+    assert not events.is_active("battle_start")
+    assert not events.structs_changed()
+
+
+def test_missing_symbols_keep_events_active(pyboy):
+    pyboy.missing_symbols = ("HealParty",)
+    events = RomEvents()
+    events.register(pyboy)
+
+    assert "party_change" not in events.hooked
+    assert events.is_active("party_change")
+    assert events.structs_changed()
+    assert not events.is_active("map_load")
+
+
+def test_state_round_trip_keeps_active_events(pyboy):
+    events = RomEvents()
+    events.register(pyboy)
+    memory = [0] * 0x10000
+
+    pyboy.call("ItemUseBall")
+    events.take(memory, frame=1000)
+    state = events.get_state(frame=1100)
+
+    events.clear()
+    # Restored later in pyboy's frame count, with the same age
+    events.set_state(state, frame=5100)
+    assert events.step == {"ball_throw": 1}
+    assert events.is_active("ball_throw")
+    events.take(memory, frame=5100 + EVENT_FRAMES - 100)
+    assert events.is_active("ball_throw")
+    events.take(memory, frame=5100 + EVENT_FRAMES)
+    assert not events.is_active("ball_throw")
+
+
+def test_environment_rereads_structs_without_hooks(pyboy):
+    env = attach(
+        PokemonCatch(act_freq=24, headless=True, discrete=True, rom_hooks=True), pyboy
+    )
+    env.reset()
+    env.step(RIGHT)
+    env.step(RIGHT)
+    assert env.prior_game_stats["items"]["quantity"].sum() == 0
+
+    # A routine that is not hooked gives 5 poke balls
+    pyboy.memory[BAG_COUNT_ADDR : BAG_COUNT_ADDR + 3] = [1, 4, 5]
+    env.step(RIGHT)
+    assert env.prior_game_stats["items"]["quantity"].sum() == 0
+
+    # Read again after a map load
+    pyboy.call("LoadMapData")
+    env.step(RIGHT)
+    assert env.prior_game_stats["items"]["quantity"].sum() == 5
+
+    # and at most STRUCT_FRAMES after the last read
+    pyboy.memory[BAG_COUNT_ADDR + 2] = 3
+    while pyboy.frame_count < 2 * STRUCT_FRAMES:
+        env.step(RIGHT)
+    assert env.prior_game_stats["items"]["quantity"].sum() == 3
@@ -0,0 +1,97 @@
+import pickle
+
+import numpy as np
+
+from conftest import RIGHT, UP, X_ADDR, Y_ADDR, attach, walk_slowly
+
+from pyboy_environment.environments.pokemon.event_tracker import EVENT_FLAGS_START
+from pyboy_environment.environments.pokemon.macro_actions import (
+    MACRO_ACTIONS,
+    MacroAction,
+)
+from pyboy_environment.environments.pokemon.tasks.brock import PokemonBrock
+from pyboy_environment.environments.step_metrics import PhaseStats
+
+
+def test_snapshot_restore_round_trip(brock, pyboy):
+    env = brock
+    env.reset()
+    for action in (RIGHT, UP):
+        env.step(action)
+
+    snapshot = pickle.loads(pickle.dumps(env.snapshot()))
+    tasks, current_task = list(env.tasks), env.current_task
+    branch = [env.step(action) for action in (UP, RIGHT, UP)]
+    memory = list(pyboy.memory)
+
+    env.tasks[current_task + 1] = 1
+    env.current_task += 1
+    env.restore(snapshot)
+    assert env.steps == 2
+    assert (pyboy.memory[X_ADDR], pyboy.memory[Y_ADDR]) == (1, 19)
+    assert env.prior_game_stats["x"] == 1
+    assert (env.tasks, env.current_task) == (tasks, current_task)
+
+    # The same actions from the snapshot give the same steps
+    replay = [env.step(action) for action in (UP, RIGHT, UP)]
+    assert [step[1:] for step in replay] == [step[1:] for step in branch]
+    assert [list(step[0]) for step in replay] == [list(step[0]) for step in branch]
+    assert pyboy.memory == memory
+
+
+def comparable(value):
+    # Episode state as plain values - timings differ between runs, counts do not
+    if isinstance(value, PhaseStats):
+        return value.count
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: comparable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [comparable(item) for item in value]
+    return value
+
+
+def test_snapshot_covers_every_feature(pyboy):
+    # Actions end half way through a step onto the next tile, so frames are skipped
+    env = PokemonBrock(
+        act_freq=8,
+        headless=True,
+        discrete=True,
+        observation_mode="pixels",
+        macro_actions=True,
+        frame_skip=True,
+        rom_hooks=True,
+    )
+    attach(env, pyboy)
+    env.metrics.enable()
+
+    def tick(pyboy) -> None:
+        walk_slowly(pyboy)
+        pyboy.screen.ndarray[:] = 10 * pyboy.memory[X_ADDR]
+
+    pyboy.on_tick = tick
+    env.reset()
+    env.step(RIGHT)
+    pyboy.call("InitBattle")
+    pyboy.memory[EVENT_FLAGS_START] = 1
+    env.step(UP)
+
+    snapshot = env.snapshot()
+    episode_state = comparable(env._get_episode_state())
+    assert env.step_info["skipped_frames"] > 0
+    assert env.rom_events.is_active("battle_start")
+
+    def branch() -> list:
+        steps = []
+        # Ends with a longer macro action than the step before the snapshot
+        for action in (RIGHT, UP, MACRO_ACTIONS.index(MacroAction("walk", RIGHT, 2))):
+            pyboy.call("UseItem_")
+            pyboy.memory[EVENT_FLAGS_START] += 2
+            steps.append(comparable(env.step(action)))
+        return steps + [comparable(env._get_episode_state())]
+
+    first = branch()
+    env.restore(snapshot)
+    assert comparable(env._get_episode_state()) == episode_state
+    assert branch() == first
@@ -0,0 +1,46 @@
+import pytest
+
+from pyboy_environment.environments.step_metrics import StepMetrics
+
+
+def test_disabled_metrics_only_call_through():
+    metrics = StepMetrics()
+    calls = []
+    metrics.register_callback("reward", before=calls.append)
+
+    assert metrics.measure("reward", lambda x: x + 1, 1) == 2
+    assert metrics.summary()["reward"]["count"] == 0
+    assert not calls
+
+
+def test_enabled_metrics_record_and_call_back():
+    metrics = StepMetrics(enabled=True)
+    before, after = [], []
+    metrics.register_callback(
+        "reward", before=before.append, after=lambda p, t: after.append((p, t))
+    )
+
+    for _ in range(3):
+        metrics.measure("reward", sum, [1, 2])
+
+    summary = metrics.summary()["reward"]
+    assert summary["count"] == 3
+    assert metrics.histogram("reward").sum() == 3
+    assert before == ["reward"] * 3
+    assert [phase for phase, _ in after] == ["reward"] * 3
+
+
+def test_episode_stats_reset_per_episode():
+    metrics = StepMetrics(enabled=True)
+    metrics.measure("step", int)
+    metrics.end_episode()
+    metrics.measure("step", int)
+
+    assert metrics.episodes == 1
+    assert metrics.summary(episode=True)["step"]["count"] == 1
+    assert metrics.summary()["step"]["count"] == 2
+
+
+def test_unknown_phase():
+    with pytest.raises(ValueError):
+        StepMetrics().register_callback("render", before=print)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from pyboy_environment.trajectory import TrajectoryReader, TrajectoryRecorder
+
+
+class CountingEnvironment:
+    # Minimal stand in for a PyboyEnvironment - the state is the step count
+    observation_space = 2
+    action_num = 1
+    discrete = True
+
+    def __init__(self) -> None:
+        self.steps = 0
+        self.closed = False
+
+    def reset(self) -> list[int]:
+        self.steps = 0
+        return [0, 0]
+
+    def step(self, action) -> tuple:
+        self.steps += 1
+        return [self.steps, action], float(action), self.steps == 5, False
+
+    def _get_game_stats(self) -> dict:
+        return {"location": {"x": self.steps * 2}}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_record_and_stream(tmp_path, compress):
+    env = TrajectoryRecorder(
+        CountingEnvironment(),
+        tmp_path,
+        stats=["location.x"],
+        chunk_size=4,
+        compress=compress,
+    )
+    env.reset()
+    for action in range(11):
+        _, _, done, _ = env.step(action)
+        if done:
+            env.reset()
+    env.close()
+    assert env.env.closed
+
+    reader = TrajectoryReader(tmp_path)
+    assert len(reader) == 11
+    assert [chunk["rows"] for chunk in reader.chunks] == [4, 4, 3]
+
+    batches = list(reader.batches(5))
+    assert [len(batch["reward"]) for batch in batches] == [5, 5, 1]
+
+    rows = {name: np.concatenate([b[name] for b in batches]) for name in batches[0]}
+    assert rows["action"].tolist() == list(range(11))
+    assert rows["obs"][:6, 0].tolist() == [0, 1, 2, 3, 4, 0]
+    assert rows["done"].tolist() == [False] * 4 + [True] + [False] * 4 + [True, False]
+    assert rows["episode"].tolist() == [0] * 5 + [1] * 5 + [2]
+    assert rows["location.x"][:2].tolist() == [2, 4]
+
+
+def test_fixed_dtypes_and_final_observation(tmp_path):
+    # Brock style integer base reward first, then fractional rewards
+    class TruncatingEnvironment(CountingEnvironment):
+        def step(self, action) -> tuple:
+            self.steps += 1
+            reward = -2 if self.steps == 1 else -1.25
+            return [self.steps, action], reward, False, self.steps == 3
+
+    env = TrajectoryRecorder(TruncatingEnvironment(), tmp_path, stats=["location.x"])
+    env.reset()
+    for action in range(3):
+        env.step(action)
+    env.close()
+
+    (batch,) = TrajectoryReader(tmp_path).batches(8)
+    assert batch["reward"].tolist() == [-2, -1.25, -1.25]
+    assert batch["truncated"].dtype == np.bool_
+    assert batch["truncated"].tolist() == [False, False, True]
+    assert batch["action"].dtype == np.int64
+    # The truncated transition keeps the observation it ended in
+    assert batch["next_obs"].tolist() == [[1, 0], [2, 1], [3, 2]]
+    assert batch["obs"][1:].tolist() == batch["next_obs"][:-1].tolist()
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from pyboy_environment.environments.frame_stack import FrameStack
+from pyboy_environment.vector_environment import VecPyboyEnvironment
+
+
+class CountingEnvironment:
+    # The state is (steps, action), an episode is done after 3 steps
+    action_num = 1
+    observation_space = 2
+    min_action_value = 0
+    max_action_value = 1
+
+    def __init__(self) -> None:
+        self.steps = 0
+
+    def set_seed(self, seed: int) -> None:
+        pass
+
+    def reset(self) -> list[int]:
+        self.steps = 0
+        return [0, 0]
+
+    def sample_action(self) -> int:
+        return 0
+
+    def step(self, action) -> tuple:
+        self.steps += 1
+        return [self.steps, int(action[0])], 1.0, self.steps == 3, False
+
+    def close(self) -> None:
+        pass
+
+
+class PixelEnvironment(CountingEnvironment):
+    # Screens are filled with 10 * steps, and 200 after a reset
+    def __init__(self) -> None:
+        super().__init__()
+        self.frame_stack = FrameStack(2, 2, num_frames=2, screen_shape=(2, 2, 4))
+
+    def reset(self) -> np.ndarray:
+        self.steps = 0
+        return self.frame_stack.reset(np.full((2, 2, 4), 200, dtype=np.uint8))
+
+    def step(self, action) -> tuple:
+        self.steps += 1
+        screen = np.full((2, 2, 4), 10 * self.steps, dtype=np.uint8)
+        return self.frame_stack.push(screen), 1.0, self.steps == 3, False
+
+
+def make_env() -> CountingEnvironment:
+    return CountingEnvironment()
+
+
+def make_pixel_env() -> PixelEnvironment:
+    return PixelEnvironment()
+
+
+def test_step_async_and_wait_guards():
+    with VecPyboyEnvironment([make_env] * 3, start_method="fork") as env:
+        env.reset()
+
+        env.step_async(np.array([[1], [2]]), indices=[0, 2])
+        with pytest.raises(RuntimeError):
+            env.step_async(np.array([[1]]), indices=[2])
+        for guarded in (env.reset, env.sample_action, lambda: env.call("reset")):
+            with pytest.raises(RuntimeError):
+                guarded()
+        # Workers without a step in flight stay available
+        assert env.get_attr("steps", 1) == 0
+
+        states, rewards, _, _ = env.step_wait(indices=[0, 2])
+        assert states.tolist() == [[1, 1], [1, 2]]
+        assert rewards.tolist() == [1.0, 1.0]
+        with pytest.raises(RuntimeError):
+            env.step_wait(indices=[0])
+
+
+def test_auto_reset_keeps_final_states():
+    with VecPyboyEnvironment([make_env] * 2, start_method="fork") as env:
+        env.reset()
+        env.step(np.ones((2, 1)))
+        env.step_async(np.ones((1, 1)), indices=[0])
+        env.step_wait(indices=[0])
+
+        states, _, dones, _ = env.step(np.full((2, 1), 2))
+        # Worker 0 finished its episode and was reset in place
+        assert dones.tolist() == [True, False]
+        assert states.tolist() == [[0, 0], [2, 2]]
+        assert env.final_states[0].tolist() == [3, 2]
+        assert env.final_states[1] is None
+
+        states, _, dones, _ = env.step(np.full((2, 1), 3))
+        assert dones.tolist() == [False, True]
+        assert states.tolist() == [[1, 3], [0, 0]]
+        assert env.final_states[0] is None
+        assert env.final_states[1].tolist() == [3, 3]
+
+
+def test_auto_reset_copies_pixel_final_states():
+    with VecPyboyEnvironment([make_pixel_env], start_method="fork") as env:
+        env.reset()
+        for _ in range(3):
+            states, _, dones, _ = env.step(np.zeros((1, 1)))
+
+        assert dones.tolist() == [True]
+        assert (states[0] == 200).all()
+        final_state = env.final_states[0]
+        assert final_state[:, 0, 0].tolist() == [20, 30]
+        assert not np.array_equal(final_state, states[0])
@@ -0,0 +1,87 @@
+import pickle
+
+import numpy as np
+
+from pyboy_environment.environments.pokemon.visit_counts import (
+    MAX_COUNT,
+    VisitCounts,
+    enable_visit_sharing,
+    share_visits,
+)
+
+
+def test_visit_and_grow():
+    counts = VisitCounts()
+    assert counts.visit(1, 2, 3) == 1
+    assert counts.visit(1, 2, 3) == 2
+    counts.visit(1, 40, 100)
+
+    assert counts.grids[1].shape == (128, 64)
+    assert counts.count(1, 2, 3) == 2
+    assert counts.count(7, 2, 3) == 0
+    assert counts.coverage == 2
+    assert counts.map_coverage() == {1: 2}
+    assert counts.novelty(1, 2, 3) == 1 / np.sqrt(2)
+
+
+def test_merge_saturates_and_round_trips():
+    counts, other = VisitCounts(), VisitCounts()
+    counts.visit(1, 0, 0)
+    other.grids[1] = np.full((32, 32), MAX_COUNT, dtype=np.uint16)
+    other.coverage = 32 * 32
+
+    counts.merge(other)
+    assert counts.count(1, 0, 0) == MAX_COUNT
+    assert counts.coverage == 32 * 32
+
+    restored = VisitCounts()
+    restored.set_state(pickle.loads(pickle.dumps(counts.get_state())))
+    assert np.array_equal(restored.grids[1], counts.grids[1])
+    assert restored.coverage == counts.coverage
+
+
+class FakeWorker:
+    # The visit sharing methods of PokemonEnvironment
+    def __init__(self) -> None:
+        self.visit_counts = VisitCounts()
+
+    def set_visit_sharing(self, share: bool) -> None:
+        self.visit_counts.share = share
+
+    def take_visits(self) -> np.ndarray:
+        return self.visit_counts.take_visits()
+
+    def add_visits(self, visits: np.ndarray) -> None:
+        self.visit_counts.add_visits(visits)
+
+
+class FakeVecEnvironment:
+    def __init__(self, num_envs: int) -> None:
+        self.workers = [FakeWorker() for _ in range(num_envs)]
+        self.counts = [worker.visit_counts for worker in self.workers]
+
+    def call(self, name: str, *args) -> list:
+        return [getattr(worker, name)(*args) for worker in self.workers]
+
+    def call_each(self, name: str, args: list) -> list:
+        return [getattr(worker, name)(arg) for worker, arg in zip(self.workers, args)]
+
+
+def test_share_visits():
+    vec_env = FakeVecEnvironment(3)
+    # Nothing is kept for sharing until it is enabled
+    vec_env.counts[0].visit(1, 2, 3)
+    assert vec_env.counts[0].take_visits().shape == (0, 3)
+
+    enable_visit_sharing(vec_env)
+    vec_env.counts[0].visit(1, 2, 3)
+    vec_env.counts[1].visit(1, 2, 3)
+    vec_env.counts[2].visit(4, 5, 6)
+
+    share_visits(vec_env)
+
+    assert [counts.count(1, 2, 3) for counts in vec_env.counts] == [3, 2, 2]
+    for counts in vec_env.counts:
+        assert counts.count(4, 5, 6) == 1
+        assert counts.coverage == 2
+        assert counts.take_visits().shape == (0, 3)